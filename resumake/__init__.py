@@ -1,9 +1,52 @@
 """resumake — Build styled CV documents from a single YAML source."""
 
+from importlib import import_module
 from importlib.metadata import version as _get_version
 from typing import Annotated, Optional
 
 import typer
+from typer.core import TyperGroup
+
+# Subcommand name -> (module, function). Modules are imported only when the
+# command is dispatched (or when --help needs its docstring), so running a
+# single command doesn't pull in docx/yaml/LLM code for every other command.
+_LAZY_COMMANDS: dict[str, tuple[str, str]] = {
+    "build": (".build", "build"),
+    "tailor": (".tailor", "tailor"),
+    "bio": (".bio", "bio"),
+    "validate": (".validate_cmd", "validate"),
+    "init": (".init_cmd", "init"),
+    "themes": (".themes_cmd", "themes"),
+    "export": (".export_cmd", "export"),
+    "preview": (".preview_cmd", "preview"),
+    "diff": (".diff_cmd", "diff"),
+    "cover": (".cover_letter", "cover_letter"),
+    "import": (".import_cmd", "import_"),
+    "suggest": (".suggest_cmd", "suggest"),
+    "ats": (".ats_cmd", "ats"),
+    "web": (".web_cmd", "web"),
+}
+
+
+def _load_command(name: str):
+    """Import a subcommand's module and convert its function into a click command."""
+    module_name, attr = _LAZY_COMMANDS[name]
+    func = getattr(import_module(module_name, __name__), attr)
+    single = typer.Typer(add_completion=False)
+    single.command(name=name)(func)
+    return typer.main.get_command(single)
+
+
+class _LazyGroup(TyperGroup):
+    """Typer group that resolves subcommands on first lookup instead of at import time."""
+
+    def list_commands(self, ctx):
+        return list(_LAZY_COMMANDS)
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in _LAZY_COMMANDS:
+            self.commands[cmd_name] = _load_command(cmd_name)
+        return self.commands.get(cmd_name)
 
 
 def _version_callback(value: bool):
@@ -15,6 +58,7 @@ def _version_callback(value: bool):
 app = typer.Typer(
     name="resumake",
     help="Build styled CV documents from a single YAML source.",
+    cls=_LazyGroup,
     invoke_without_command=True,
     no_args_is_help=False,
 )
@@ -33,61 +77,3 @@ def default(
         from .build import build
 
         build()
-
-
-# Register commands
-from .build import build
-
-app.command()(build)
-
-from .tailor import tailor
-
-app.command()(tailor)
-
-from .bio import bio
-
-app.command()(bio)
-
-from .validate_cmd import validate
-
-app.command()(validate)
-
-from .init_cmd import init
-
-app.command()(init)
-
-from .themes_cmd import themes
-
-app.command()(themes)
-
-from .export_cmd import export
-
-app.command()(export)
-
-from .preview_cmd import preview
-
-app.command()(preview)
-
-from .diff_cmd import diff
-
-app.command()(diff)
-
-from .cover_letter import cover_letter
-
-app.command(name="cover")(cover_letter)
-
-from .import_cmd import import_
-
-app.command(name="import")(import_)
-
-from .suggest_cmd import suggest
-
-app.command()(suggest)
-
-from .ats_cmd import ats
-
-app.command()(ats)
-
-from .web_cmd import web
-
-app.command()(web)
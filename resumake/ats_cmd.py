@@ -1,14 +1,94 @@
 """ATS command — keyword match analysis between CV and a job description."""
 
 import json
+import re
 from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
-import yaml
+from rich.console import Group
+from rich.text import Text
 
 from .console import console, err_console
-from .utils import DEFAULT_YAML, load_cv
+from .llm import cached_block, strip_yaml_fences
+from .utils import DEFAULT_YAML, cv_yaml_cached, json_loads, load_cv
+
+_JSON_DECODER = json.JSONDecoder()
+# "score" is the first key we ask for, so it usually arrives within the first few chunks
+# The lookahead waits for the character after the number, so "8" of a split "87" is not taken
+_SCORE_RE = re.compile(r'"score"\s*:\s*(\d+)(?=\D)')
+# Characters carried over between chunks so a score split across them is still found
+_SCORE_OVERLAP = 64
+
+
+_ATS_INSTRUCTIONS = (
+    "Compare the following CV with the job description. Analyze keyword matching "
+    "for Applicant Tracking Systems (ATS). Return ONLY valid JSON with:\n"
+    '{"score": 0-100, '
+    '"matched_keywords": ["keyword1", "keyword2"], '
+    '"missing_keywords": ["keyword3", "keyword4"], '
+    '"suggestions": [{"keyword": "keyword", "where_to_add": "section name", '
+    '"phrasing": "suggested phrasing"}], '
+    '"summary": "brief summary of match quality"}'
+)
+
+
+def _ats_request(cv: dict, job_description: str) -> tuple[list[dict], str]:
+    """Build the (system blocks, user prompt) pair for an ATS analysis.
+
+    Instructions and CV form a stable prefix that providers can cache; only the job description varies.
+    """
+    system_blocks = [
+        {"type": "text", "text": _ATS_INSTRUCTIONS},
+        cached_block(f"CV:\n{cv_yaml_cached(cv)}"),
+    ]
+    return system_blocks, f"Job Description:\n{job_description}"
+
+
+def _parse_ats_json(response: str) -> dict | None:
+    """Parse the first JSON object in the LLM's answer, ignoring any prose around it. Returns None if unparseable."""
+    clean = strip_yaml_fences(response)
+    try:
+        # Usual case: the reply is exactly the object, so take the fast parser
+        result = json_loads(clean)
+    except ValueError:
+        start = clean.find("{")
+        if start < 0:
+            return None
+        try:
+            result, _end = _JSON_DECODER.raw_decode(clean, start)
+        except json.JSONDecodeError:
+            return None
+    return result if isinstance(result, dict) else None
+
+
+def _stream_ats_response(provider, prompt: str, system_blocks: list[dict]) -> str:
+    """Stream the analysis behind a live spinner that shows progress and the score once it arrives."""
+    from rich.live import Live
+    from rich.spinner import Spinner
+
+    stream = getattr(provider, "stream", None)
+    if stream is None:
+        with console.status("Analyzing ATS keyword match..."):
+            return provider.complete(prompt, max_tokens=4096, system_blocks=system_blocks)
+
+    chunks: list[str] = []
+    score = None
+    tail = ""
+    spinner = Spinner("dots", text="Analyzing ATS keyword match...")
+    with Live(spinner, console=console, transient=True, refresh_per_second=10):
+        for chunk in stream(prompt, max_tokens=4096, system_blocks=system_blocks):
+            chunks.append(chunk)
+            if score is None:
+                # Search only the new chunk plus the end of the previous text, not everything so far
+                tail = tail[-_SCORE_OVERLAP:] + chunk
+                if m := _SCORE_RE.search(tail):
+                    score = m.group(1)
+            status = f"Analyzing ATS keyword match... received {len(chunks)} chunks"
+            if score is not None:
+                status += f" — score {score}/100"
+            spinner.update(text=status)
+    return "".join(chunks)
 
 
 def analyze_ats_match(cv: dict, job_description: str) -> dict:
@@ -17,7 +97,8 @@ def analyze_ats_match(cv: dict, job_description: str) -> dict:
     Returns: {score: int, matched_keywords: [str], missing_keywords: [str],
               suggestions: [{keyword, where_to_add, phrasing}], summary: str}
     """
-    from .llm import get_provider, strip_yaml_fences
+    from . import llm_cache
+    from .llm import get_provider
 
     try:
         provider = get_provider()
@@ -26,34 +107,16 @@ def analyze_ats_match(cv: dict, job_description: str) -> dict:
         err_console.print("Set ANTHROPIC_API_KEY or OPENAI_API_KEY.")
         raise SystemExit(1)
 
-    cv_yaml = yaml.dump(cv, allow_unicode=True, default_flow_style=False, sort_keys=False)
-
-    with console.status("Analyzing ATS keyword match..."):
-        response = provider.complete(
-            "Compare the following CV with the job description. Analyze keyword matching "
-            "for Applicant Tracking Systems (ATS). Return ONLY valid JSON with:\n"
-            '{"score": 0-100, '
-            '"matched_keywords": ["keyword1", "keyword2"], '
-            '"missing_keywords": ["keyword3", "keyword4"], '
-            '"suggestions": [{"keyword": "keyword", "where_to_add": "section name", '
-            '"phrasing": "suggested phrasing"}], '
-            '"summary": "brief summary of match quality"}\n\n'
-            f"Job Description:\n{job_description}\n\n"
-            f"CV:\n{cv_yaml}",
-            max_tokens=4096,
-        )
-
-    clean = strip_yaml_fences(response).strip()
-    try:
-        return json.loads(clean)
-    except json.JSONDecodeError:
-        start = clean.find("{")
-        end = clean.rfind("}") + 1
-        if start >= 0 and end > start:
-            try:
-                return json.loads(clean[start:end])
-            except json.JSONDecodeError:
-                pass
+    system_blocks, prompt = _ats_request(cv, job_description)
+
+    cache_key = llm_cache.request_key(provider, prompt, 4096, system_blocks)
+    response = llm_cache.get(cache_key)
+    from_cache = response is not None
+    if not from_cache:
+        response = _stream_ats_response(provider, prompt, system_blocks)
+
+    result = _parse_ats_json(response)
+    if result is None:
         return {
             "score": 0,
             "matched_keywords": [],
@@ -61,6 +124,9 @@ def analyze_ats_match(cv: dict, job_description: str) -> dict:
             "suggestions": [],
             "summary": "Could not parse analysis. Try again.",
         }
+    if not from_cache:
+        llm_cache.put(cache_key, response)
+    return result
 
 
 def ats(
@@ -91,30 +157,28 @@ def ats(
     else:
         color = "red"
 
-    console.print(f"\n[bold]ATS Match Score:[/] [{color}]{score}/100[/]")
-    console.print()
+    # Assemble the report and emit it in one print instead of one write per line
+    lines = [f"\n[bold]ATS Match Score:[/] [{color}]{score}/100[/]", ""]
 
     matched = result.get("matched_keywords", [])
     if matched:
-        console.print(f"[bold green]Matched Keywords ({len(matched)}):[/]")
-        console.print(f"  {', '.join(matched)}")
-        console.print()
+        lines += [f"[bold green]Matched Keywords ({len(matched)}):[/]", f"  {', '.join(matched)}", ""]
 
     missing = result.get("missing_keywords", [])
     if missing:
-        console.print(f"[bold red]Missing Keywords ({len(missing)}):[/]")
-        console.print(f"  {', '.join(missing)}")
-        console.print()
+        lines += [f"[bold red]Missing Keywords ({len(missing)}):[/]", f"  {', '.join(missing)}", ""]
 
     suggestions = result.get("suggestions", [])
     if suggestions:
-        console.print(f"[bold]Suggestions ({len(suggestions)}):[/]")
+        lines.append(f"[bold]Suggestions ({len(suggestions)}):[/]")
         for s in suggestions:
-            console.print(f"  [cyan]{s.get('keyword', '')}[/] → {s.get('where_to_add', '')}")
+            lines.append(f"  [cyan]{s.get('keyword', '')}[/] → {s.get('where_to_add', '')}")
             if s.get("phrasing"):
-                console.print(f"    [dim]{s['phrasing']}[/]")
-        console.print()
+                lines.append(f"    [dim]{s['phrasing']}[/]")
+        lines.append("")
 
     summary = result.get("summary", "")
     if summary:
-        console.print(f"[dim]{summary}[/]")
+        lines.append(f"[dim]{summary}[/]")
+
+    console.print(Group(*(Text.from_markup(line) for line in lines)))
@@ -1,28 +1,18 @@
 """Bio command — generate a condensed one-pager bio."""
 
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, Optional
 
 import typer
 import yaml
-from docx import Document
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import parse_xml
-from docx.oxml.ns import nsdecls
-from docx.shared import Cm, Pt
 
 from .config import load_config, resolve
-from .docx_builder import (
-    add_hyperlink,
-    remove_table_borders,
-    set_cell_width,
-)
-from .theme import Theme, load_theme
-from .translate import translate_cv
 from .utils import (
     DEFAULT_YAML,
     OUTPUT_DIR,
+    YamlLoader,
     convert_to_pdf,
+    cv_yaml_cached,
     load_cv,
     open_file,
     parse_start_date,
@@ -30,60 +20,74 @@ from .utils import (
     slugify_name,
 )
 
+if TYPE_CHECKING:
+    from .theme import Theme
+
 
 def select_bio_content(cv: dict) -> dict:
     """Use an LLM to select and condense CV content for a one-pager bio."""
-    from .llm import get_provider, strip_yaml_fences
+    from . import llm_cache
+    from .llm import cached_block, get_provider, strip_yaml_fences
 
     provider = get_provider()
 
-    cv_yaml = yaml.dump(cv, allow_unicode=True, default_flow_style=False, sort_keys=False)
+    cv_yaml = cv_yaml_cached(cv)
+    instructions = (
+        "You are a professional CV consultant. Given a full CV in YAML, produce a condensed "
+        "one-pager bio version.\n\n"
+        "Return ONLY valid YAML with this exact structure — no explanation, no code fences:\n\n"
+        "name: <full name>\n"
+        "title: <professional title>\n"
+        "photo: <photo path from original>\n"
+        "contact:\n"
+        "  email: <email>\n"
+        "  phone: <phone>\n"
+        "  address: <city, country>\n"
+        "bio_summary: <3-4 sentences in third person summarizing the person's career, "
+        "expertise, and value proposition>\n"
+        "career_highlights:\n"
+        "  - <highlight 1>\n"
+        "  - <highlight 2>\n"
+        "  - <highlight 3>\n"
+        "  - <highlight 4>\n"
+        "  - <highlight 5>\n"
+        "current_roles:\n"
+        "  - title: <title>\n"
+        "    org: <org>\n"
+        "    period: <start — end>\n"
+        "  ...(2-3 most recent roles)\n"
+        "education:\n"
+        "  - <degree, institution>\n"
+        "  ...\n"
+        "skills_summary: <comma-separated list of 10-15 key skills>\n"
+        "links:\n"
+        "  - label: <label>\n"
+        "    url: <url>\n"
+        "  ...\n\n"
+        "Rules:\n"
+        "- Do NOT invent content. Only select and condense from the original CV.\n"
+        "- Career highlights should be the most impressive, quantifiable achievements.\n"
+        "- Current roles = 2-3 most recent experience entries.\n"
+        "- Skills summary = most important skills across all categories.\n"
+        "- Bio summary should be written in third person, professional tone."
+    )
+    system_blocks = [{"type": "text", "text": instructions}, cached_block(f"CV YAML:\n{cv_yaml}")]
+    prompt = "Produce the one-pager bio YAML for the CV above."
+
+    cache_key = llm_cache.request_key(provider, prompt, 4096, system_blocks)
+    response = llm_cache.get(cache_key)
+    if response is not None:
+        return yaml.load(strip_yaml_fences(response), Loader=YamlLoader)
 
     from .console import console
 
     with console.status("Generating bio content via LLM..."):
-        response = provider.complete(
-            "You are a professional CV consultant. Given a full CV in YAML, produce a condensed "
-            "one-pager bio version.\n\n"
-            "Return ONLY valid YAML with this exact structure — no explanation, no code fences:\n\n"
-            "name: <full name>\n"
-            "title: <professional title>\n"
-            "photo: <photo path from original>\n"
-            "contact:\n"
-            "  email: <email>\n"
-            "  phone: <phone>\n"
-            "  address: <city, country>\n"
-            "bio_summary: <3-4 sentences in third person summarizing the person's career, "
-            "expertise, and value proposition>\n"
-            "career_highlights:\n"
-            "  - <highlight 1>\n"
-            "  - <highlight 2>\n"
-            "  - <highlight 3>\n"
-            "  - <highlight 4>\n"
-            "  - <highlight 5>\n"
-            "current_roles:\n"
-            "  - title: <title>\n"
-            "    org: <org>\n"
-            "    period: <start — end>\n"
-            "  ...(2-3 most recent roles)\n"
-            "education:\n"
-            "  - <degree, institution>\n"
-            "  ...\n"
-            "skills_summary: <comma-separated list of 10-15 key skills>\n"
-            "links:\n"
-            "  - label: <label>\n"
-            "    url: <url>\n"
-            "  ...\n\n"
-            "Rules:\n"
-            "- Do NOT invent content. Only select and condense from the original CV.\n"
-            "- Career highlights should be the most impressive, quantifiable achievements.\n"
-            "- Current roles = 2-3 most recent experience entries.\n"
-            "- Skills summary = most important skills across all categories.\n"
-            "- Bio summary should be written in third person, professional tone.\n\n"
-            f"CV YAML:\n{cv_yaml}",
-        )
-
-    return yaml.safe_load(strip_yaml_fences(response))
+        response = provider.complete(prompt, system_blocks=system_blocks)
+
+    bio_data = yaml.load(strip_yaml_fences(response), Loader=YamlLoader)
+    if isinstance(bio_data, dict):
+        llm_cache.put(cache_key, response)
+    return bio_data
 
 
 def select_bio_content_deterministic(cv: dict) -> dict:
@@ -142,11 +146,45 @@ def select_bio_content_deterministic(cv: dict) -> dict:
     }
 
 
-def build_bio_docx(bio_data: dict, lang: str, theme: Theme | None = None) -> Path:
+def build_bio_docx(bio_data: dict, lang: str, theme: "Theme | None" = None) -> Path:
     """Build a single-column one-pager bio document."""
+    # python-docx (and lxml behind it) loads here, so importing this module for
+    # select_bio_content — e.g. from the web server — stays cheap
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+    from docx.shared import Cm, Pt
+
+    from .docx_builder import add_hyperlink, remove_table_borders, save_docx, set_cell_width
+    from .theme import load_theme
+
     t = theme or load_theme()
     doc = Document()
 
+    # Sizes, colors and fonts are reused for every run below — build them once
+    body_pt = Pt(t.sizes.body_pt)
+    body_pt_plus_1 = Pt(t.sizes.body_pt + 1)
+    small_pt = Pt(t.sizes.small_pt)
+    subh_pt_plus_1 = Pt(t.sizes.subheading_pt + 1)
+    primary_rgb = t.colors.primary_rgb
+    accent_rgb = t.colors.accent_rgb
+    body_rgb = t.colors.text_body_rgb
+    muted_rgb = t.colors.text_muted_rgb
+    font_h = t.fonts.heading
+    font_b = t.fonts.body
+
+    def _style(run, size, rgb, name, bold: bool = False, italic: bool = False):
+        font = run.font
+        font.size = size
+        font.color.rgb = rgb
+        font.name = name
+        if bold:
+            font.bold = True
+        if italic:
+            font.italic = True
+        return run
+
     # Page setup — wider margins for single column
     for section in doc.sections:
         section.top_margin = Cm(1.5)
@@ -156,9 +194,9 @@ def build_bio_docx(bio_data: dict, lang: str, theme: Theme | None = None) -> Pat
 
     # Normal style
     style = doc.styles["Normal"]
-    style.font.name = t.fonts.heading
-    style.font.size = Pt(t.sizes.body_pt)
-    style.font.color.rgb = t.colors.text_body_rgb
+    style.font.name = font_h
+    style.font.size = body_pt
+    style.font.color.rgb = body_rgb
     style.paragraph_format.space_after = Pt(0)
     style.paragraph_format.space_before = Pt(0)
 
@@ -187,18 +225,10 @@ def build_bio_docx(bio_data: dict, lang: str, theme: Theme | None = None) -> Pat
 
     # Name + title + contact in right cell
     p_name = right_cell.paragraphs[0]
-    run_name = p_name.add_run(bio_data["name"])
-    run_name.bold = True
-    run_name.font.size = Pt(t.sizes.name_pt + 5)
-    run_name.font.color.rgb = t.colors.primary_rgb
-    run_name.font.name = t.fonts.heading
+    _style(p_name.add_run(bio_data["name"]), Pt(t.sizes.name_pt + 5), primary_rgb, font_h, bold=True)
 
     p_title = right_cell.add_paragraph()
-    run_title = p_title.add_run(bio_data["title"])
-    run_title.font.size = Pt(t.sizes.subheading_pt + 1)
-    run_title.font.color.rgb = t.colors.accent_rgb
-    run_title.font.name = t.fonts.heading
-    run_title.italic = True
+    _style(p_title.add_run(bio_data["title"]), subh_pt_plus_1, accent_rgb, font_h, italic=True)
     p_title.paragraph_format.space_after = Pt(6)
 
     # Contact line
@@ -206,10 +236,7 @@ def build_bio_docx(bio_data: dict, lang: str, theme: Theme | None = None) -> Pat
     contact_parts = [v for v in [contact.get("email"), contact.get("phone"), contact.get("address")] if v]
     if contact_parts:
         p_contact = right_cell.add_paragraph()
-        run_c = p_contact.add_run("  |  ".join(contact_parts))
-        run_c.font.size = Pt(t.sizes.small_pt)
-        run_c.font.color.rgb = t.colors.text_muted_rgb
-        run_c.font.name = t.fonts.heading
+        _style(p_contact.add_run("  |  ".join(contact_parts)), small_pt, muted_rgb, font_h)
 
     # Links
     links = bio_data.get("links", [])
@@ -217,24 +244,18 @@ def build_bio_docx(bio_data: dict, lang: str, theme: Theme | None = None) -> Pat
         p_links = right_cell.add_paragraph()
         for i, link in enumerate(links):
             if i > 0:
-                sep = p_links.add_run("  |  ")
-                sep.font.size = Pt(t.sizes.small_pt)
-                sep.font.color.rgb = t.colors.text_muted_rgb
-                sep.font.name = t.fonts.heading
+                _style(p_links.add_run("  |  "), small_pt, muted_rgb, font_h)
             if link.get("url"):
                 add_hyperlink(
                     p_links,
                     link["url"],
                     link["label"],
-                    color=t.colors.accent_rgb,
-                    size=Pt(t.sizes.small_pt),
-                    font_name=t.fonts.heading,
+                    color=accent_rgb,
+                    size=small_pt,
+                    font_name=font_h,
                 )
             else:
-                run_l = p_links.add_run(link["label"])
-                run_l.font.size = Pt(t.sizes.small_pt)
-                run_l.font.color.rgb = t.colors.accent_rgb
-                run_l.font.name = t.fonts.heading
+                _style(p_links.add_run(link["label"]), small_pt, accent_rgb, font_h)
 
     # ── Horizontal divider ──
     p_div = doc.add_paragraph()
@@ -247,86 +268,70 @@ def build_bio_docx(bio_data: dict, lang: str, theme: Theme | None = None) -> Pat
     pPr.append(pBdr)
 
     # ── Bio summary ──
+    section_space_before = Pt(10)
+    section_space_after = Pt(4)
+
     def add_section_title(title: str):
         p = doc.add_paragraph()
-        p.paragraph_format.space_before = Pt(10)
-        p.paragraph_format.space_after = Pt(4)
-        run = p.add_run(title)
-        run.bold = True
-        run.font.size = Pt(t.sizes.subheading_pt + 1)
-        run.font.color.rgb = t.colors.primary_rgb
-        run.font.name = t.fonts.heading
+        p.paragraph_format.space_before = section_space_before
+        p.paragraph_format.space_after = section_space_after
+        _style(p.add_run(title), subh_pt_plus_1, primary_rgb, font_h, bold=True)
 
     add_section_title("Professional Summary")
     p_bio = doc.add_paragraph()
-    run_bio = p_bio.add_run(bio_data.get("bio_summary", ""))
-    run_bio.font.size = Pt(t.sizes.body_pt + 1)
-    run_bio.font.color.rgb = t.colors.text_body_rgb
-    run_bio.font.name = t.fonts.body
+    _style(p_bio.add_run(bio_data.get("bio_summary", "")), body_pt_plus_1, body_rgb, font_b)
     p_bio.paragraph_format.space_after = Pt(6)
 
     # ── Career highlights ──
     highlights = bio_data.get("career_highlights", [])
     if highlights:
         add_section_title("Key Achievements")
+        bullet_space = Pt(1)
         for h in highlights:
             p = doc.add_paragraph(style="List Bullet")
-            p.paragraph_format.space_before = Pt(1)
-            p.paragraph_format.space_after = Pt(1)
+            p.paragraph_format.space_before = bullet_space
+            p.paragraph_format.space_after = bullet_space
             p.text = ""
-            run = p.add_run(h)
-            run.font.size = Pt(t.sizes.body_pt)
-            run.font.color.rgb = t.colors.text_body_rgb
-            run.font.name = t.fonts.body
+            _style(p.add_run(h), body_pt, body_rgb, font_b)
 
     # ── Current roles ──
     roles = bio_data.get("current_roles", [])
     if roles:
         add_section_title("Recent Experience")
+        role_space_before = Pt(4)
+        role_space_after = Pt(1)
         for role in roles:
             p_role = doc.add_paragraph()
-            p_role.paragraph_format.space_before = Pt(4)
-            p_role.paragraph_format.space_after = Pt(1)
-            run_t = p_role.add_run(f"{role['title']} — {role.get('org', '')}")
-            run_t.bold = True
-            run_t.font.size = Pt(t.sizes.body_pt)
-            run_t.font.color.rgb = t.colors.primary_rgb
-            run_t.font.name = t.fonts.heading
+            p_role.paragraph_format.space_before = role_space_before
+            p_role.paragraph_format.space_after = role_space_after
+            _style(p_role.add_run(f"{role['title']} — {role.get('org', '')}"), body_pt, primary_rgb, font_h, bold=True)
 
             p_period = doc.add_paragraph()
-            run_p = p_period.add_run(role.get("period", ""))
-            run_p.font.size = Pt(t.sizes.small_pt)
-            run_p.font.color.rgb = t.colors.text_muted_rgb
-            run_p.font.name = t.fonts.heading
+            _style(p_period.add_run(role.get("period", "")), small_pt, muted_rgb, font_h)
 
     # ── Education ──
     education = bio_data.get("education", [])
     if education:
         add_section_title("Education")
+        edu_space_after = Pt(2)
         for edu in education:
             p_edu = doc.add_paragraph()
-            p_edu.paragraph_format.space_after = Pt(2)
+            p_edu.paragraph_format.space_after = edu_space_after
             edu_text = edu if isinstance(edu, str) else f"{edu.get('degree', '')}, {edu.get('institution', '')}"
-            run_edu = p_edu.add_run(edu_text)
-            run_edu.font.size = Pt(t.sizes.body_pt)
-            run_edu.font.color.rgb = t.colors.text_body_rgb
-            run_edu.font.name = t.fonts.heading
+            _style(p_edu.add_run(edu_text), body_pt, body_rgb, font_h)
 
     # ── Skills summary ──
     skills_summary = bio_data.get("skills_summary", "")
     if skills_summary:
         add_section_title("Core Competencies")
         p_skills = doc.add_paragraph()
-        run_skills = p_skills.add_run(skills_summary)
-        run_skills.font.size = Pt(t.sizes.body_pt)
-        run_skills.font.color.rgb = t.colors.text_body_rgb
-        run_skills.font.name = t.fonts.body
+        _style(p_skills.add_run(skills_summary), body_pt, body_rgb, font_b)
 
     # Save
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     filename = f"{slugify_name(bio_data['name'])}_Bio_{lang.upper()}.docx"
     output_path = OUTPUT_DIR / filename
-    doc.save(str(output_path))
+    save_docx(doc, output_path)
     return output_path
 
 
@@ -348,9 +353,11 @@ def bio(
     open = resolve(open, cfg.open, True)
     theme = resolve(theme, cfg.theme, None)
 
-    cv_en = load_cv(source)
-
     from .console import console
+    from .theme import load_theme
+    from .translate import translate_cv
+
+    cv_en = load_cv(source)
 
     # Try LLM, fall back to deterministic
     try:
@@ -1,6 +1,9 @@
 """Build command — generate full CV documents from YAML source."""
 
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Annotated, Optional
 
@@ -16,6 +19,23 @@ from .theme import load_theme
 from .translate import translate_cv
 from .utils import DEFAULT_YAML, load_cv, open_file
 
+# Quiet period after the last file event before a watch-mode rebuild starts
+WATCH_DEBOUNCE_SECONDS = 0.25
+
+# Upper bound on languages rendered concurrently (each may hold an in-flight LLM request)
+MAX_BUILD_WORKERS = 4
+
+
+_SIZE_UNITS = ((1 << 30, "GB"), (1 << 20, "MB"), (1 << 10, "KB"))
+
+
+def _humanize(size: int) -> str:
+    """Format a byte count as B/KB/MB/GB with one decimal."""
+    for factor, unit in _SIZE_UNITS:
+        if size > factor:
+            return f"{size / factor:.1f} {unit}"
+    return f"{size} B"
+
 
 def _print_summary(outputs: list[Path]):
     """Print a Rich summary table of generated files."""
@@ -23,14 +43,7 @@ def _print_summary(outputs: list[Path]):
     table.add_column("File", style="cyan")
     table.add_column("Size", justify="right", style="green")
     for p in outputs:
-        size = p.stat().st_size
-        if size > 1024 * 1024:
-            size_str = f"{size / (1024 * 1024):.1f} MB"
-        elif size > 1024:
-            size_str = f"{size / 1024:.1f} KB"
-        else:
-            size_str = f"{size} B"
-        table.add_row(p.name, size_str)
+        table.add_row(p.name, _humanize(os.stat(p, follow_symlinks=False).st_size))
     console.print(table)
 
 
@@ -54,7 +67,7 @@ def build(
     open: Annotated[Optional[bool], typer.Option("--open/--no-open", help="Open the generated files.")] = None,
     pdf_engine: Annotated[
         Optional[str],
-        typer.Option("--pdf-engine", help="PDF engine: weasyprint, docx2pdf, or auto (default)."),
+        typer.Option("--pdf-engine", help="PDF engine: weasyprint, docx2pdf, unoserver, or auto (default)."),
     ] = None,
 ):
     """Build full CV documents from YAML source."""
@@ -71,18 +84,29 @@ def build(
     resolved_theme = load_theme(theme)
 
     def do_build():
+        # The watch handler only rebuilds after the mtime advances, and load_cv reuses its parse cache
         cv_en = load_cv(source)
-        outputs = []
-        for target_lang in langs:
+
+        # Translation is dominated by LLM latency, so languages are rendered in parallel.
+        # resolved_theme is shared read-only; build_docx never mutates it.
+        def render_one(target_lang: str) -> tuple[Path, str | None]:
             cv = cv_en
             if target_lang != "en":
                 cv = translate_cv(cv_en, lang=target_lang, retranslate=not cache)
             output_path = build_docx(cv, target_lang, theme=resolved_theme)
+            return output_path, build_html(cv, target_lang, theme=resolved_theme) if pdf else None
+
+        with ThreadPoolExecutor(max_workers=min(len(langs), MAX_BUILD_WORKERS)) as executor:
+            # map() yields in input order, so outputs keep the --lang ordering
+            rendered = list(executor.map(render_one, langs))
+
+        # PDFs are converted one at a time on this thread: the DOCX engines drive a single Word or
+        # LibreOffice instance, and Word's COM automation doesn't work from pool threads
+        outputs = []
+        for output_path, html_content in rendered:
             outputs.append(output_path)
             if pdf:
-                html_content = build_html(cv, target_lang, theme=resolved_theme)
-                pdf_path = convert_to_pdf_auto(output_path, engine=pdf_engine, html_content=html_content)
-                outputs.append(pdf_path)
+                outputs.append(convert_to_pdf_auto(output_path, engine=pdf_engine, html_content=html_content))
         return outputs
 
     # Initial build
@@ -94,32 +118,57 @@ def build(
 
     if watch:
         try:
-            from watchdog.events import FileSystemEventHandler
+            from watchdog.events import PatternMatchingEventHandler
             from watchdog.observers import Observer
         except ImportError:
             err_console.print("[red]Error:[/] 'watchdog' package required for --watch.")
             err_console.print("Install with: [bold]uv tool install resumakeai --with watchdog[/]")
             raise typer.Exit(1)
 
-        class RebuildHandler(FileSystemEventHandler):
+        class RebuildHandler(PatternMatchingEventHandler):
+            """Coalesce a burst of save events into one rebuild, skipped if the mtime didn't advance."""
+
             def __init__(self):
-                self._last_build = 0
+                # Only events for the source file reach Python handlers; editor temp files are filtered out
+                super().__init__(patterns=[source.name], ignore_directories=True)
+                self._timer: threading.Timer | None = None
+                self._timer_lock = threading.Lock()
+                self._build_lock = threading.Lock()
+                self._last_mtime = source.stat().st_mtime_ns
 
             def on_modified(self, event):
-                if event.is_directory:
-                    return
-                if Path(event.src_path).resolve() != source.resolve():
-                    return
-                now = time.time()
-                if now - self._last_build < 1:
-                    return
-                self._last_build = now
-                console.print(f"\n[dim]--- {source.name} changed, rebuilding... ---[/]")
-                try:
-                    outs = do_build()
-                    _print_summary(outs)
-                except Exception as e:
-                    err_console.print(f"[red]Build error:[/] {e}")
+                self._schedule()
+
+            def on_created(self, event):
+                self._schedule()
+
+            def on_moved(self, event):
+                # Editors like vim save by writing a temp file and renaming it over the original
+                self._schedule()
+
+            def _schedule(self):
+                with self._timer_lock:
+                    if self._timer is not None:
+                        self._timer.cancel()
+                    self._timer = threading.Timer(WATCH_DEBOUNCE_SECONDS, self._fire)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+            def _fire(self):
+                with self._build_lock:
+                    try:
+                        mtime = source.stat().st_mtime_ns
+                    except OSError:
+                        return  # Mid-replace — the event that completes the save reschedules us
+                    if mtime == self._last_mtime:
+                        return
+                    self._last_mtime = mtime
+                    console.print(f"\n[dim]--- {source.name} changed, rebuilding... ---[/]")
+                    try:
+                        outs = do_build()
+                        _print_summary(outs)
+                    except Exception as e:
+                        err_console.print(f"[red]Build error:[/] {e}")
 
         observer = Observer()
         observer.schedule(RebuildHandler(), str(source.parent), recursive=False)
@@ -1,11 +1,14 @@
 """Configuration file support for resumake (.resumakerc.yaml)."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+from .utils import YamlLoader
+
 CONFIG_FILENAME = ".resumakerc.yaml"
 
 VALID_KEYS = {"lang", "theme", "pdf", "open", "source", "watch", "pdf_engine"}
@@ -30,7 +33,7 @@ def _load_yaml_config(path: Path) -> dict:
         return {}
     try:
         with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YamlLoader)
         if not isinstance(data, dict):
             return {}
         return {k: v for k, v in data.items() if k in VALID_KEYS}
@@ -38,22 +41,36 @@ def _load_yaml_config(path: Path) -> dict:
         return {}
 
 
+def _stat_key(path: Path) -> tuple[str, int | None, int | None]:
+    """Identify a config file's current version by path, mtime and size (None if missing)."""
+    try:
+        st = path.stat()
+    except OSError:
+        return (str(path), None, None)
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(home_key: tuple, project_key: tuple) -> ResumakeConfig:
+    merged = {}
+    merged.update(_load_yaml_config(Path(home_key[0])))
+    merged.update(_load_yaml_config(Path(project_key[0])))
+    return ResumakeConfig(**{k: v for k, v in merged.items() if k in VALID_KEYS})
+
+
 def load_config() -> ResumakeConfig:
     """Load and merge config from .resumakerc.yaml files.
 
     Resolution order (later overrides earlier):
     1. ~/.resumakerc.yaml  (user-level defaults)
     2. ./.resumakerc.yaml  (project-level overrides)
-    """
-    merged = {}
 
+    Parsed results are memoized on each file's path, mtime and size, so repeated
+    calls (e.g. watch-mode rebuilds) only stat the files while they are unchanged.
+    """
     home_config = Path.home() / CONFIG_FILENAME
-    merged.update(_load_yaml_config(home_config))
-
     project_config = Path.cwd() / CONFIG_FILENAME
-    merged.update(_load_yaml_config(project_config))
-
-    return ResumakeConfig(**{k: v for k, v in merged.items() if k in VALID_KEYS})
+    return replace(_load_config_cached(_stat_key(home_config), _stat_key(project_config)))
 
 
 def resolve(cli_value, config_value, default):
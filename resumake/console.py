@@ -1,6 +1,53 @@
-"""Shared Rich console for consistent styled output."""
+"""Shared Rich console for consistent styled output.
 
-from rich.console import Console
+The consoles are created on first access (PEP 562) so importing this module
+doesn't pay for Rich's import and terminal detection on paths that never print.
+"""
 
-console = Console()
-err_console = Console(stderr=True)
+import sys
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    console: Console
+    err_console: Console
+
+_FACTORIES = {
+    "console": {},
+    "err_console": {"stderr": True},
+}
+
+
+def __getattr__(name: str):
+    if name not in _FACTORIES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from rich.console import Console
+
+    instance = Console(**_FACTORIES[name])
+    globals()[name] = instance
+    return instance
+
+
+_status_lock = threading.Lock()
+
+
+@contextmanager
+def status(message: str):
+    """Like ``console.status()``, but safe to use from several threads at once.
+
+    Rich allows a single live display per console, so when another spinner is
+    already running the message is printed as a plain line instead.
+    """
+    out = sys.modules[__name__].console
+    if not _status_lock.acquire(blocking=False):
+        out.print(f"[dim]{message}[/]")
+        yield
+        return
+    try:
+        with out.status(message):
+            yield
+    finally:
+        _status_lock.release()
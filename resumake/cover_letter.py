@@ -1,56 +1,210 @@
 """Cover letter command — generate a cover letter for a job description."""
 
+import json
+import re
+from functools import lru_cache
+from html import escape
+from io import BytesIO
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, Optional
 
 import typer
-import yaml
-from docx import Document
-from docx.shared import Cm, Pt
+from pydantic import BaseModel, ValidationError
 
 from .config import load_config, resolve
-from .console import console, err_console
-from .llm import get_provider, strip_yaml_fences
-from .theme import Theme, load_theme
-from .utils import DEFAULT_YAML, OUTPUT_DIR, convert_to_pdf, load_cv, open_file, slugify_name
+from .console import console, err_console, status
+from .llm import cached_block, get_provider
+from .pdf import convert_to_pdf_auto
+from .utils import (
+    DEFAULT_YAML,
+    OUTPUT_DIR,
+    escape_html,
+    json_dumps,
+    json_loads,
+    load_cv,
+    open_file,
+    slugify,
+    slugify_name,
+)
 
+if TYPE_CHECKING:
+    from .theme import Theme
+
+
+class CoverLetterOutput(BaseModel):
+    """The letter fields the LLM must return."""
+
+    recipient: str = "Hiring Manager"
+    subject: str = ""
+    opening: str
+    body: str
+    closing: str
+
+
+_COVER_LETTER_INSTRUCTIONS = (
+    "You are a professional career consultant. Write a compelling cover letter matching the CV "
+    "(JSON) to the job description in the user message.\n"
+    "Return ONLY a JSON object with these string keys — no explanation, no code fences:\n"
+    '{"recipient": "company name or Hiring Manager", "subject": "subject line", '
+    '"opening": "why you are writing and the role", "body": "1-2 paragraphs connecting your experience '
+    'to the requirements", "closing": "call to action, availability, enthusiasm"}\n'
+    "Rules: first person, professional but personable; cite specific CV achievements that match the job; "
+    "never invent experience or skills; at most one page; no sender address or date."
+)
+
+# Sub-fields of each section that matter for a cover letter; everything else (photo, contact,
+# links, testimonials, references, custom sections...) is dropped from the prompt
+_COVER_CV_FIELDS = {
+    "experience": ("title", "org", "start", "end", "description", "bullets"),
+    "education": ("degree", "institution"),
+    "certifications": ("name",),
+}
+
+
+def _prune_cv_for_prompt(cv: dict) -> dict:
+    """Keep only the CV content a cover letter draws on."""
+    pruned = {k: cv[k] for k in ("name", "title", "profile", "skills") if cv.get(k)}
+    for section, fields in _COVER_CV_FIELDS.items():
+        items = [
+            {f: item[f] for f in fields if item.get(f)} for item in cv.get(section) or [] if isinstance(item, dict)
+        ]
+        if items:
+            pruned[section] = items
+    return pruned
+
+
+# Job descriptions longer than this (~1500 tokens at ~4 characters per token) are distilled
+MAX_DESCRIPTION_CHARS = 6000
+# A heading line: markdown "#", or a short line ending in ":"
+_HEADING_RE = re.compile(r"^\s*(?:#{1,6}\s*\S.{0,80}|[^\s.!?][^.!?]{0,80}:)\s*$")
+_SALIENT_HEADING_RE = re.compile(
+    r"(?i)requirement|responsibilit|qualification|must.have|nice.to.have|skills|your profile|"
+    r"what you.{0,10}(?:do|bring|need)|about the role|the role|your tasks"
+)
+
+
+_WORD_RE = re.compile(r"\w+")
+# python-docx's add_run() turns each "\n" and each "\r" into a <w:br/> (so "\r\n" gives two)
+_LINE_BREAK_RE = re.compile(r"[\r\n]")
+
+
+def _distill_description(text: str, max_chars: int = MAX_DESCRIPTION_CHARS) -> str:
+    """Shorten a long job description to the parts a cover letter needs.
+
+    Keeps the opening paragraph (company and role) plus the sections under headings like
+    Requirements or Responsibilities, then caps the result at max_chars on a line boundary.
+    Descriptions already within the budget are returned unchanged.
+    """
+    if len(text) <= max_chars:
+        return text
+    intro, _, rest = text.partition("\n\n")
+    kept = [intro.strip()]
+    keep_section = False
+    for line in rest.splitlines():
+        if _HEADING_RE.match(line):
+            keep_section = bool(_SALIENT_HEADING_RE.search(line))
+        if keep_section and line.strip():
+            kept.append(line.rstrip())
+    if len(kept) == 1:
+        kept = [line.rstrip() for line in text.splitlines() if line.strip()]  # no recognisable headings
+
+    out: list[str] = []
+    size = 0
+    for line in kept:
+        size += len(line) + 1
+        if size > max_chars:
+            break
+        out.append(line)
+    return "\n".join(out) if out else text[:max_chars]
+
+
+def _parse_cover_letter(response: str) -> dict:
+    """Validate the LLM's JSON answer against CoverLetterOutput. Raises ValueError if it doesn't fit."""
+    clean = response.strip()
+    try:
+        data = json_loads(clean)
+    except ValueError:
+        # Tolerate prose or fences around the object
+        start = clean.find("{")
+        if start < 0:
+            raise ValueError("LLM response did not contain a JSON cover letter.")
+        data, _end = json.JSONDecoder().raw_decode(clean, start)
+    try:
+        return CoverLetterOutput.model_validate(data).model_dump()
+    except ValidationError as e:
+        raise ValueError(f"LLM returned an incomplete cover letter: {e}") from e
+
+
+def _letter_fits(letter: dict, cached_description: str, description: str) -> bool:
+    """Whether a letter written for cached_description can be reused for a near-identical description.
+
+    Near-duplicates often differ only in the employer or role, so the letter is rejected if its
+    recipient isn't named in the new description, or if it uses a word the new description dropped.
+    """
+    recipient = letter.get("recipient") or ""
+    if recipient != "Hiring Manager" and recipient.lower() not in description.lower():
+        return False
+    dropped = set(_WORD_RE.findall(cached_description.lower())) - set(_WORD_RE.findall(description.lower()))
+    letter_text = " ".join(str(value) for value in letter.values() if value).lower()
+    return not dropped.intersection(_WORD_RE.findall(letter_text))
+
+
+def _generate_cover_letter(cv: dict, description_text: str, lang: str = "en", use_cache: bool = True) -> dict:
+    """Use an LLM to generate a cover letter matching the CV to a job description.
+
+    Responses are cached per CV, language and model: an identical request is answered from the
+    cache, and so is a near-duplicate job description if the cached letter still fits it.
+    """
+    from . import llm_cache
 
-def _generate_cover_letter(cv: dict, description_text: str, lang: str = "en") -> dict:
-    """Use an LLM to generate a cover letter matching the CV to a job description."""
     provider = get_provider()
-    cv_yaml = yaml.dump(cv, allow_unicode=True, default_flow_style=False, sort_keys=False)
-
-    lang_instruction = f"Write the cover letter in {lang.upper()}. " if lang != "en" else ""
-
-    with console.status("Generating cover letter via LLM..."):
-        response = provider.complete(
-            "You are a professional career consultant. Given a CV in YAML format and a job description, "
-            f"write a compelling cover letter. {lang_instruction}\n\n"
-            "Return ONLY valid YAML with this exact structure — no explanation, no code fences:\n\n"
-            "recipient: <company name or 'Hiring Manager'>\n"
-            "subject: <subject line for the letter>\n"
-            "opening: <opening paragraph — why you're writing and the role you're applying for>\n"
-            "body: <1-2 paragraphs connecting your experience to the role requirements>\n"
-            "closing: <closing paragraph — call to action, availability, enthusiasm>\n\n"
-            "Rules:\n"
-            "- Write in first person, professional but personable tone.\n"
-            "- Reference specific achievements from the CV that match the job requirements.\n"
-            "- Do NOT invent experience or skills not in the CV.\n"
-            "- Keep it concise — no more than one page when formatted.\n"
-            "- Do not include the sender's address or date — those will be added from CV data.\n\n"
-            f"JOB DESCRIPTION:\n{description_text}\n\n"
-            f"CV YAML:\n{cv_yaml}",
-            max_tokens=2048,
-        )
-
-    return yaml.safe_load(strip_yaml_fences(response))
-
-
-def _build_cover_letter_docx(cv: dict, letter: dict, lang: str, theme: Theme) -> Path:
-    """Build a cover letter Word document."""
-    t = theme
-    doc = Document()
+    cv_json = json_dumps(_prune_cv_for_prompt(cv))
+    # Instructions + CV are a stable, cacheable prefix; only the job (and language) vary
+    system_blocks = [
+        {"type": "text", "text": _COVER_LETTER_INSTRUCTIONS},
+        cached_block(f"CV:\n{cv_json}"),
+    ]
+    lang_instruction = f"Write the cover letter in {lang.upper()}.\n\n" if lang != "en" else ""
+    prompt = f"{lang_instruction}Job description:\n{_distill_description(description_text)}"
+
+    cache_key = llm_cache.request_key(provider, prompt, 2048, system_blocks)
+    # Near-duplicate descriptions are only comparable for the same CV, language and model
+    namespace = llm_cache.make_key("cover", type(provider).__name__, getattr(provider, "model", ""), lang, cv_json)
+    if use_cache:
+        response = llm_cache.get(cache_key)
+        if response is not None:
+            console.print("[dim]Using cached cover letter.[/]")
+            return _parse_cover_letter(response)
+        similar = llm_cache.find_similar(namespace, description_text)
+        if similar is not None:
+            cached_description, response = similar
+            try:
+                letter = _parse_cover_letter(response)
+            except ValueError:
+                letter = None
+            if letter is not None and _letter_fits(letter, cached_description, description_text):
+                console.print("[dim]Using cached cover letter from a near-identical job description.[/]")
+                return letter
+
+    with status("Generating cover letter via LLM..."):
+        response = provider.complete(prompt, max_tokens=2048, system_blocks=system_blocks)
+
+    letter = _parse_cover_letter(response)
+    llm_cache.put(cache_key, response)
+    llm_cache.remember_similar(namespace, description_text, cache_key)
+    return letter
+
 
+@lru_cache(maxsize=8)
+def _cover_letter_template(body_font: str) -> bytes:
+    """Saved bytes of an empty letter with page margins and the Normal style set up for a body font.
+
+    Each letter is opened from these bytes instead of repeating the setup on a fresh Document().
+    """
+    from docx import Document
+    from docx.shared import Cm, Pt
+
+    doc = Document()
     for section in doc.sections:
         section.top_margin = Cm(2.5)
         section.bottom_margin = Cm(2.5)
@@ -58,11 +212,78 @@ def _build_cover_letter_docx(cv: dict, letter: dict, lang: str, theme: Theme) ->
         section.right_margin = Cm(2.5)
 
     style = doc.styles["Normal"]
-    style.font.name = t.fonts.body
+    style.font.name = body_font
     style.font.size = Pt(11)
     style.paragraph_format.space_after = Pt(0)
     style.paragraph_format.space_before = Pt(0)
 
+    buf = BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def _run_props(font: str, size: int, color: str | None = None, bold: bool = False) -> str:
+    """A ``<w:rPr>`` element for a font, point size, hex colour and weight."""
+    props = f'<w:rFonts w:ascii="{escape(font)}" w:hAnsi="{escape(font)}"/>'
+    if bold:
+        props += "<w:b/>"
+    if color:
+        props += f'<w:color w:val="{color.lstrip("#").upper()}"/>'
+    props += f'<w:sz w:val="{size * 2}"/>'
+    return f"<w:rPr>{props}</w:rPr>"
+
+
+def _run_xml(text: str, props: str) -> str:
+    """A ``<w:r>`` element for text; line breaks become ``<w:br/>`` and tabs ``<w:tab/>`` as with add_run()."""
+    content = []
+    for i, line in enumerate(_LINE_BREAK_RE.split(text)):
+        if i:
+            content.append("<w:br/>")
+        for j, chunk in enumerate(line.split("\t")):
+            if j:
+                content.append("<w:tab/>")
+            if chunk:
+                space = ' xml:space="preserve"' if chunk != chunk.strip() else ""
+                content.append(f"<w:t{space}>{escape(chunk, quote=False)}</w:t>")
+    return f"<w:r>{props}{''.join(content)}</w:r>"
+
+
+def _para_xml(run: str = "", space_after: int | None = None, line_spacing: float | None = None) -> str:
+    """A ``<w:p>`` element; space_after is in points, line_spacing a multiple of single spacing."""
+    spacing = ""
+    if space_after is not None:
+        spacing += f' w:after="{space_after * 20}"'
+    if line_spacing is not None:
+        spacing += f' w:line="{round(line_spacing * 240)}" w:lineRule="auto"'
+    props = f"<w:pPr><w:spacing{spacing}/></w:pPr>" if spacing else ""
+    return f"<w:p>{props}{run}</w:p>"
+
+
+def _build_cover_letter_docx(cv: dict, letter: dict, lang: str, theme: "Theme", slug: str | None = None) -> Path:
+    """Build a cover letter Word document. A slug (e.g. from the job file name) is appended to the filename.
+
+    The paragraphs are written as one OXML fragment and parsed in a single pass rather than
+    going through add_paragraph()/add_run() for each line.
+    """
+    from docx import Document
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+
+    from .docx_builder import save_docx
+
+    body_font = theme.fonts.body
+    heading_font = theme.fonts.heading
+    colors = theme.colors
+    # The letter uses five run styles; build each <w:rPr> once
+    sender_props = _run_props(heading_font, 10, colors.text_muted)
+    plain_props = _run_props(body_font, 11)
+    text_props = _run_props(body_font, 11, colors.text_body)
+    recipient_props = _run_props(body_font, 11, bold=True)
+    emphasis_props = _run_props(heading_font, 11, colors.primary, bold=True)
+
+    doc = Document(BytesIO(_cover_letter_template(body_font)))
+    paras: list[str] = []
+
     # Sender info
     contact = cv.get("contact", {})
     sender_lines = [cv["name"]]
@@ -74,69 +295,83 @@ def _build_cover_letter_docx(cv: dict, letter: dict, lang: str, theme: Theme) ->
         sender_lines.append(contact["phone"])
 
     for line in sender_lines:
-        p = doc.add_paragraph()
-        run = p.add_run(line)
-        run.font.size = Pt(10)
-        run.font.color.rgb = t.colors.text_muted_rgb
-        run.font.name = t.fonts.heading
-        p.paragraph_format.space_after = Pt(1)
+        paras.append(_para_xml(_run_xml(line, sender_props), space_after=1))
 
     # Spacing
-    doc.add_paragraph().paragraph_format.space_after = Pt(12)
+    paras.append(_para_xml(space_after=12))
 
     # Recipient
     recipient = letter.get("recipient", "Hiring Manager")
-    p = doc.add_paragraph()
-    run = p.add_run(f"Dear {recipient},")
-    run.font.size = Pt(11)
-    run.font.name = t.fonts.body
-    run.bold = True
-    p.paragraph_format.space_after = Pt(12)
+    paras.append(_para_xml(_run_xml(f"Dear {recipient},", recipient_props), space_after=12))
 
     # Subject line
     if letter.get("subject"):
-        p = doc.add_paragraph()
-        run = p.add_run(f"Re: {letter['subject']}")
-        run.font.size = Pt(11)
-        run.font.name = t.fonts.heading
-        run.bold = True
-        run.font.color.rgb = t.colors.primary_rgb
-        p.paragraph_format.space_after = Pt(12)
+        paras.append(_para_xml(_run_xml(f"Re: {letter['subject']}", emphasis_props), space_after=12))
 
     # Body paragraphs
     for key in ("opening", "body", "closing"):
         text = letter.get(key, "")
         if text:
-            p = doc.add_paragraph()
-            run = p.add_run(text)
-            run.font.size = Pt(11)
-            run.font.name = t.fonts.body
-            run.font.color.rgb = t.colors.text_body_rgb
-            p.paragraph_format.space_after = Pt(10)
-            p.paragraph_format.line_spacing = 1.15
+            paras.append(_para_xml(_run_xml(text, text_props), space_after=10, line_spacing=1.15))
 
     # Sign-off
-    doc.add_paragraph().paragraph_format.space_after = Pt(6)
-    p = doc.add_paragraph()
-    run = p.add_run("Sincerely,")
-    run.font.size = Pt(11)
-    run.font.name = t.fonts.body
-    p.paragraph_format.space_after = Pt(4)
-
-    p = doc.add_paragraph()
-    run = p.add_run(cv["name"])
-    run.font.size = Pt(11)
-    run.font.name = t.fonts.heading
-    run.bold = True
-    run.font.color.rgb = t.colors.primary_rgb
+    paras.append(_para_xml(space_after=6))
+    paras.append(_para_xml(_run_xml("Sincerely,", plain_props), space_after=4))
+    paras.append(_para_xml(_run_xml(cv["name"], emphasis_props)))
+
+    fragment = parse_xml(f"<w:body {nsdecls('w')}>{''.join(paras)}</w:body>")
+    sect_pr = doc.element.body.sectPr
+    for p in list(fragment):
+        sect_pr.addprevious(p)
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    filename = f"{slugify_name(cv['name'])}_Cover_Letter_{lang.upper()}.docx"
+    filename = f"{slugify_name(cv['name'])}_Cover_Letter_{lang.upper()}"
+    filename += f"_{slug}.docx" if slug else ".docx"
     output_path = OUTPUT_DIR / filename
-    doc.save(str(output_path))
+    save_docx(doc, output_path)
     return output_path
 
 
+def _cover_letter_html(cv: dict, letter: dict, theme: "Theme") -> str:
+    """Render the letter as print-ready HTML mirroring the Word layout, for in-process PDF output."""
+    t = theme
+    c = t.colors
+
+    def para(text: str, cls: str) -> str:
+        return f'<p class="{cls}">{escape_html(text).replace(chr(10), "<br>")}</p>'
+
+    contact = cv.get("contact", {})
+    sender = [cv["name"]] + [contact[k] for k in ("address", "email", "phone") if contact.get(k)]
+    parts = [para(line, "sender") for line in sender]
+    parts.append(para(f"Dear {letter.get('recipient', 'Hiring Manager')},", "recipient"))
+    if letter.get("subject"):
+        parts.append(para(f"Re: {letter['subject']}", "subject"))
+    parts += [para(letter[key], "text") for key in ("opening", "body", "closing") if letter.get(key)]
+    parts.append(para("Sincerely,", "signoff"))
+    parts.append(para(cv["name"], "signature"))
+
+    css = f"""
+    @page {{ size: A4; margin: 2.5cm; }}
+    * {{ margin: 0; padding: 0; }}
+    body {{ font-family: {t.fonts.body}, Calibri, Arial, sans-serif; font-size: 11pt; }}
+    .sender {{ font-family: {t.fonts.heading}; font-size: 10pt; color: #{c.text_muted}; margin-bottom: 1pt; }}
+    .recipient {{ font-weight: bold; margin-top: 25pt; margin-bottom: 12pt; }}
+    .subject {{ font-family: {t.fonts.heading}; font-weight: bold; color: #{c.primary}; margin-bottom: 12pt; }}
+    .text {{ color: #{c.text_body}; line-height: 1.15; margin-bottom: 10pt; }}
+    .signoff {{ margin-top: 19pt; margin-bottom: 4pt; }}
+    .signature {{ font-family: {t.fonts.heading}; font-weight: bold; color: #{c.primary}; }}
+    """
+    body = "".join(parts)
+    return f"<!DOCTYPE html><html><head><meta charset='utf-8'><style>{css}</style></head><body>{body}</body></html>"
+
+
+def _build_cover_letter_pdf(cv: dict, letter: dict, theme: "Theme", docx_path: Path) -> Path:
+    """Write the PDF next to the .docx — rendered from HTML with WeasyPrint, converting the .docx if unavailable."""
+    engine = load_config().pdf_engine or "auto"
+    html = _cover_letter_html(cv, letter, theme) if engine in ("auto", "weasyprint") else None
+    return convert_to_pdf_auto(docx_path, engine=engine, html_content=html)
+
+
 def cover_letter(
     description_file: Annotated[
         Path,
@@ -150,6 +385,12 @@ def cover_letter(
         Optional[str],
         typer.Option(help="Theme name or path to theme.yaml."),
     ] = None,
+    cache: Annotated[
+        bool, typer.Option("--cache/--no-cache", help="Reuse a cached letter for the same or a near-identical job.")
+    ] = True,
+    batch: Annotated[
+        bool, typer.Option("--batch", help="Treat path as a directory and write a letter for each .txt/.md file.")
+    ] = False,
 ):
     """Generate a cover letter for a job description based on your CV."""
     cfg = load_config()
@@ -159,6 +400,10 @@ def cover_letter(
     open = resolve(open, cfg.open, True)
     theme = resolve(theme, cfg.theme, None)
 
+    if batch:
+        _cover_letter_batch(description_file, lang, source, pdf, theme, cache)
+        return
+
     if not description_file.exists():
         err_console.print(f"[red]Error:[/] File not found: {description_file}")
         raise typer.Exit(1)
@@ -169,18 +414,107 @@ def cover_letter(
         raise typer.Exit(1)
 
     cv = load_cv(source)
-    letter = _generate_cover_letter(cv, description_text, lang=lang)
+    try:
+        letter = _generate_cover_letter(cv, description_text, lang=lang, use_cache=cache)
+    except ValueError as e:
+        err_console.print(f"[red]Error:[/] {e}")
+        raise typer.Exit(1)
+
+    from .theme import load_theme
 
     resolved_theme = load_theme(theme)
     output_path = _build_cover_letter_docx(cv, letter, lang, resolved_theme)
     console.print(f"Generated: [cyan]{output_path}[/]")
 
-    outputs = [output_path]
-    if pdf:
-        pdf_path = convert_to_pdf(output_path)
-        console.print(f"Generated: [cyan]{pdf_path}[/]")
-        outputs.append(pdf_path)
+    if not pdf:
+        if open:
+            open_file(output_path)
+        return
 
     if open:
-        for p in outputs:
-            open_file(p)
+        open_file(output_path)
+    pdf_path = _build_cover_letter_pdf(cv, letter, resolved_theme, output_path)
+    console.print(f"Generated: [cyan]{pdf_path}[/]")
+    if open:
+        open_file(pdf_path)
+
+
+# Letters generated concurrently in --batch mode (each worker holds an in-flight LLM request)
+MAX_BATCH_WORKERS = 4
+
+
+def _batch_slugs(desc_files: list[Path]) -> dict[Path, str]:
+    """Output slug per job description, disambiguating files whose names slugify alike (acme.txt, acme.md)."""
+    slugs: dict[Path, str] = {}
+    taken: set[str] = set()
+    for desc_file in desc_files:
+        slug = slugify(desc_file.stem)
+        if slug in taken:
+            slug = f"{slug}_{desc_file.suffix.lstrip('.')}"
+        base, n = slug, 2
+        while slug in taken:
+            slug, n = f"{base}_{n}", n + 1
+        taken.add(slug)
+        slugs[desc_file] = slug
+    return slugs
+
+
+def _cover_letter_batch(directory: Path, lang: str, source: Path, pdf: bool, theme_name: str | None, use_cache: bool):
+    """Write a cover letter for every .txt/.md job description in a directory, generating them concurrently.
+
+    PDFs are converted afterwards on the calling thread: the DOCX engines drive a single Word or
+    LibreOffice instance, and Word's COM automation doesn't work from pool threads.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rich.table import Table
+
+    if not directory.is_dir():
+        err_console.print(f"[red]Error:[/] '{directory}' is not a directory. Use --batch with a directory path.")
+        raise typer.Exit(1)
+
+    desc_files = sorted(list(directory.glob("*.txt")) + list(directory.glob("*.md")))
+    if not desc_files:
+        err_console.print(f"[red]Error:[/] No .txt or .md files found in '{directory}'.")
+        raise typer.Exit(1)
+
+    cv = load_cv(source)
+    from .theme import load_theme
+
+    resolved_theme = load_theme(theme_name)
+    slugs = _batch_slugs(desc_files)
+
+    def process(desc_file: Path) -> tuple[str, str, str, dict | None, Path | None]:
+        desc_text = desc_file.read_text(encoding="utf-8").strip()
+        if not desc_text:
+            return desc_file.name, "skipped", "", None, None
+        try:
+            letter = _generate_cover_letter(cv, desc_text, lang=lang, use_cache=use_cache)
+            output_path = _build_cover_letter_docx(cv, letter, lang, resolved_theme, slug=slugs[desc_file])
+            return desc_file.name, "done", output_path.name, letter, output_path
+        except Exception as e:
+            err_console.print(f"[red]Error processing {desc_file.name}:[/] {e}")
+            return desc_file.name, "error", str(e), None, None
+
+    with ThreadPoolExecutor(max_workers=min(len(desc_files), MAX_BATCH_WORKERS)) as executor:
+        generated = list(executor.map(process, desc_files))
+
+    results = []
+    for name, state, output, letter, output_path in generated:
+        if pdf and state == "done":
+            try:
+                pdf_path = _build_cover_letter_pdf(cv, letter, resolved_theme, output_path)
+                output = f"{output}, {pdf_path.name}"
+            except Exception as e:
+                err_console.print(f"[red]Error processing {name}:[/] {e}")
+                state, output = "error", str(e)
+        results.append((name, state, output))
+
+    table = Table(title="Batch Cover Letter Results", show_lines=False)
+    table.add_column("Description", style="cyan")
+    table.add_column("Status", justify="center")
+    table.add_column("Output")
+    for name, state, output in results:
+        state_str = f"[green]{state}[/]" if state == "done" else f"[yellow]{state}[/]"
+        table.add_row(name, state_str, output)
+    console.print(table)
@@ -1,32 +1,104 @@
 """Diff command — compare two CV YAML files."""
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Annotated
 
 import typer
-import yaml
 
 from .console import console, err_console
+from .utils import load_cv
+
+_MISSING = object()
 
 
 def _flatten(data: dict, prefix: str = "") -> dict[str, str]:
-    """Flatten a nested dict into dot-separated key-value pairs."""
-    result = {}
-    for key, value in data.items():
-        full_key = f"{prefix}.{key}" if prefix else key
-        if isinstance(value, dict):
-            result.update(_flatten(value, full_key))
-        elif isinstance(value, list):
-            for i, item in enumerate(value):
-                if isinstance(item, dict):
-                    # Use a readable label if available
-                    label = item.get("title") or item.get("name") or item.get("label") or str(i)
-                    result.update(_flatten(item, f"{full_key}[{label}]"))
-                else:
-                    result[f"{full_key}[{i}]"] = str(item)
-        else:
-            result[full_key] = str(value)
-    return result
+    """Flatten a nested dict into dot-separated key-value pairs.
+
+    Walks the tree with an explicit stack (children pushed in reverse to keep document
+    order) and collects pairs in one list, so there is no recursion or per-level dict merge.
+    """
+    pairs: list[tuple[str, str]] = []
+    stack: list[tuple[str, object]] = [(prefix, data)]
+    while stack:
+        path, node = stack.pop()
+        if not isinstance(node, dict):
+            pairs.append((path, node if isinstance(node, str) else str(node)))
+            continue
+        children: list[tuple[str, object]] = []
+        for key, value in node.items():
+            full_key = f"{path}.{key}" if path else key
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    if isinstance(item, dict):
+                        # Use a readable label if available
+                        label = item.get("title") or item.get("name") or item.get("label") or str(i)
+                        children.append((f"{full_key}[{label}]", item))
+                    else:
+                        children.append((f"{full_key}[{i}]", str(item)))
+            else:
+                children.append((full_key, value))
+        stack.extend(reversed(children))
+    return dict(pairs)
+
+
+def _same(a, b) -> bool:
+    """Equality that also requires matching types, recursively.
+
+    Plain == treats True, 1 and 1.0 as equal, but _flatten renders them differently,
+    so a subtree is only skippable when every value in it has the same type too.
+    """
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_same(value, b[key]) for key, value in a.items())
+    if isinstance(a, list):
+        return len(a) == len(b) and all(map(_same, a, b))
+    return a == b
+
+
+def _flatten_changed(a: dict, b: dict) -> tuple[dict[str, str], dict[str, str]]:
+    """Flatten only the subtrees that differ between a and b.
+
+    Both trees are walked in lockstep; a subtree that compares equal (types included)
+    on both sides is skipped without building any keys for it, since it could not contribute a difference.
+    Differing dicts are descended into, anything else (lists, scalars, one-sided keys)
+    is flattened under its full key.
+    """
+    flat_a: dict[str, str] = {}
+    flat_b: dict[str, str] = {}
+    stack: list[tuple[str, dict, dict]] = [("", a, b)]
+    while stack:
+        path, node_a, node_b = stack.pop()
+        for key in node_a.keys() | node_b.keys():
+            value_a = node_a.get(key, _MISSING)
+            value_b = node_b.get(key, _MISSING)
+            # The C-level == rejects most differences cheaply; _same only confirms the equal ones
+            if value_a == value_b and _same(value_a, value_b):
+                continue
+            full_key = f"{path}.{key}" if path else key
+            if isinstance(value_a, dict) and isinstance(value_b, dict):
+                stack.append((full_key, value_a, value_b))
+                continue
+            if value_a is not _MISSING:
+                flat_a.update(_flatten({key: value_a}, path))
+            if value_b is not _MISSING:
+                flat_b.update(_flatten({key: value_b}, path))
+    return flat_a, flat_b
+
+
+def _diff_entries(flat_a: dict[str, str], flat_b: dict[str, str]) -> Iterator[tuple[str, str, str | None, str | None]]:
+    """Yield (kind, key, old, new) for each difference, in key order.
+
+    kind is "changed", "added" or "removed"; old/new are None on the side the key is missing from.
+    Set operations on the key views find the differences; only those are sorted, not every key.
+    """
+    keys_a, keys_b = flat_a.keys(), flat_b.keys()
+    entries = [("removed", k, flat_a[k], None) for k in keys_a - keys_b]
+    entries += [("added", k, None, flat_b[k]) for k in keys_b - keys_a]
+    entries += [("changed", k, flat_a[k], flat_b[k]) for k in keys_a & keys_b if flat_a[k] != flat_b[k]]
+    entries.sort(key=lambda entry: entry[1])
+    yield from entries
 
 
 def diff(
@@ -39,50 +111,24 @@ def diff(
             err_console.print(f"[red]Error:[/] File not found: {f}")
             raise typer.Exit(1)
 
-    with open(file_a, "r", encoding="utf-8") as f:
-        data_a = yaml.safe_load(f)
-    with open(file_b, "r", encoding="utf-8") as f:
-        data_b = yaml.safe_load(f)
-
-    flat_a = _flatten(data_a)
-    flat_b = _flatten(data_b)
-    all_keys = sorted(set(flat_a.keys()) | set(flat_b.keys()))
-
-    added = []
-    removed = []
-    changed = []
-
-    for key in all_keys:
-        in_a = key in flat_a
-        in_b = key in flat_b
-        if in_a and not in_b:
-            removed.append((key, flat_a[key]))
-        elif not in_a and in_b:
-            added.append((key, flat_b[key]))
-        elif flat_a[key] != flat_b[key]:
-            changed.append((key, flat_a[key], flat_b[key]))
-
-    if not added and not removed and not changed:
+    data_a = load_cv(file_a, validate=False)
+    data_b = load_cv(file_b, validate=False)
+
+    tally = {"changed": 0, "added": 0, "removed": 0}
+    for kind, key, old, new in _diff_entries(*_flatten_changed(data_a, data_b)):
+        if not any(tally.values()):
+            console.print(f"\nComparing [cyan]{file_a}[/] -> [cyan]{file_b}[/]\n")
+        tally[kind] += 1
+        if kind == "changed":
+            console.print(f"[yellow]~[/] [dim]{key}[/]\n    [red]- {old}[/]\n    [green]+ {new}[/]")
+        elif kind == "added":
+            console.print(f"[green]+ {key}: {new}[/]")
+        else:
+            console.print(f"[red]- {key}: {old}[/]")
+
+    if not any(tally.values()):
         console.print("[green]No differences found.[/]")
         return
-
-    console.print(f"\nComparing [cyan]{file_a}[/] -> [cyan]{file_b}[/]\n")
-
-    if changed:
-        console.print(f"[yellow]Changed ({len(changed)}):[/]")
-        for key, old, new in changed:
-            console.print(f"  [dim]{key}[/]")
-            console.print(f"    [red]- {old}[/]")
-            console.print(f"    [green]+ {new}[/]")
-        console.print()
-
-    if added:
-        console.print(f"[green]Added ({len(added)}):[/]")
-        for key, val in added:
-            console.print(f"  [green]+ {key}: {val}[/]")
-        console.print()
-
-    if removed:
-        console.print(f"[red]Removed ({len(removed)}):[/]")
-        for key, val in removed:
-            console.print(f"  [red]- {key}: {val}[/]")
+    console.print(
+        f"\n[yellow]{tally['changed']} changed[/], [green]{tally['added']} added[/], [red]{tally['removed']} removed[/]"
+    )
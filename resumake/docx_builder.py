@@ -1,30 +1,69 @@
 """All docx building functions for the two-column CV layout."""
 
+import re
+from copy import deepcopy
+from html import escape
+from io import BytesIO
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional
 
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import parse_xml
+from docx.oxml import OxmlElement, parse_xml
 from docx.oxml.ns import nsdecls, qn
 from docx.shared import Cm, Pt
+from docx.table import Table
+from docx.text.run import Run
+from lxml.etree import SubElement
 
-from .schema import get_custom_sections
 from .theme import Theme, load_theme
-from .utils import OUTPUT_DIR, SECTION_ICONS, get_labels, parse_start_date, resolve_asset, slugify_name
+from .utils import (
+    OUTPUT_DIR,
+    SECTION_ICONS,
+    get_custom_sections,
+    get_labels,
+    parse_start_date,
+    resolve_asset,
+    slugify_name,
+)
+
+# Fixed spacing lengths, shared rather than allocating a new Pt for every paragraph
+_PT = {n: Pt(n) for n in (0, 1, 2, 4, 6, 8, 10, 12, 14)}
+_NSDECLS_W = nsdecls("w")
+
+# Clark names for the elements add_para/add_run_to_para build directly with lxml
+_W_PPR, _W_SPACING, _W_JC = qn("w:pPr"), qn("w:spacing"), qn("w:jc")
+_W_R, _W_RPR, _W_RFONTS = qn("w:r"), qn("w:rPr"), qn("w:rFonts")
+_W_B, _W_I, _W_COLOR, _W_SZ = qn("w:b"), qn("w:i"), qn("w:color"), qn("w:sz")
+_W_T, _W_TAB, _W_BR = qn("w:t"), qn("w:tab"), qn("w:br")
+_W_VAL, _W_BEFORE, _W_AFTER = qn("w:val"), qn("w:before"), qn("w:after")
+_W_ASCII, _W_HANSI = qn("w:ascii"), qn("w:hAnsi")
+_XML_SPACE = qn("xml:space")
+_VAL_OFF = {_W_VAL: "0"}
+_RUN_BREAKS = re.compile(r"(\t|\r|\n)")
+
+
+def _theme_sizes(theme: Theme) -> SimpleNamespace:
+    """The theme's font sizes as Pt lengths, built once per document."""
+    s = theme.sizes
+    return SimpleNamespace(
+        name=Pt(s.name_pt),
+        heading=Pt(s.heading_pt),
+        subheading=Pt(s.subheading_pt),
+        body=Pt(s.body_pt),
+        small=Pt(s.small_pt),
+    )
+
 
-# Module-level theme — set by build_docx() before any builder runs
+# Module-level theme (and its sizes as Pt) — set by build_docx() before any builder runs
 _theme: Theme = Theme()
+_sz = _theme_sizes(_theme)
 
 
 # ── Low-level helpers ──
 
 
-def set_cell_shading(cell, color_hex):
-    shading = parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color_hex}" w:val="clear"/>')
-    cell._tc.get_or_add_tcPr().append(shading)
-
-
 def add_inline_picture(run, image_path, **kwargs):
     """Add a picture to a run and patch OOXML attributes required by Word for Mac.
 
@@ -44,35 +83,31 @@ def add_inline_picture(run, image_path, **kwargs):
     return inline_shape
 
 
+_NO_BORDER = 'w:val="none" w:sz="0" w:space="0"'
+_TBL_BORDERS_XML = (
+    "<w:tblBorders>"
+    + "".join(f"<w:{side} {_NO_BORDER}/>" for side in ("top", "left", "bottom", "right", "insideH", "insideV"))
+    + "</w:tblBorders>"
+)
+_TC_BORDERS_XML = (
+    "<w:tcBorders>"
+    + "".join(f"<w:{side} {_NO_BORDER}/>" for side in ("top", "left", "bottom", "right"))
+    + "</w:tcBorders>"
+)
+
+
+def _twips(cm_val) -> str:
+    return str(int(cm_val * 567))
+
+
 def remove_table_borders(table):
     tbl = table._tbl
     tblPr = tbl.tblPr
     if tblPr is None:
-        tblPr = parse_xml(f"<w:tblPr {nsdecls('w')}/>")
+        tblPr = OxmlElement("w:tblPr")
         tbl.insert(0, tblPr)
-    borders = parse_xml(
-        f"<w:tblBorders {nsdecls('w')}>"
-        '  <w:top w:val="none" w:sz="0" w:space="0"/>'
-        '  <w:left w:val="none" w:sz="0" w:space="0"/>'
-        '  <w:bottom w:val="none" w:sz="0" w:space="0"/>'
-        '  <w:right w:val="none" w:sz="0" w:space="0"/>'
-        '  <w:insideH w:val="none" w:sz="0" w:space="0"/>'
-        '  <w:insideV w:val="none" w:sz="0" w:space="0"/>'
-        "</w:tblBorders>"
-    )
-    tblPr.append(borders)
-
-
-def remove_cell_borders(cell):
-    borders = parse_xml(
-        f"<w:tcBorders {nsdecls('w')}>"
-        '  <w:top w:val="none" w:sz="0" w:space="0"/>'
-        '  <w:left w:val="none" w:sz="0" w:space="0"/>'
-        '  <w:bottom w:val="none" w:sz="0" w:space="0"/>'
-        '  <w:right w:val="none" w:sz="0" w:space="0"/>'
-        "</w:tcBorders>"
-    )
-    cell._tc.get_or_add_tcPr().append(borders)
+    # Parse inside a namespaced wrapper, since the shared fragment carries no xmlns declaration
+    tblPr.append(parse_xml(f"<w:tblPr {_NSDECLS_W}>{_TBL_BORDERS_XML}</w:tblPr>")[0])
 
 
 def set_cell_width(cell, width_cm):
@@ -80,23 +115,39 @@ def set_cell_width(cell, width_cm):
     # Remove any existing tcW to avoid duplicates
     for existing in tcPr.findall(qn("w:tcW")):
         tcPr.remove(existing)
-    tcW = parse_xml(f'<w:tcW {nsdecls("w")} w:w="{int(width_cm * 567)}" w:type="dxa"/>')
-    tcPr.append(tcW)
+    tcPr.append(OxmlElement("w:tcW", {qn("w:w"): _twips(width_cm), qn("w:type"): "dxa"}))
 
 
-def set_cell_margins(cell, top=0, bottom=0, left=0, right=0):
-    def to_twips(cm_val):
-        return int(cm_val * 567)
+def save_docx(doc, output_path: Path) -> None:
+    """Save a document by zipping it in memory and writing the file in one call.
 
-    margins = parse_xml(
-        f"<w:tcMar {nsdecls('w')}>"
-        f'  <w:top w:w="{to_twips(top)}" w:type="dxa"/>'
-        f'  <w:left w:w="{to_twips(left)}" w:type="dxa"/>'
-        f'  <w:bottom w:w="{to_twips(bottom)}" w:type="dxa"/>'
-        f'  <w:right w:w="{to_twips(right)}" w:type="dxa"/>'
-        f"</w:tcMar>"
-    )
-    cell._tc.get_or_add_tcPr().append(margins)
+    python-docx otherwise streams each compressed part to disk as it goes; this also
+    means a failure while serializing leaves an existing file at output_path intact.
+    """
+    buf = BytesIO()
+    doc.save(buf)
+    output_path.write_bytes(buf.getbuffer())
+
+
+def _append_run(p_el, text, bold, italic, size, color, font_name):
+    """Append a ``w:r`` with the builder's standard run properties to a paragraph element."""
+    r = SubElement(p_el, _W_R)
+    rPr = SubElement(r, _W_RPR)
+    SubElement(rPr, _W_RFONTS, {_W_ASCII: font_name, _W_HANSI: font_name})
+    SubElement(rPr, _W_B, {} if bold else _VAL_OFF)
+    SubElement(rPr, _W_I, {} if italic else _VAL_OFF)
+    SubElement(rPr, _W_COLOR, {_W_VAL: str(color)})
+    SubElement(rPr, _W_SZ, {_W_VAL: str(int(size.pt * 2))})
+    # Same content mapping as python-docx's run.text: tabs and line breaks become elements
+    for i, chunk in enumerate(_RUN_BREAKS.split(text)):
+        if i % 2:
+            SubElement(r, _W_TAB if chunk == "\t" else _W_BR)
+        elif chunk:
+            t = SubElement(r, _W_T)
+            t.text = chunk
+            if chunk != chunk.strip():
+                t.set(_XML_SPACE, "preserve")
+    return r
 
 
 def add_para(
@@ -108,27 +159,23 @@ def add_para(
     color=None,
     font_name=None,
     align=None,
-    space_before=Pt(0),
-    space_after=Pt(0),
+    space_before=_PT[0],
+    space_after=_PT[0],
 ):
     if size is None:
-        size = Pt(_theme.sizes.body_pt)
+        size = _sz.body
     if color is None:
         color = _theme.colors.text_light_rgb
     if font_name is None:
         font_name = _theme.fonts.heading
     p = cell.add_paragraph()
-    p.paragraph_format.space_before = space_before
-    p.paragraph_format.space_after = space_after
+    p_el = p._p
+    pPr = SubElement(p_el, _W_PPR)
+    SubElement(pPr, _W_SPACING, {_W_BEFORE: str(space_before.twips), _W_AFTER: str(space_after.twips)})
     if align is not None:
-        p.alignment = align
+        SubElement(pPr, _W_JC, {_W_VAL: align.xml_value})
     if text:
-        run = p.add_run(text)
-        run.bold = bold
-        run.italic = italic
-        run.font.size = size
-        run.font.color.rgb = color
-        run.font.name = font_name
+        _append_run(p_el, text, bold, italic, size, color, font_name)
     return p
 
 
@@ -137,7 +184,7 @@ def add_hyperlink(paragraph, url, text, color=None, size=None, font_name=None):
     if color is None:
         color = _theme.colors.accent_rgb
     if size is None:
-        size = Pt(_theme.sizes.small_pt)
+        size = _sz.small
     if font_name is None:
         font_name = _theme.fonts.heading
 
@@ -146,36 +193,29 @@ def add_hyperlink(paragraph, url, text, color=None, size=None, font_name=None):
     r_id = part.relate_to(url, rel_type, is_external=True)
 
     ns_r = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
-    hyperlink = parse_xml(f'<w:hyperlink {nsdecls("w")} r:id="{r_id}" xmlns:r="{ns_r}"/>')
-    new_run = parse_xml(f'<w:r {nsdecls("w")}><w:rPr><w:rStyle w:val="Hyperlink"/></w:rPr><w:t>{text}</w:t></w:r>')
-
-    # Style the run
-    rPr = new_run.find(qn("w:rPr"))
     color_val = color.hex_string if hasattr(color, "hex_string") else color
-    rPr.append(parse_xml(f'<w:color {nsdecls("w")} w:val="{color_val}"/>'))
-    rPr.append(parse_xml(f'<w:sz {nsdecls("w")} w:val="{int(size.pt * 2)}"/>'))
-    rPr.append(parse_xml(f'<w:rFonts {nsdecls("w")} w:ascii="{font_name}" w:hAnsi="{font_name}"/>'))
-    rPr.append(parse_xml(f'<w:u {nsdecls("w")} w:val="single"/>'))
-
-    hyperlink.append(new_run)
+    # One parse for the hyperlink and its styled run
+    hyperlink = parse_xml(
+        f'<w:hyperlink {_NSDECLS_W} r:id="{r_id}" xmlns:r="{ns_r}"><w:r><w:rPr>'
+        '<w:rStyle w:val="Hyperlink"/>'
+        f'<w:color w:val="{color_val}"/>'
+        f'<w:sz w:val="{int(size.pt * 2)}"/>'
+        f'<w:rFonts w:ascii="{escape(font_name)}" w:hAnsi="{escape(font_name)}"/>'
+        '<w:u w:val="single"/>'
+        f"</w:rPr><w:t>{escape(text, quote=False)}</w:t></w:r></w:hyperlink>"
+    )
     paragraph._p.append(hyperlink)
     return hyperlink
 
 
 def add_run_to_para(p, text, bold=False, italic=False, size=None, color=None, font_name=None):
     if size is None:
-        size = Pt(_theme.sizes.body_pt)
+        size = _sz.body
     if color is None:
         color = _theme.colors.text_body_rgb
     if font_name is None:
         font_name = _theme.fonts.heading
-    run = p.add_run(text)
-    run.bold = bold
-    run.italic = italic
-    run.font.size = size
-    run.font.color.rgb = color
-    run.font.name = font_name
-    return run
+    return Run(_append_run(p._p, text, bold, italic, size, color, font_name), p)
 
 
 # ── Sidebar builders ──
@@ -199,7 +239,7 @@ def build_sidebar_header(cell, cv, lang="en"):
         cell._tc.remove(default_p)
 
         p_photo.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        p_photo.paragraph_format.space_after = Pt(8)
+        p_photo.paragraph_format.space_after = _PT[8]
         run = p_photo.add_run()
         add_inline_picture(run, photo_path, width=Cm(2.8))
 
@@ -207,9 +247,9 @@ def build_sidebar_header(cell, cv, lang="en"):
     parts = name.split(" ", 1)
     p_name = cell.add_paragraph()
     p_name.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p_name.paragraph_format.space_after = Pt(4)
+    p_name.paragraph_format.space_after = _PT[4]
 
-    name_size = Pt(_theme.sizes.name_pt)
+    name_size = _sz.name
     name_color = _theme.colors.text_light_rgb
     name_font = _theme.fonts.heading
 
@@ -234,25 +274,26 @@ def build_sidebar_header(cell, cv, lang="en"):
     add_para(
         cell,
         cv["title"],
-        size=Pt(_theme.sizes.small_pt),
+        size=_sz.small,
         color=_theme.colors.text_muted_rgb,
         italic=True,
         align=WD_ALIGN_PARAGRAPH.CENTER,
-        space_after=Pt(12),
+        space_after=_PT[12],
     )
 
 
-def build_sidebar_contact(cell, cv, lang="en"):
-    L = get_labels(lang)
+def build_sidebar_contact(cell, cv, L):
+    light = _theme.colors.text_light_rgb
+    muted = _theme.colors.text_muted_rgb
     add_para(
         cell,
         L["details"],
         bold=True,
-        size=Pt(_theme.sizes.subheading_pt),
-        color=_theme.colors.text_light_rgb,
+        size=_sz.subheading,
+        color=light,
         align=WD_ALIGN_PARAGRAPH.CENTER,
-        space_before=Pt(6),
-        space_after=Pt(6),
+        space_before=_PT[6],
+        space_after=_PT[6],
     )
 
     contact = cv["contact"]
@@ -260,77 +301,78 @@ def build_sidebar_contact(cell, cv, lang="en"):
         add_para(
             cell,
             text,
-            size=Pt(_theme.sizes.small_pt),
-            color=_theme.colors.text_light_rgb,
+            size=_sz.small,
+            color=light,
             align=WD_ALIGN_PARAGRAPH.CENTER,
-            space_after=Pt(2),
+            space_after=_PT[2],
         )
 
-    add_para(cell, "", space_before=Pt(4))
+    add_para(cell, "", space_before=_PT[4])
     add_para(
         cell,
         L["nationality"],
         bold=True,
-        size=Pt(_theme.sizes.body_pt),
-        color=_theme.colors.text_muted_rgb,
+        size=_sz.body,
+        color=muted,
         align=WD_ALIGN_PARAGRAPH.CENTER,
-        space_after=Pt(2),
+        space_after=_PT[2],
     )
     add_para(
         cell,
         contact["nationality"],
-        size=Pt(_theme.sizes.small_pt),
-        color=_theme.colors.text_light_rgb,
+        size=_sz.small,
+        color=light,
         align=WD_ALIGN_PARAGRAPH.CENTER,
-        space_after=Pt(6),
+        space_after=_PT[6],
     )
 
 
-def build_sidebar_links(cell, cv, lang="en"):
-    L = get_labels(lang)
+def build_sidebar_links(cell, cv, L):
     if not cv.get("links"):
         return
     add_para(
         cell,
         L["links"],
         bold=True,
-        size=Pt(_theme.sizes.subheading_pt),
+        size=_sz.subheading,
         color=_theme.colors.text_light_rgb,
         align=WD_ALIGN_PARAGRAPH.CENTER,
-        space_before=Pt(8),
-        space_after=Pt(6),
+        space_before=_PT[8],
+        space_after=_PT[6],
     )
 
     for link in cv["links"]:
         if link.get("url"):
-            p = add_para(cell, "", size=Pt(_theme.sizes.small_pt), align=WD_ALIGN_PARAGRAPH.CENTER, space_after=Pt(2))
-            add_hyperlink(p, link["url"], link["label"], color=_theme.colors.accent_rgb, size=Pt(_theme.sizes.small_pt))
+            p = add_para(cell, "", size=_sz.small, align=WD_ALIGN_PARAGRAPH.CENTER, space_after=_PT[2])
+            add_hyperlink(p, link["url"], link["label"], color=_theme.colors.accent_rgb, size=_sz.small)
         else:
             add_para(
                 cell,
                 link["label"],
-                size=Pt(_theme.sizes.small_pt),
+                size=_sz.small,
                 color=_theme.colors.accent_rgb,
                 align=WD_ALIGN_PARAGRAPH.CENTER,
-                space_after=Pt(2),
+                space_after=_PT[2],
             )
 
 
-def build_sidebar_skills(cell, cv, lang="en"):
-    L = get_labels(lang)
+def build_sidebar_skills(cell, cv, L):
     skills = cv.get("skills", {})
     if not skills:
         return
 
+    light = _theme.colors.text_light_rgb
+    muted = _theme.colors.text_muted_rgb
+
     add_para(
         cell,
         L["skills"],
         bold=True,
-        size=Pt(_theme.sizes.subheading_pt),
-        color=_theme.colors.text_light_rgb,
+        size=_sz.subheading,
+        color=light,
         align=WD_ALIGN_PARAGRAPH.CENTER,
-        space_before=Pt(10),
-        space_after=Pt(6),
+        space_before=_PT[10],
+        space_after=_PT[6],
     )
 
     if skills.get("leadership"):
@@ -338,49 +380,48 @@ def build_sidebar_skills(cell, cv, lang="en"):
             cell,
             L["leadership_skills"],
             bold=True,
-            size=Pt(_theme.sizes.small_pt),
-            color=_theme.colors.text_muted_rgb,
+            size=_sz.small,
+            color=muted,
             align=WD_ALIGN_PARAGRAPH.CENTER,
-            space_after=Pt(4),
+            space_after=_PT[4],
+        )
+        # One paragraph with a line break per skill, rather than a paragraph each
+        add_para(
+            cell,
+            "\n".join(skills["leadership"]),
+            size=_sz.small,
+            color=light,
+            align=WD_ALIGN_PARAGRAPH.CENTER,
+            space_after=_PT[2],
         )
-        for skill in skills["leadership"]:
-            add_para(
-                cell,
-                skill,
-                size=Pt(_theme.sizes.small_pt),
-                color=_theme.colors.text_light_rgb,
-                align=WD_ALIGN_PARAGRAPH.CENTER,
-                space_after=Pt(2),
-            )
 
     if skills.get("technical"):
         add_para(
             cell,
             L["technical_skills"],
             bold=True,
-            size=Pt(_theme.sizes.small_pt),
-            color=_theme.colors.text_muted_rgb,
+            size=_sz.small,
+            color=muted,
             align=WD_ALIGN_PARAGRAPH.CENTER,
-            space_before=Pt(8),
-            space_after=Pt(4),
+            space_before=_PT[8],
+            space_after=_PT[4],
+        )
+        add_para(
+            cell,
+            "\n".join(skills["technical"]),
+            size=_sz.small,
+            color=light,
+            align=WD_ALIGN_PARAGRAPH.CENTER,
+            space_after=_PT[2],
         )
-        for skill in skills["technical"]:
-            add_para(
-                cell,
-                skill,
-                size=Pt(_theme.sizes.small_pt),
-                color=_theme.colors.text_light_rgb,
-                align=WD_ALIGN_PARAGRAPH.CENTER,
-                space_after=Pt(2),
-            )
 
 
-def build_sidebar_languages(cell, cv, lang="en"):
-    L = get_labels(lang)
+def build_sidebar_languages(cell, cv, L, lang="en"):
     languages = cv.get("skills", {}).get("languages", [])
     if not languages:
         return
 
+    light = _theme.colors.text_light_rgb
     level_maps = {
         "en": {"native": "Native", "fluent": "Fluent", "professional": "Professional", "basic": "Basic"},
         "de": {
@@ -396,53 +437,72 @@ def build_sidebar_languages(cell, cv, lang="en"):
         cell,
         L["languages"],
         bold=True,
-        size=Pt(_theme.sizes.subheading_pt),
-        color=_theme.colors.text_light_rgb,
+        size=_sz.subheading,
+        color=light,
         align=WD_ALIGN_PARAGRAPH.CENTER,
-        space_before=Pt(10),
-        space_after=Pt(6),
+        space_before=_PT[10],
+        space_after=_PT[6],
     )
 
-    for lang in languages:
-        level = level_map.get(lang["level"], lang["level"])
-        add_para(
-            cell,
-            f"{lang['name']} ({level})",
-            size=Pt(_theme.sizes.small_pt),
-            color=_theme.colors.text_light_rgb,
-            align=WD_ALIGN_PARAGRAPH.CENTER,
-            space_after=Pt(2),
-        )
+    # One paragraph with a line break per language, rather than a paragraph each
+    add_para(
+        cell,
+        "\n".join(f"{lg['name']} ({level_map.get(lg['level'], lg['level'])})" for lg in languages),
+        size=_sz.small,
+        color=light,
+        align=WD_ALIGN_PARAGRAPH.CENTER,
+        space_after=_PT[2],
+    )
 
 
 # ── Main content builders ──
 
 
+def _section_icon(key: str) -> Optional[Path]:
+    """Resolved icon file for a section heading, or None when the section has no icon or it is missing."""
+    icon_file = SECTION_ICONS.get(key)
+    # resolve_asset only returns existing paths, so no separate exists() check is needed
+    return resolve_asset(icon_file) if icon_file else None
+
+
+# "List Bullet" paragraph properties with the builder's 1pt spacing. Setting the style by name makes
+# python-docx scan every style in styles.xml for each bullet, so the resolved pPr is copied instead.
+_BULLET_PPR = parse_xml(
+    f'<w:pPr {_NSDECLS_W}><w:pStyle w:val="ListBullet"/><w:spacing w:before="20" w:after="20"/></w:pPr>'
+)
+
+
+def _add_bullet_para(cell):
+    """Add an empty "List Bullet" paragraph for a bullet line."""
+    p = cell.add_paragraph()
+    p._p.insert(0, deepcopy(_BULLET_PPR))
+    return p
+
+
 def add_section_heading(cell, title, icon_key=None):
-    icon_file = SECTION_ICONS.get(icon_key or title)
-    icon_path = resolve_asset(icon_file) if icon_file else None
+    icon_path = _section_icon(icon_key or title)
 
     p = cell.add_paragraph()
-    p.paragraph_format.space_before = Pt(14)
-    p.paragraph_format.space_after = Pt(6)
+    p.paragraph_format.space_before = _PT[14]
+    p.paragraph_format.space_after = _PT[6]
 
-    if icon_path and icon_path.exists():
+    if icon_path:
         run_icon = p.add_run()
-        run_icon.add_picture(str(icon_path), height=Pt(14))
+        run_icon.add_picture(str(icon_path), height=_PT[14])
         p.add_run("  ")
 
     run_title = p.add_run(title)
     run_title.bold = True
-    run_title.font.size = Pt(_theme.sizes.heading_pt)
+    run_title.font.size = _sz.heading
     run_title.font.color.rgb = _theme.colors.primary_rgb
     run_title.font.name = _theme.fonts.heading
 
     p_line = cell.add_paragraph()
-    p_line.paragraph_format.space_before = Pt(0)
-    p_line.paragraph_format.space_after = Pt(4)
+    p_line.paragraph_format.space_before = _PT[0]
+    p_line.paragraph_format.space_after = _PT[4]
     pPr = p_line._p.get_or_add_pPr()
     pBdr = parse_xml(
-        f"<w:pBdr {nsdecls('w')}>"
+        f"<w:pBdr {_NSDECLS_W}>"
         f'  <w:bottom w:val="single" w:sz="4" w:space="1" w:color="{_theme.colors.accent}"/>'
         f"</w:pBdr>"
     )
@@ -451,22 +511,21 @@ def add_section_heading(cell, title, icon_key=None):
 
 def add_labeled_line(cell, label, value):
     p = cell.add_paragraph()
-    p.paragraph_format.space_before = Pt(1)
-    p.paragraph_format.space_after = Pt(1)
-    add_run_to_para(p, f"{label}: ", bold=True, size=Pt(_theme.sizes.small_pt), color=_theme.colors.accent_rgb)
-    add_run_to_para(p, value, size=Pt(_theme.sizes.small_pt), color=_theme.colors.text_muted_rgb)
+    p.paragraph_format.space_before = _PT[1]
+    p.paragraph_format.space_after = _PT[1]
+    add_run_to_para(p, f"{label}: ", bold=True, size=_sz.small, color=_theme.colors.accent_rgb)
+    add_run_to_para(p, value, size=_sz.small, color=_theme.colors.text_muted_rgb)
 
 
-def build_main_profile(cell, cv, lang="en"):
-    L = get_labels(lang)
+def build_main_profile(cell, cv, L):
     add_section_heading(cell, L["profile"], icon_key="Profile")
     add_para(
         cell,
         cv["profile"].strip(),
-        size=Pt(_theme.sizes.body_pt),
+        size=_sz.body,
         color=_theme.colors.text_body_rgb,
         font_name=_theme.fonts.body,
-        space_after=Pt(4),
+        space_after=_PT[4],
     )
 
     if cv.get("testimonials"):
@@ -474,10 +533,10 @@ def build_main_profile(cell, cv, lang="en"):
             cell,
             L["testimonials_heading"],
             bold=True,
-            size=Pt(_theme.sizes.body_pt),
+            size=_sz.body,
             color=_theme.colors.primary_rgb,
-            space_before=Pt(8),
-            space_after=Pt(4),
+            space_before=_PT[8],
+            space_after=_PT[4],
         )
         for t in cv["testimonials"]:
             if t.get("quote"):
@@ -485,20 +544,40 @@ def build_main_profile(cell, cv, lang="en"):
                     cell,
                     t["quote"],
                     italic=True,
-                    size=Pt(_theme.sizes.body_pt),
+                    size=_sz.body,
                     color=_theme.colors.text_muted_rgb,
                     font_name=_theme.fonts.body,
-                    space_after=Pt(4),
+                    space_after=_PT[4],
                 )
             p = cell.add_paragraph()
-            p.paragraph_format.space_after = Pt(2)
-            add_run_to_para(p, t["name"], bold=True, size=Pt(_theme.sizes.body_pt), color=_theme.colors.primary_rgb)
-            add_run_to_para(p, f"\n{t['role']}", size=Pt(_theme.sizes.small_pt), color=_theme.colors.text_muted_rgb)
-            add_run_to_para(p, f"\n{t['org']}", size=Pt(_theme.sizes.small_pt), color=_theme.colors.text_muted_rgb)
-
-
-def build_main_experience(cell, cv, lang="en"):
-    L = get_labels(lang)
+            p.paragraph_format.space_after = _PT[2]
+            add_run_to_para(p, t["name"], bold=True, size=_sz.body, color=_theme.colors.primary_rgb)
+            add_run_to_para(p, f"\n{t['role']}", size=_sz.small, color=_theme.colors.text_muted_rgb)
+            add_run_to_para(p, f"\n{t['org']}", size=_sz.small, color=_theme.colors.text_muted_rgb)
+
+
+# Optional per-entry experience fields rendered as "Label: value" lines, in this order
+_EXPERIENCE_META_FIELDS = (
+    ("soft_skills", "Soft Skills"),
+    ("investment_skills", "Investment Skills"),
+    ("telecom_skills", "Telecommunication Skills"),
+    ("tech_stack", "Tech Stack"),
+    ("frontend_tech_stack", "Frontend Tech Stack"),
+    ("backend_tech_stack", "Backend Tech Stack"),
+    ("devops", "DevOps / MLOps"),
+    ("tools_platforms", "Tools & Platforms"),
+    ("focus_areas", "Focus Expertise Areas"),
+    ("project_methodology", "Project Methodology"),
+    ("architecture", "Architecture"),
+    ("project_size", "Project Size & Setup"),
+)
+
+
+def build_main_experience(cell, cv, L):
+    muted = _theme.colors.text_muted_rgb
+    body_color = _theme.colors.text_body_rgb
+    primary = _theme.colors.primary_rgb
+    body_font = _theme.fonts.body
     add_section_heading(cell, L["experience"], icon_key="Project / Employment History")
 
     entries = sorted(cv.get("experience", []), key=lambda e: parse_start_date(e.get("start", "")), reverse=True)
@@ -508,16 +587,16 @@ def build_main_experience(cell, cv, lang="en"):
             title_text += f" — {entry['org']}"
 
         p_title = cell.add_paragraph()
-        p_title.paragraph_format.space_before = Pt(8)
-        p_title.paragraph_format.space_after = Pt(1)
-        add_run_to_para(p_title, title_text, bold=True, size=Pt(_theme.sizes.body_pt), color=_theme.colors.primary_rgb)
+        p_title.paragraph_format.space_before = _PT[8]
+        p_title.paragraph_format.space_after = _PT[1]
+        add_run_to_para(p_title, title_text, bold=True, size=_sz.body, color=primary)
 
         add_para(
             cell,
             f"{entry.get('start', '')} — {entry.get('end', '')}".strip(" —"),
-            size=Pt(_theme.sizes.small_pt),
-            color=_theme.colors.text_muted_rgb,
-            space_after=Pt(2),
+            size=_sz.small,
+            color=muted,
+            space_after=_PT[2],
         )
 
         if entry.get("description"):
@@ -525,147 +604,129 @@ def build_main_experience(cell, cv, lang="en"):
                 cell,
                 entry["description"],
                 italic=True,
-                size=Pt(_theme.sizes.body_pt),
-                color=_theme.colors.text_muted_rgb,
-                font_name=_theme.fonts.body,
-                space_after=Pt(2),
+                size=_sz.body,
+                color=muted,
+                font_name=body_font,
+                space_after=_PT[2],
             )
 
         for bullet in entry.get("bullets", []):
-            p = cell.add_paragraph(style="List Bullet")
-            p.paragraph_format.space_before = Pt(1)
-            p.paragraph_format.space_after = Pt(1)
-            p.text = ""
+            p = _add_bullet_para(cell)
             add_run_to_para(
                 p,
                 bullet,
-                size=Pt(_theme.sizes.small_pt),
-                color=_theme.colors.text_body_rgb,
-                font_name=_theme.fonts.body,
+                size=_sz.small,
+                color=body_color,
+                font_name=body_font,
             )
 
-        meta_fields = [
-            ("soft_skills", "Soft Skills"),
-            ("investment_skills", "Investment Skills"),
-            ("telecom_skills", "Telecommunication Skills"),
-            ("tech_stack", "Tech Stack"),
-            ("frontend_tech_stack", "Frontend Tech Stack"),
-            ("backend_tech_stack", "Backend Tech Stack"),
-            ("devops", "DevOps / MLOps"),
-            ("tools_platforms", "Tools & Platforms"),
-            ("focus_areas", "Focus Expertise Areas"),
-            ("project_methodology", "Project Methodology"),
-            ("architecture", "Architecture"),
-            ("project_size", "Project Size & Setup"),
-        ]
-        for key, label in meta_fields:
+        for key, label in _EXPERIENCE_META_FIELDS:
             val = entry.get(key)
             if val and (isinstance(val, str) or (isinstance(val, list) and len(val) > 0)):
                 text = val if isinstance(val, str) else ", ".join(val)
                 add_labeled_line(cell, label, text)
 
 
-def build_main_education(cell, cv, lang="en"):
-    L = get_labels(lang)
+def build_main_education(cell, cv, L):
+    muted = _theme.colors.text_muted_rgb
+    body_color = _theme.colors.text_body_rgb
+    primary = _theme.colors.primary_rgb
+    body_font = _theme.fonts.body
     add_section_heading(cell, L["education"], icon_key="Education")
 
     for entry in cv.get("education", []):
         p_title = cell.add_paragraph()
-        p_title.paragraph_format.space_before = Pt(6)
-        p_title.paragraph_format.space_after = Pt(1)
+        p_title.paragraph_format.space_before = _PT[6]
+        p_title.paragraph_format.space_after = _PT[1]
         add_run_to_para(
             p_title,
             f"{entry['degree']}, {entry['institution']}",
             bold=True,
-            size=Pt(_theme.sizes.body_pt),
-            color=_theme.colors.primary_rgb,
+            size=_sz.body,
+            color=primary,
         )
 
         add_para(
             cell,
             f"{entry.get('start', '')} — {entry.get('end', '')}".strip(" —"),
-            size=Pt(_theme.sizes.small_pt),
-            color=_theme.colors.text_muted_rgb,
-            space_after=Pt(2),
+            size=_sz.small,
+            color=muted,
+            space_after=_PT[2],
         )
 
         if entry.get("description"):
             add_para(
                 cell,
                 entry["description"],
-                size=Pt(_theme.sizes.body_pt),
-                color=_theme.colors.text_body_rgb,
-                font_name=_theme.fonts.body,
-                space_after=Pt(2),
+                size=_sz.body,
+                color=body_color,
+                font_name=body_font,
+                space_after=_PT[2],
             )
 
         if entry.get("details"):
             add_para(
                 cell,
                 entry["details"],
-                size=Pt(_theme.sizes.small_pt),
-                color=_theme.colors.text_muted_rgb,
-                font_name=_theme.fonts.body,
-                space_after=Pt(2),
+                size=_sz.small,
+                color=muted,
+                font_name=body_font,
+                space_after=_PT[2],
             )
 
 
-def build_main_volunteering(cell, cv, lang="en"):
-    L = get_labels(lang)
-    if not cv.get("volunteering"):
-        return
+def build_main_volunteering(cell, cv, L):
     add_section_heading(cell, L["volunteering"], icon_key="Volunteering")
 
     for entry in cv["volunteering"]:
         p_title = cell.add_paragraph()
-        p_title.paragraph_format.space_before = Pt(6)
-        p_title.paragraph_format.space_after = Pt(1)
+        p_title.paragraph_format.space_before = _PT[6]
+        p_title.paragraph_format.space_after = _PT[1]
         add_run_to_para(
             p_title,
             f"{entry['title']} — {entry['org']}",
             bold=True,
-            size=Pt(_theme.sizes.body_pt),
+            size=_sz.body,
             color=_theme.colors.primary_rgb,
         )
 
         add_para(
             cell,
             f"{entry.get('start', '')} — {entry.get('end', '')}".strip(" —"),
-            size=Pt(_theme.sizes.small_pt),
+            size=_sz.small,
             color=_theme.colors.text_muted_rgb,
-            space_after=Pt(2),
+            space_after=_PT[2],
         )
 
         if entry.get("description"):
             add_para(
                 cell,
                 entry["description"],
-                size=Pt(_theme.sizes.body_pt),
+                size=_sz.body,
                 color=_theme.colors.text_body_rgb,
                 font_name=_theme.fonts.body,
-                space_after=Pt(2),
+                space_after=_PT[2],
             )
 
 
-def build_main_references(cell, cv, lang="en"):
-    L = get_labels(lang)
-    if not cv.get("references"):
-        return
+def build_main_references(cell, cv, L):
     add_section_heading(cell, L["references"], icon_key="References")
     add_para(
         cell,
         cv["references"],
-        size=Pt(_theme.sizes.body_pt),
+        size=_sz.body,
         color=_theme.colors.text_body_rgb,
         font_name=_theme.fonts.body,
-        space_after=Pt(4),
+        space_after=_PT[4],
     )
 
 
-def build_main_certifications(cell, cv, lang="en"):
-    L = get_labels(lang)
-    if not cv.get("certifications"):
-        return
+def build_main_certifications(cell, cv, L):
+    muted = _theme.colors.text_muted_rgb
+    body_color = _theme.colors.text_body_rgb
+    primary = _theme.colors.primary_rgb
+    body_font = _theme.fonts.body
+
     add_section_heading(cell, L["certifications"], icon_key="Certifications")
 
     for entry in cv["certifications"]:
@@ -674,38 +735,36 @@ def build_main_certifications(cell, cv, lang="en"):
             title_text += f", {entry['org']}"
 
         p_title = cell.add_paragraph()
-        p_title.paragraph_format.space_before = Pt(6)
-        p_title.paragraph_format.space_after = Pt(1)
-        add_run_to_para(p_title, title_text, bold=True, size=Pt(_theme.sizes.body_pt), color=_theme.colors.primary_rgb)
+        p_title.paragraph_format.space_before = _PT[6]
+        p_title.paragraph_format.space_after = _PT[1]
+        add_run_to_para(p_title, title_text, bold=True, size=_sz.body, color=primary)
 
         add_para(
             cell,
             f"{entry.get('start', '')} — {entry.get('end', '')}".strip(" —"),
-            size=Pt(_theme.sizes.small_pt),
-            color=_theme.colors.text_muted_rgb,
-            space_after=Pt(2),
+            size=_sz.small,
+            color=muted,
+            space_after=_PT[2],
         )
 
         if entry.get("description"):
             add_para(
                 cell,
                 entry["description"],
-                size=Pt(_theme.sizes.body_pt),
-                color=_theme.colors.text_body_rgb,
-                font_name=_theme.fonts.body,
-                space_after=Pt(2),
+                size=_sz.body,
+                color=body_color,
+                font_name=body_font,
+                space_after=_PT[2],
             )
 
 
 def _render_publication(cell, pub, image_height_cm=3.6):
     """Render a single publication entry (title, year/venue, optional cover image)."""
     p = cell.add_paragraph()
-    p.paragraph_format.space_before = Pt(4)
-    p.paragraph_format.space_after = Pt(2)
-    add_run_to_para(p, pub["title"], bold=True, size=Pt(_theme.sizes.body_pt), color=_theme.colors.primary_rgb)
-    add_run_to_para(
-        p, f"\n{pub['year']}: {pub['venue']}", size=Pt(_theme.sizes.small_pt), color=_theme.colors.text_muted_rgb
-    )
+    p.paragraph_format.space_before = _PT[4]
+    p.paragraph_format.space_after = _PT[2]
+    add_run_to_para(p, pub["title"], bold=True, size=_sz.body, color=_theme.colors.primary_rgb)
+    add_run_to_para(p, f"\n{pub['year']}: {pub['venue']}", size=_sz.small, color=_theme.colors.text_muted_rgb)
 
     image_path = resolve_asset(pub["image"]) if pub.get("image") else None
     if pub.get("image") and not image_path:
@@ -717,14 +776,13 @@ def _render_publication(cell, pub, image_height_cm=3.6):
         )
     if image_path and image_path.exists():
         p_img = cell.add_paragraph()
-        p_img.paragraph_format.space_before = Pt(4)
-        p_img.paragraph_format.space_after = Pt(4)
+        p_img.paragraph_format.space_before = _PT[4]
+        p_img.paragraph_format.space_after = _PT[4]
         add_inline_picture(p_img.add_run(), image_path, height=Cm(image_height_cm))
 
 
-def build_main_featured_publications(cell, cv, lang="en"):
+def build_main_featured_publications(cell, cv, L):
     """Render featured publications as a highlight block at the top of the main column."""
-    L = get_labels(lang)
     featured = [pub for pub in cv.get("publications", []) if pub.get("featured")]
     if not featured:
         return
@@ -733,8 +791,7 @@ def build_main_featured_publications(cell, cv, lang="en"):
         _render_publication(cell, pub, image_height_cm=4.5)
 
 
-def build_main_publications(cell, cv, lang="en"):
-    L = get_labels(lang)
+def build_main_publications(cell, cv, L):
     # Featured publications are rendered separately at the top — skip them here
     pubs = [pub for pub in cv.get("publications", []) if not pub.get("featured")]
     if not pubs:
@@ -744,7 +801,7 @@ def build_main_publications(cell, cv, lang="en"):
         _render_publication(cell, pub)
 
 
-def build_main_custom_section(cell, title, items, lang="en"):
+def build_main_custom_section(cell, title, items):
     """Render a user-defined custom section with heuristic layout.
 
     Supports three item shapes:
@@ -760,14 +817,11 @@ def build_main_custom_section(cell, title, items, lang="en"):
     for item in items:
         if isinstance(item, str):
             # Simple string → bullet
-            p = cell.add_paragraph(style="List Bullet")
-            p.paragraph_format.space_before = Pt(1)
-            p.paragraph_format.space_after = Pt(1)
-            p.text = ""
+            p = _add_bullet_para(cell)
             add_run_to_para(
                 p,
                 item,
-                size=Pt(_theme.sizes.small_pt),
+                size=_sz.small,
                 color=_theme.colors.text_body_rgb,
                 font_name=_theme.fonts.body,
             )
@@ -782,13 +836,13 @@ def build_main_custom_section(cell, title, items, lang="en"):
                 if org:
                     title_text += f" — {org}"
                 p_title = cell.add_paragraph()
-                p_title.paragraph_format.space_before = Pt(6)
-                p_title.paragraph_format.space_after = Pt(1)
+                p_title.paragraph_format.space_before = _PT[6]
+                p_title.paragraph_format.space_after = _PT[1]
                 add_run_to_para(
                     p_title,
                     title_text,
                     bold=True,
-                    size=Pt(_theme.sizes.body_pt),
+                    size=_sz.body,
                     color=_theme.colors.primary_rgb,
                 )
                 dates = f"{item.get('start', '')} — {item.get('end', '')}".strip(" —")
@@ -796,9 +850,9 @@ def build_main_custom_section(cell, title, items, lang="en"):
                     add_para(
                         cell,
                         dates,
-                        size=Pt(_theme.sizes.small_pt),
+                        size=_sz.small,
                         color=_theme.colors.text_muted_rgb,
-                        space_after=Pt(2),
+                        space_after=_PT[2],
                     )
             elif label:
                 # Description style (like certification)
@@ -806,13 +860,13 @@ def build_main_custom_section(cell, title, items, lang="en"):
                 if org:
                     title_text += f", {org}"
                 p_title = cell.add_paragraph()
-                p_title.paragraph_format.space_before = Pt(6)
-                p_title.paragraph_format.space_after = Pt(1)
+                p_title.paragraph_format.space_before = _PT[6]
+                p_title.paragraph_format.space_after = _PT[1]
                 add_run_to_para(
                     p_title,
                     title_text,
                     bold=True,
-                    size=Pt(_theme.sizes.body_pt),
+                    size=_sz.body,
                     color=_theme.colors.primary_rgb,
                 )
 
@@ -821,22 +875,19 @@ def build_main_custom_section(cell, title, items, lang="en"):
                 add_para(
                     cell,
                     item["description"],
-                    size=Pt(_theme.sizes.body_pt),
+                    size=_sz.body,
                     color=_theme.colors.text_body_rgb,
                     font_name=_theme.fonts.body,
-                    space_after=Pt(2),
+                    space_after=_PT[2],
                 )
 
             # Bullets
             for bullet in item.get("bullets", []):
-                p = cell.add_paragraph(style="List Bullet")
-                p.paragraph_format.space_before = Pt(1)
-                p.paragraph_format.space_after = Pt(1)
-                p.text = ""
+                p = _add_bullet_para(cell)
                 add_run_to_para(
                     p,
                     bullet,
-                    size=Pt(_theme.sizes.small_pt),
+                    size=_sz.small,
                     color=_theme.colors.text_body_rgb,
                     font_name=_theme.fonts.body,
                 )
@@ -847,7 +898,7 @@ def build_main_custom_section(cell, title, items, lang="en"):
                 if key in skip_keys:
                     continue
                 if isinstance(val, list):
-                    add_labeled_line(cell, key.replace("_", " ").title(), ", ".join(str(v) for v in val))
+                    add_labeled_line(cell, key.replace("_", " ").title(), ", ".join([str(v) for v in val]))
                 elif isinstance(val, str):
                     add_labeled_line(cell, key.replace("_", " ").title(), val)
 
@@ -865,75 +916,119 @@ def _init_doc(layout):
         section.right_margin = Cm(layout.page_right_margin_cm)
     style = doc.styles["Normal"]
     style.font.name = _theme.fonts.heading
-    style.font.size = Pt(_theme.sizes.body_pt)
+    style.font.size = _sz.body
     style.font.color.rgb = _theme.colors.text_body_rgb
-    style.paragraph_format.space_after = Pt(0)
-    style.paragraph_format.space_before = Pt(0)
+    style.paragraph_format.space_after = _PT[0]
+    style.paragraph_format.space_before = _PT[0]
     return doc
 
 
-def _build_all_main_sections(cell, cv, lang):
-    """Build all main-column sections into a cell (or document body proxy)."""
-    build_main_profile(cell, cv, lang)
-    build_main_featured_publications(cell, cv, lang)
-    build_main_experience(cell, cv, lang)
-    build_main_education(cell, cv, lang)
-    build_main_volunteering(cell, cv, lang)
-    build_main_references(cell, cv, lang)
-    build_main_certifications(cell, cv, lang)
-    build_main_publications(cell, cv, lang)
+# Main-column sections in render order, each with the CV field that must be non-empty for it to render
+_MAIN_SECTIONS = (
+    ("profile", build_main_profile),
+    ("publications", build_main_featured_publications),
+    ("experience", build_main_experience),
+    ("education", build_main_education),
+    ("volunteering", build_main_volunteering),
+    ("references", build_main_references),
+    ("certifications", build_main_certifications),
+    ("publications", build_main_publications),
+)
+# Academic order: profile, publications, experience, education, rest
+_ACADEMIC_MAIN_SECTIONS = (
+    ("profile", build_main_profile),
+    ("publications", build_main_featured_publications),
+    ("publications", build_main_publications),
+    ("experience", build_main_experience),
+    ("education", build_main_education),
+    ("volunteering", build_main_volunteering),
+    ("references", build_main_references),
+    ("certifications", build_main_certifications),
+)
+# Compact renders its own profile (without testimonials) ahead of these
+_COMPACT_MAIN_SECTIONS = _MAIN_SECTIONS[1:]
+
+
+def _build_all_main_sections(cell, cv, L, sections=_MAIN_SECTIONS):
+    """Build the present main-column sections, then custom sections, into a cell (or document body proxy)."""
+    for key, builder in sections:
+        if cv.get(key):
+            builder(cell, cv, L)
     for section_key, items in get_custom_sections(cv).items():
-        build_main_custom_section(cell, section_key, items, lang)
+        build_main_custom_section(cell, section_key, items)
+
 
+_TBL_LOOK_XML = (
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+    'w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+)
 
-def _make_sidebar_float(table, layout):
-    """Pin a table as a page-anchored float at the top-left text area.
 
-    Body text wraps to the right of the float on the first page; on subsequent
-    pages there is no float, so the main content flows across the full width.
+def _add_layout_table(doc, cells, float_at=None):
+    """Append a borderless one-row layout table, parsed from a single XML template.
+
+    ``cells`` holds ``(width_cm, fill, (top, bottom, left, right))`` per column: the
+    cell width, a hex shading colour or None, and the cell margins in cm.
+
+    With ``float_at=(x_cm, y_cm)`` the table is pinned as a page-anchored float at
+    that offset with a fixed layout. Body text wraps to the right of the float on
+    the first page; on subsequent pages there is no float, so the main content flows
+    across the full width.
     """
-    table.autofit = False
-    tblPr = table._tbl.tblPr
-    tblpPr = parse_xml(
-        f"<w:tblpPr {nsdecls('w')} "
-        'w:leftFromText="0" w:rightFromText="170" w:topFromText="0" w:bottomFromText="142" '
-        'w:vertAnchor="page" w:horzAnchor="page" '
-        f'w:tblpX="{int(layout.page_left_margin_cm * 567)}" '
-        f'w:tblpY="{int(layout.page_top_margin_cm * 567)}"/>'
+    tbl_pr = ""
+    if float_at is not None:
+        # CT_TblPr child order: tblpPr must precede tblOverlap, both ahead of tblW
+        tbl_pr += (
+            '<w:tblpPr w:leftFromText="0" w:rightFromText="170" w:topFromText="0" w:bottomFromText="142" '
+            'w:vertAnchor="page" w:horzAnchor="page" '
+            f'w:tblpX="{_twips(float_at[0])}" w:tblpY="{_twips(float_at[1])}"/>'
+            '<w:tblOverlap w:val="never"/>'
+        )
+    tbl_pr += '<w:tblW w:type="auto" w:w="0"/>'
+    if float_at is not None:
+        tbl_pr += '<w:tblLayout w:type="fixed"/>'
+    tbl_pr += _TBL_LOOK_XML + _TBL_BORDERS_XML
+
+    grid, tcs = [], []
+    for width_cm, fill, (top, bottom, left, right) in cells:
+        grid.append(f'<w:gridCol w:w="{_twips(width_cm)}"/>')
+        shading = f'<w:shd w:fill="{fill}" w:val="clear"/>' if fill else ""
+        margins = "".join(
+            f'<w:{side} w:w="{_twips(value)}" w:type="dxa"/>'
+            for side, value in (("top", top), ("left", left), ("bottom", bottom), ("right", right))
+        )
+        tcs.append(
+            f"<w:tc><w:tcPr>{shading}{_TC_BORDERS_XML}"
+            f'<w:tcW w:w="{_twips(width_cm)}" w:type="dxa"/><w:tcMar>{margins}</w:tcMar>'
+            "</w:tcPr><w:p/></w:tc>"
+        )
+
+    tbl = parse_xml(
+        f"<w:tbl {_NSDECLS_W}><w:tblPr>{tbl_pr}</w:tblPr>"
+        f"<w:tblGrid>{''.join(grid)}</w:tblGrid><w:tr>{''.join(tcs)}</w:tr></w:tbl>"
     )
-    tblOverlap = parse_xml(f'<w:tblOverlap {nsdecls("w")} w:val="never"/>')
-    # CT_TblPr child order: tblpPr must precede tblOverlap, both near the front.
-    tblPr.insert(0, tblOverlap)
-    tblPr.insert(0, tblpPr)
+    doc.element.body._insert_tbl(tbl)
+    return Table(tbl, doc._body)
 
 
-def _build_two_column_docx(doc, cv, lang):
+def _build_two_column_docx(doc, cv, lang, L):
     """Two-column layout: a floating sidebar pinned to the first page, with the
     main content flowing full-width — wrapping beside the sidebar on page 1 and
     using the entire page width on every following page."""
     layout = _theme.layout
 
-    table = doc.add_table(rows=1, cols=1)
-    remove_table_borders(table)
-    _make_sidebar_float(table, layout)
-
-    tblGrid = table._tbl.find(qn("w:tblGrid"))
-    if tblGrid is not None:
-        gridCols = tblGrid.findall(qn("w:gridCol"))
-        if gridCols:
-            gridCols[0].set(qn("w:w"), str(int(layout.sidebar_width_cm * 567)))
-
+    table = _add_layout_table(
+        doc,
+        [(layout.sidebar_width_cm, _theme.colors.primary, (0.4, 0.5, 0.3, 0.3))],
+        float_at=(layout.page_left_margin_cm, layout.page_top_margin_cm),
+    )
     sidebar = table.cell(0, 0)
-    set_cell_shading(sidebar, _theme.colors.primary)
-    remove_cell_borders(sidebar)
-    set_cell_width(sidebar, layout.sidebar_width_cm)
-    set_cell_margins(sidebar, top=0.4, bottom=0.5, left=0.3, right=0.3)
 
     build_sidebar_header(sidebar, cv, lang)
-    build_sidebar_contact(sidebar, cv, lang)
-    build_sidebar_links(sidebar, cv, lang)
-    build_sidebar_skills(sidebar, cv, lang)
-    build_sidebar_languages(sidebar, cv, lang)
+    build_sidebar_contact(sidebar, cv, L)
+    build_sidebar_links(sidebar, cv, L)
+    build_sidebar_skills(sidebar, cv, L)
+    build_sidebar_languages(sidebar, cv, L, lang)
 
     # Drop the empty leading paragraph so the main content starts at the top.
     if doc.paragraphs:
@@ -942,7 +1037,7 @@ def _build_two_column_docx(doc, cv, lang):
 
     # Main content flows in the body and wraps around the floating sidebar.
     proxy = _DocProxy(doc)
-    _build_all_main_sections(proxy, cv, lang)
+    _build_all_main_sections(proxy, cv, L)
 
 
 class _DocProxy:
@@ -965,20 +1060,20 @@ def _build_single_column_header(doc, cv, lang):
     # Name
     p_name = doc.add_paragraph()
     p_name.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p_name.paragraph_format.space_after = Pt(2)
+    p_name.paragraph_format.space_after = _PT[2]
     run = p_name.add_run(cv["name"])
     run.bold = True
-    run.font.size = Pt(_theme.sizes.name_pt)
+    run.font.size = _sz.name
     run.font.color.rgb = _theme.colors.primary_rgb
     run.font.name = _theme.fonts.heading
 
     # Title
     p_title = doc.add_paragraph()
     p_title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p_title.paragraph_format.space_after = Pt(6)
+    p_title.paragraph_format.space_after = _PT[6]
     run = p_title.add_run(cv["title"])
     run.italic = True
-    run.font.size = Pt(_theme.sizes.body_pt)
+    run.font.size = _sz.body
     run.font.color.rgb = _theme.colors.text_muted_rgb
     run.font.name = _theme.fonts.heading
 
@@ -988,9 +1083,9 @@ def _build_single_column_header(doc, cv, lang):
     if parts:
         p = doc.add_paragraph()
         p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        p.paragraph_format.space_after = Pt(4)
+        p.paragraph_format.space_after = _PT[4]
         run = p.add_run(" | ".join(parts))
-        run.font.size = Pt(_theme.sizes.small_pt)
+        run.font.size = _sz.small
         run.font.color.rgb = _theme.colors.text_muted_rgb
         run.font.name = _theme.fonts.body
 
@@ -999,126 +1094,96 @@ def _build_single_column_header(doc, cv, lang):
     if links:
         p = doc.add_paragraph()
         p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        p.paragraph_format.space_after = Pt(8)
+        p.paragraph_format.space_after = _PT[8]
         for i, lk in enumerate(links):
             if i > 0:
                 run = p.add_run("  |  ")
-                run.font.size = Pt(_theme.sizes.small_pt)
+                run.font.size = _sz.small
                 run.font.color.rgb = _theme.colors.text_muted_rgb
             if lk.get("url"):
-                add_hyperlink(p, lk["url"], lk["label"], size=Pt(_theme.sizes.small_pt))
+                add_hyperlink(p, lk["url"], lk["label"], size=_sz.small)
             else:
                 run = p.add_run(lk["label"])
-                run.font.size = Pt(_theme.sizes.small_pt)
+                run.font.size = _sz.small
                 run.font.color.rgb = _theme.colors.accent_rgb
 
 
-def _build_single_column_docx(doc, cv, lang):
+def _build_single_column_docx(doc, cv, lang, L):
     """Single-column layout — no sidebar, all sections sequential."""
     _build_single_column_header(doc, cv, lang)
     proxy = _DocProxy(doc)
-    _build_all_main_sections(proxy, cv, lang)
+    _build_all_main_sections(proxy, cv, L)
 
 
-def _build_academic_docx(doc, cv, lang):
+def _build_academic_docx(doc, cv, lang, L):
     """Academic layout — single-column, publications prioritised before experience."""
     _build_single_column_header(doc, cv, lang)
     proxy = _DocProxy(doc)
-
-    # Academic order: profile, publications, experience, education, rest
-    build_main_profile(proxy, cv, lang)
-    build_main_featured_publications(proxy, cv, lang)
-    build_main_publications(proxy, cv, lang)
-    build_main_experience(proxy, cv, lang)
-    build_main_education(proxy, cv, lang)
-    build_main_volunteering(proxy, cv, lang)
-    build_main_references(proxy, cv, lang)
-    build_main_certifications(proxy, cv, lang)
-    for section_key, items in get_custom_sections(cv).items():
-        build_main_custom_section(proxy, section_key, items, lang)
+    _build_all_main_sections(proxy, cv, L, _ACADEMIC_MAIN_SECTIONS)
 
 
-def _build_compact_docx(doc, cv, lang):
+def _build_compact_docx(doc, cv, lang, L):
     """Compact two-column layout — tighter spacing, skip testimonials and photo."""
     layout = _theme.layout
 
-    table = doc.add_table(rows=1, cols=2)
-    remove_table_borders(table)
-
-    tbl = table._tbl
-    tblGrid = tbl.find(qn("w:tblGrid"))
-    if tblGrid is not None:
-        gridCols = tblGrid.findall(qn("w:gridCol"))
-        if len(gridCols) >= 2:
-            gridCols[0].set(qn("w:w"), str(int(layout.sidebar_width_cm * 567)))
-            gridCols[1].set(qn("w:w"), str(int(layout.main_width_cm * 567)))
-
+    table = _add_layout_table(
+        doc,
+        [
+            (layout.sidebar_width_cm, _theme.colors.primary, (0.3, 0.3, 0.2, 0.2)),
+            (layout.main_width_cm, None, (0.2, 0.3, 0.4, 0.2)),
+        ],
+    )
     sidebar = table.cell(0, 0)
     main = table.cell(0, 1)
 
-    set_cell_shading(sidebar, _theme.colors.primary)
-    remove_cell_borders(sidebar)
-    set_cell_width(sidebar, layout.sidebar_width_cm)
-    set_cell_margins(sidebar, top=0.3, bottom=0.3, left=0.2, right=0.2)
-
-    remove_cell_borders(main)
-    set_cell_width(main, layout.main_width_cm)
-    set_cell_margins(main, top=0.2, bottom=0.3, left=0.4, right=0.2)
-
     # Compact sidebar — skip photo, add header without photo
     compact_cv = dict(cv)
     compact_cv["photo"] = ""  # Skip photo for compactness
     build_sidebar_header(sidebar, compact_cv, lang)
-    build_sidebar_contact(sidebar, cv, lang)
-    build_sidebar_links(sidebar, cv, lang)
-    build_sidebar_skills(sidebar, cv, lang)
-    build_sidebar_languages(sidebar, cv, lang)
+    build_sidebar_contact(sidebar, cv, L)
+    build_sidebar_links(sidebar, cv, L)
+    build_sidebar_skills(sidebar, cv, L)
+    build_sidebar_languages(sidebar, cv, L, lang)
 
     main.paragraphs[0].text = ""
 
     # Compact main — skip testimonials
-    L = get_labels(lang)
     if cv.get("profile"):
         add_section_heading(main, L["profile"], icon_key="Profile")
         add_para(
             main,
             cv["profile"].strip(),
-            size=Pt(_theme.sizes.body_pt),
+            size=_sz.body,
             color=_theme.colors.text_body_rgb,
             font_name=_theme.fonts.body,
-            space_after=Pt(4),
+            space_after=_PT[4],
         )
-    build_main_featured_publications(main, cv, lang)
-    build_main_experience(main, cv, lang)
-    build_main_education(main, cv, lang)
-    build_main_volunteering(main, cv, lang)
-    build_main_references(main, cv, lang)
-    build_main_certifications(main, cv, lang)
-    build_main_publications(main, cv, lang)
-    for section_key, items in get_custom_sections(cv).items():
-        build_main_custom_section(main, section_key, items, lang)
+    _build_all_main_sections(main, cv, L, _COMPACT_MAIN_SECTIONS)
 
 
 def build_docx(cv: dict, lang: str, theme: Optional[Theme] = None) -> Path:
     """Build a complete Word document from CV data."""
-    global _theme
+    global _theme, _sz
     _theme = theme or load_theme()
+    _sz = _theme_sizes(_theme)
 
     layout = _theme.layout
     doc = _init_doc(layout)
 
+    # Labels are resolved once per build; for translated CVs this reads the language cache file
+    L = get_labels(lang)
     layout_type = layout.layout_type
     if layout_type == "single-column":
-        _build_single_column_docx(doc, cv, lang)
+        _build_single_column_docx(doc, cv, lang, L)
     elif layout_type == "academic":
-        _build_academic_docx(doc, cv, lang)
+        _build_academic_docx(doc, cv, lang, L)
     elif layout_type == "compact":
-        _build_compact_docx(doc, cv, lang)
+        _build_compact_docx(doc, cv, lang, L)
     else:
-        _build_two_column_docx(doc, cv, lang)
+        _build_two_column_docx(doc, cv, lang, L)
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     filename = f"{slugify_name(cv['name'])}_CV_{lang.upper()}.docx"
     output_path = OUTPUT_DIR / filename
-    doc.save(str(output_path))
+    save_docx(doc, output_path)
     return output_path
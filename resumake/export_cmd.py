@@ -1,21 +1,22 @@
 """Export command — convert CV to Markdown, HTML, JSON, or plain text."""
 
 import json
+import re
+from io import StringIO
 from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
 
 from .console import console
-from .schema import get_custom_sections
-from .utils import DEFAULT_YAML, OUTPUT_DIR, load_cv, open_file, slugify_name
+from .utils import DEFAULT_YAML, OUTPUT_DIR, escape_html, get_custom_sections, load_cv, open_file, slugify_name
 
 
 def _cv_to_markdown(cv: dict) -> str:
     """Convert CV dict to Markdown."""
     lines = []
     lines.append(f"# {cv['name']}")
-    lines.append(f"**{cv['title']}**\n")
+    lines.extend((f"**{cv['title']}**", ""))
 
     contact = cv.get("contact", {})
     contact_parts = []
@@ -26,75 +27,75 @@ def _cv_to_markdown(cv: dict) -> str:
     if contact.get("address"):
         contact_parts.append(contact["address"])
     if contact_parts:
-        lines.append(" | ".join(contact_parts) + "\n")
+        lines.extend((" | ".join(contact_parts), ""))
 
     links = cv.get("links", [])
     if links:
-        lines.append(" | ".join(f"[{lk['label']}]({lk['url']})" for lk in links) + "\n")
+        lines.extend((" | ".join(f"[{lk['label']}]({lk['url']})" for lk in links), ""))
 
     if cv.get("profile"):
-        lines.append("## Profile\n")
-        lines.append(cv["profile"].strip() + "\n")
+        lines.extend(("## Profile", ""))
+        lines.extend((cv["profile"].strip(), ""))
 
     skills = cv.get("skills", {})
     if skills:
-        lines.append("## Skills\n")
+        lines.extend(("## Skills", ""))
         if skills.get("leadership"):
-            lines.append(f"**Leadership:** {', '.join(skills['leadership'])}\n")
+            lines.extend((f"**Leadership:** {', '.join(skills['leadership'])}", ""))
         if skills.get("technical"):
-            lines.append(f"**Technical:** {', '.join(skills['technical'])}\n")
+            lines.extend((f"**Technical:** {', '.join(skills['technical'])}", ""))
         if skills.get("languages"):
             lang_strs = [f"{lg['name']} ({lg['level']})" for lg in skills["languages"]]
-            lines.append(f"**Languages:** {', '.join(lang_strs)}\n")
+            lines.extend((f"**Languages:** {', '.join(lang_strs)}", ""))
 
     if cv.get("experience"):
-        lines.append("## Experience\n")
+        lines.extend(("## Experience", ""))
         for exp in cv["experience"]:
             org_part = f" — {exp['org']}" if exp.get("org") else ""
             lines.append(f"### {exp['title']}{org_part}")
-            lines.append(f"*{exp['start']} — {exp['end']}*\n")
+            lines.extend((f"*{exp['start']} — {exp['end']}*", ""))
             if exp.get("description"):
-                lines.append(f"{exp['description']}\n")
+                lines.extend((f"{exp['description']}", ""))
             for bullet in exp.get("bullets", []):
                 lines.append(f"- {bullet}")
             lines.append("")
 
     if cv.get("education"):
-        lines.append("## Education\n")
+        lines.extend(("## Education", ""))
         for edu in cv["education"]:
             lines.append(f"### {edu['degree']}, {edu['institution']}")
-            lines.append(f"*{edu['start']} — {edu['end']}*\n")
+            lines.extend((f"*{edu['start']} — {edu['end']}*", ""))
             if edu.get("description"):
-                lines.append(f"{edu['description']}\n")
+                lines.extend((f"{edu['description']}", ""))
 
     if cv.get("certifications"):
-        lines.append("## Certifications\n")
+        lines.extend(("## Certifications", ""))
         for cert in cv["certifications"]:
             org_part = f", {cert['org']}" if cert.get("org") else ""
             lines.append(f"- **{cert['name']}**{org_part} ({cert['start']} — {cert['end']})")
         lines.append("")
 
     if cv.get("publications"):
-        lines.append("## Publications\n")
+        lines.extend(("## Publications", ""))
         for pub in cv["publications"]:
             lines.append(f"- **{pub['title']}** — {pub['venue']}, {pub['year']}")
         lines.append("")
 
     if cv.get("volunteering"):
-        lines.append("## Volunteering\n")
+        lines.extend(("## Volunteering", ""))
         for vol in cv["volunteering"]:
             lines.append(f"### {vol['title']} — {vol['org']}")
-            lines.append(f"*{vol['start']} — {vol['end']}*\n")
+            lines.extend((f"*{vol['start']} — {vol['end']}*", ""))
             if vol.get("description"):
-                lines.append(f"{vol['description']}\n")
+                lines.extend((f"{vol['description']}", ""))
 
     if cv.get("references"):
-        lines.append("## References\n")
-        lines.append(cv["references"] + "\n")
+        lines.extend(("## References", ""))
+        lines.extend((cv["references"], ""))
 
     for section_key, items in get_custom_sections(cv).items():
         heading = section_key.replace("_", " ").title()
-        lines.append(f"## {heading}\n")
+        lines.extend((f"## {heading}", ""))
         for item in items:
             if isinstance(item, str):
                 lines.append(f"- {item}")
@@ -114,41 +115,7 @@ def _cv_to_markdown(cv: dict) -> str:
     return "\n".join(lines)
 
 
-def _cv_to_html(cv: dict) -> str:
-    """Convert CV dict to a self-contained HTML page."""
-    md = _cv_to_markdown(cv)
-    # Simple markdown-to-html conversion for the most common elements
-    import re
-
-    html_body = md
-    # Headers
-    html_body = re.sub(r"^### (.+)$", r"<h3>\1</h3>", html_body, flags=re.MULTILINE)
-    html_body = re.sub(r"^## (.+)$", r"<h2>\1</h2>", html_body, flags=re.MULTILINE)
-    html_body = re.sub(r"^# (.+)$", r"<h1>\1</h1>", html_body, flags=re.MULTILINE)
-    # Bold and italic
-    html_body = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", html_body)
-    html_body = re.sub(r"\*(.+?)\*", r"<em>\1</em>", html_body)
-    # Links
-    html_body = re.sub(r"\[(.+?)\]\((.+?)\)", r'<a href="\2">\1</a>', html_body)
-    # List items
-    html_body = re.sub(r"^- (.+)$", r"<li>\1</li>", html_body, flags=re.MULTILINE)
-    # Wrap consecutive <li> in <ul>
-    html_body = re.sub(r"((?:<li>.+</li>\n?)+)", r"<ul>\1</ul>", html_body)
-    # Paragraphs for remaining lines
-    lines = html_body.split("\n")
-    result = []
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            result.append("")
-        elif stripped.startswith("<"):
-            result.append(stripped)
-        else:
-            result.append(f"<p>{stripped}</p>")
-    html_body = "\n".join(result)
-
-    name = cv.get("name", "CV")
-    return f"""<!DOCTYPE html>
+_HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="utf-8">
@@ -167,11 +134,140 @@ def _cv_to_html(cv: dict) -> str:
 </style>
 </head>
 <body>
-{html_body}
-</body>
+"""
+_HTML_TAIL = """</body>
 </html>"""
 
 
+# Inline markdown allowed in CV text fields, compiled once
+_MD_BOLD = re.compile(r"\*\*(.+?)\*\*")
+_MD_ITALIC = re.compile(r"\*(.+?)\*")
+_MD_LINK = re.compile(r"\[(.+?)\]\((.+?)\)")
+
+
+def _inline_html(text) -> str:
+    """Escape free text, then render its inline markdown (**bold**, *italic*, [label](url)) as HTML."""
+    html = escape_html(str(text))
+    html = _MD_BOLD.sub(r"<strong>\1</strong>", html)
+    html = _MD_ITALIC.sub(r"<em>\1</em>", html)
+    return _MD_LINK.sub(r'<a href="\2">\1</a>', html)
+
+
+def _cv_to_html(cv: dict) -> str:
+    """Convert CV dict to a self-contained HTML page.
+
+    Elements are written straight into one buffer in document order; every CV
+    value is HTML-escaped on the way in, and free-text fields (profile, descriptions,
+    bullets) keep their inline markdown.
+    """
+    out = StringIO()
+    w = out.write
+
+    def paras(text) -> None:
+        for line in str(text).splitlines():
+            if line.strip():
+                w(f"<p>{_inline_html(line.strip())}</p>\n")
+
+    def dated(heading: str, entry: dict) -> None:
+        start, end = escape_html(str(entry["start"])), escape_html(str(entry["end"]))
+        w(f"<h3>{heading}</h3>\n<p><em>{start} — {end}</em></p>\n")
+        if entry.get("description"):
+            paras(entry["description"])
+
+    def bullet_list(items) -> None:
+        w("<ul>\n")
+        for item in items:
+            w(f"<li>{item}</li>\n")
+        w("</ul>\n")
+
+    w(_HTML_HEAD.format(name=escape_html(cv.get("name", "CV"))))
+    w(f"<h1>{escape_html(cv['name'])}</h1>\n<p><strong>{escape_html(cv['title'])}</strong></p>\n")
+
+    contact = cv.get("contact", {})
+    contact_parts = [escape_html(contact[k]) for k in ("email", "phone", "address") if contact.get(k)]
+    if contact_parts:
+        w(f"<p>{' | '.join(contact_parts)}</p>\n")
+
+    links = cv.get("links", [])
+    if links:
+        anchors = (f'<a href="{escape_html(lk["url"])}">{escape_html(lk["label"])}</a>' for lk in links)
+        w(f"<p>{' | '.join(anchors)}</p>\n")
+
+    if cv.get("profile"):
+        w("<h2>Profile</h2>\n")
+        paras(cv["profile"])
+
+    skills = cv.get("skills", {})
+    if skills:
+        w("<h2>Skills</h2>\n")
+        if skills.get("leadership"):
+            w(f"<p><strong>Leadership:</strong> {escape_html(', '.join(skills['leadership']))}</p>\n")
+        if skills.get("technical"):
+            w(f"<p><strong>Technical:</strong> {escape_html(', '.join(skills['technical']))}</p>\n")
+        if skills.get("languages"):
+            lang_strs = ", ".join(f"{lg['name']} ({lg['level']})" for lg in skills["languages"])
+            w(f"<p><strong>Languages:</strong> {escape_html(lang_strs)}</p>\n")
+
+    if cv.get("experience"):
+        w("<h2>Experience</h2>\n")
+        for exp in cv["experience"]:
+            org_part = f" — {escape_html(exp['org'])}" if exp.get("org") else ""
+            dated(f"{escape_html(exp['title'])}{org_part}", exp)
+            if exp.get("bullets"):
+                bullet_list(_inline_html(b) for b in exp["bullets"])
+
+    if cv.get("education"):
+        w("<h2>Education</h2>\n")
+        for edu in cv["education"]:
+            dated(f"{escape_html(edu['degree'])}, {escape_html(edu['institution'])}", edu)
+
+    if cv.get("certifications"):
+        w("<h2>Certifications</h2>\n")
+        bullet_list(
+            f"<strong>{escape_html(cert['name'])}</strong>{', ' + escape_html(cert['org']) if cert.get('org') else ''}"
+            f" ({escape_html(str(cert['start']))} — {escape_html(str(cert['end']))})"
+            for cert in cv["certifications"]
+        )
+
+    if cv.get("publications"):
+        w("<h2>Publications</h2>\n")
+        bullet_list(
+            f"<strong>{escape_html(pub['title'])}</strong> — "
+            f"{escape_html(pub['venue'])}, {escape_html(str(pub['year']))}"
+            for pub in cv["publications"]
+        )
+
+    if cv.get("volunteering"):
+        w("<h2>Volunteering</h2>\n")
+        for vol in cv["volunteering"]:
+            dated(f"{escape_html(vol['title'])} — {escape_html(vol['org'])}", vol)
+
+    if cv.get("references"):
+        w("<h2>References</h2>\n")
+        paras(cv["references"])
+
+    for section_key, items in get_custom_sections(cv).items():
+        w(f"<h2>{escape_html(section_key.replace('_', ' ').title())}</h2>\n<ul>\n")
+        for item in items:
+            if isinstance(item, str):
+                w(f"<li>{_inline_html(item)}</li>\n")
+            elif isinstance(item, dict):
+                label = item.get("title") or item.get("name") or ""
+                org_part = f", {escape_html(item['org'])}" if item.get("org") else ""
+                dates = ""
+                if item.get("start"):
+                    dates = f" ({escape_html(str(item['start']))} — {escape_html(str(item.get('end', '')))})"
+                parts = [f"<strong>{escape_html(label)}</strong>{org_part}{dates}"] if label else []
+                if item.get("description"):
+                    parts.append(_inline_html(item["description"]))
+                if parts:
+                    w(f"<li>{'<br>'.join(parts)}</li>\n")
+        w("</ul>\n")
+
+    w(_HTML_TAIL)
+    return out.getvalue()
+
+
 def _cv_to_plaintext(cv: dict) -> str:
     """Convert CV dict to ATS-friendly plain text."""
     lines = []
@@ -374,7 +470,8 @@ def export(
         output = OUTPUT_DIR / f"{slug}_CV.{ext}"
 
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(content, encoding="utf-8")
+    # Encoded in one step; no newline translation, so exports use \n line endings on every platform
+    output.write_bytes(content.encode("utf-8"))
     console.print(f"Exported: [cyan]{output}[/]")
 
     if open:
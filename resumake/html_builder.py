@@ -1,10 +1,29 @@
 """HTML builder — generates print-optimized, themed HTML matching the DOCX layout."""
 
 import base64
+import mmap
+from functools import lru_cache
+from pathlib import Path
+from typing import TextIO
 
-from .schema import get_custom_sections
-from .theme import Theme, load_theme
-from .utils import get_labels, resolve_asset
+from .theme import Theme, ThemeColors, ThemeFonts, ThemeLayout, ThemeSizes, load_theme
+from .utils import escape_html, get_custom_sections, get_labels, resolve_asset
+
+try:
+    import pybase64
+except ImportError:  # optional "fast" extra
+    pybase64 = None
+
+
+# Images at least this large are base64-encoded straight from a read-only mmap
+_MMAP_MIN_BYTES = 64 * 1024
+
+
+def _b64encode(data) -> str:
+    """Base64-encode any bytes-like object to str (SIMD pybase64 when installed)."""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode()
 
 
 def _encode_photo_base64(photo_ref: str | None) -> str | None:
@@ -12,30 +31,49 @@ def _encode_photo_base64(photo_ref: str | None) -> str | None:
     if not photo_ref:
         return None
     path = resolve_asset(photo_ref)
-    if not path or not path.exists():
+    if not path:
         return None
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return _encode_file_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=8)
+def _encode_file_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """Data URL for a file; the mtime/size arguments make an edited photo miss the cache."""
+    path = Path(path_str)
     suffix = path.suffix.lower().lstrip(".")
     mime = {"jpg": "jpeg", "jpeg": "jpeg", "png": "png", "gif": "gif"}.get(suffix, "png")
-    data = base64.b64encode(path.read_bytes()).decode()
+    if size < _MMAP_MIN_BYTES:
+        data = _b64encode(path.read_bytes())
+    else:
+        # Encode from the page cache rather than copying the whole image into a bytes object first
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            data = _b64encode(mapped)
     return f"data:image/{mime};base64,{data}"
 
 
-def _esc(text: str) -> str:
-    """HTML-escape a string."""
-    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
-
-
 def _date_range(item: dict) -> str:
     """Format 'start — end', dropping the dash when one side is empty."""
     return (item.get("start", "") + " — " + item.get("end", "")).strip(" —")
 
 
 def _build_css(theme: Theme) -> str:
-    """Generate CSS from theme settings."""
-    c = theme.colors
-    f = theme.fonts
-    s = theme.sizes
-    lay = theme.layout
+    """Generate CSS from theme settings.
+
+    Themes are mutable dataclasses, so the cache is keyed on their current field values.
+    """
+    return _cached_css(*(tuple(vars(part).values()) for part in (theme.colors, theme.fonts, theme.sizes, theme.layout)))
+
+
+@lru_cache(maxsize=32)
+def _cached_css(colors: tuple, fonts: tuple, sizes: tuple, layout: tuple) -> str:
+    return _render_css(ThemeColors(*colors), ThemeFonts(*fonts), ThemeSizes(*sizes), ThemeLayout(*layout))
+
+
+def _render_css(c: ThemeColors, f: ThemeFonts, s: ThemeSizes, lay: ThemeLayout) -> str:
     return f"""
     @page {{
         size: A4;
@@ -192,9 +230,8 @@ def _build_css(theme: Theme) -> str:
     """
 
 
-def _render_sidebar_html(cv: dict, theme: Theme, lang: str) -> str:
-    """Render the sidebar column."""
-    L = get_labels(lang)
+def _render_sidebar_html(cv: dict, theme: Theme, LE: dict[str, str]) -> list[str]:
+    """Render the sidebar column as a list of lines. ``LE`` holds the already-escaped labels."""
     parts = []
 
     # Photo
@@ -203,270 +240,256 @@ def _render_sidebar_html(cv: dict, theme: Theme, lang: str) -> str:
         parts.append(f'<img class="photo" src="{photo_url}" alt="Photo">')
 
     # Name
-    parts.append(f"<h1>{_esc(cv['name'])}</h1>")
-    parts.append(f'<div class="title">{_esc(cv["title"])}</div>')
+    parts.append(f"<h1>{escape_html(cv['name'])}</h1>")
+    parts.append(f'<div class="title">{escape_html(cv["title"])}</div>')
 
     # Contact
     contact = cv.get("contact", {})
-    parts.append(f'<div class="sidebar-section-title">{_esc(L["details"])}</div>')
+    parts.append(f'<div class="sidebar-section-title">{LE["details"]}</div>')
     for field in ("address", "phone", "email"):
         if contact.get(field):
-            parts.append(f'<div class="sidebar-text">{_esc(contact[field])}</div>')
+            parts.append(f'<div class="sidebar-text">{escape_html(contact[field])}</div>')
     if contact.get("nationality"):
-        parts.append(f'<div class="sidebar-label">{_esc(L["nationality"])}</div>')
-        parts.append(f'<div class="sidebar-text">{_esc(contact["nationality"])}</div>')
+        parts.append(f'<div class="sidebar-label">{LE["nationality"]}</div>')
+        parts.append(f'<div class="sidebar-text">{escape_html(contact["nationality"])}</div>')
 
     # Links
     links = cv.get("links", [])
     if links:
-        parts.append(f'<div class="sidebar-section-title">{_esc(L["links"])}</div>')
+        parts.append(f'<div class="sidebar-section-title">{LE["links"]}</div>')
         for lk in links:
             if lk.get("url"):
-                parts.append(f'<a href="{_esc(lk["url"])}">{_esc(lk["label"])}</a><br>')
+                parts.append(f'<a href="{escape_html(lk["url"])}">{escape_html(lk["label"])}</a><br>')
             else:
-                parts.append(f'<div class="sidebar-text">{_esc(lk["label"])}</div>')
+                parts.append(f'<div class="sidebar-text">{escape_html(lk["label"])}</div>')
 
     # Skills
     skills = cv.get("skills", {})
     if skills:
-        parts.append(f'<div class="sidebar-section-title">{_esc(L["skills"])}</div>')
+        parts.append(f'<div class="sidebar-section-title">{LE["skills"]}</div>')
         if skills.get("leadership"):
-            parts.append(f'<div class="sidebar-label">{_esc(L["leadership_skills"])}</div>')
+            parts.append(f'<div class="sidebar-label">{LE["leadership_skills"]}</div>')
             for s in skills["leadership"]:
-                parts.append(f'<div class="sidebar-text">{_esc(s)}</div>')
+                parts.append(f'<div class="sidebar-text">{escape_html(s)}</div>')
         if skills.get("technical"):
-            parts.append(f'<div class="sidebar-label">{_esc(L["technical_skills"])}</div>')
+            parts.append(f'<div class="sidebar-label">{LE["technical_skills"]}</div>')
             for s in skills["technical"]:
-                parts.append(f'<div class="sidebar-text">{_esc(s)}</div>')
+                parts.append(f'<div class="sidebar-text">{escape_html(s)}</div>')
 
     # Languages
     languages = skills.get("languages", [])
     if languages:
-        parts.append(f'<div class="sidebar-section-title">{_esc(L["languages"])}</div>')
+        parts.append(f'<div class="sidebar-section-title">{LE["languages"]}</div>')
         for lg in languages:
             level = lg.get("level", "")
-            parts.append(f'<div class="sidebar-text">{_esc(lg["name"])} ({_esc(level)})</div>')
+            parts.append(f'<div class="sidebar-text">{escape_html(lg["name"])} ({escape_html(level)})</div>')
 
-    return "\n".join(parts)
+    return parts
 
 
 def _render_publication_parts(pub: dict) -> list[str]:
     """Render a single publication entry (title, year/venue, optional cover image)."""
     parts = [
-        f'<div class="entry-title">{_esc(pub["title"])}</div>',
-        f'<div class="entry-dates">{pub["year"]}: {_esc(pub["venue"])}</div>',
+        f'<div class="entry-title">{escape_html(pub["title"])}</div>',
+        f'<div class="entry-dates">{pub["year"]}: {escape_html(pub["venue"])}</div>',
     ]
     if pub.get("image"):
         img_url = _encode_photo_base64(pub["image"])
         if img_url:
-            parts.append(f'<img class="pub-image" src="{img_url}" alt="{_esc(pub["title"])}">')
+            parts.append(f'<img class="pub-image" src="{img_url}" alt="{escape_html(pub["title"])}">')
     return parts
 
 
-def _render_main_html(cv: dict, theme: Theme, lang: str) -> str:
-    """Render the main content column."""
-    L = get_labels(lang)
+# Experience keys rendered explicitly; any other key is shown as a "Label: value" meta line
+_EXPERIENCE_FIELDS = frozenset({"title", "org", "start", "end", "description", "bullets"})
+
+
+def _render_main_html(cv: dict, theme: Theme, LE: dict[str, str]) -> list[str]:
+    """Render the main content column as a list of lines. ``LE`` holds the already-escaped labels."""
+    get = cv.get
+    profile, testimonials, experience = get("profile"), get("testimonials"), get("experience")
+    education, volunteering, references = get("education"), get("volunteering"), get("references")
+    certifications = get("certifications")
+    featured, pubs = [], []
+    for pub in get("publications", []):
+        (featured if pub.get("featured") else pubs).append(pub)
     parts = []
 
     # Profile
-    if cv.get("profile"):
-        parts.append(f'<div class="section-heading">{_esc(L["profile"])}</div>')
-        parts.append(f'<div class="body-text">{_esc(cv["profile"].strip())}</div>')
+    if profile:
+        parts.append(f'<div class="section-heading">{LE["profile"]}</div>')
+        parts.append(f'<div class="body-text">{escape_html(profile.strip())}</div>')
 
         # Testimonials under profile
-        if cv.get("testimonials"):
-            parts.append(f'<div class="entry-title">{_esc(L["testimonials_heading"])}</div>')
-            for t in cv["testimonials"]:
+        if testimonials:
+            parts.append(f'<div class="entry-title">{LE["testimonials_heading"]}</div>')
+            for t in testimonials:
                 if t.get("quote"):
-                    parts.append(f'<div class="testimonial-quote">"{_esc(t["quote"])}"</div>')
-                parts.append(f'<div class="testimonial-author">{_esc(t["name"])}</div>')
-                parts.append(f'<div class="testimonial-role">{_esc(t["role"])}, {_esc(t["org"])}</div>')
+                    parts.append(f'<div class="testimonial-quote">"{escape_html(t["quote"])}"</div>')
+                parts.append(f'<div class="testimonial-author">{escape_html(t["name"])}</div>')
+                parts.append(f'<div class="testimonial-role">{escape_html(t["role"])}, {escape_html(t["org"])}</div>')
 
     # Featured publications — highlight block at the top of the main column
-    featured = [pub for pub in cv.get("publications", []) if pub.get("featured")]
     if featured:
-        heading = L.get("featured_publications", "Featured Publication")
-        parts.append(f'<div class="section-heading">{_esc(heading)}</div>')
+        heading = LE.get("featured_publications", "Featured Publication")
+        parts.append(f'<div class="section-heading">{heading}</div>')
         for pub in featured:
             parts.extend(_render_publication_parts(pub))
 
     # Experience
-    if cv.get("experience"):
-        parts.append(f'<div class="section-heading">{_esc(L["experience"])}</div>')
-        for exp in cv["experience"]:
+    if experience:
+        parts.append(f'<div class="section-heading">{LE["experience"]}</div>')
+        for exp in experience:
             title_text = exp["title"]
             if exp.get("org"):
                 title_text += f" — {exp['org']}"
-            parts.append(f'<div class="entry-title">{_esc(title_text)}</div>')
-            parts.append(f'<div class="entry-dates">{_esc(_date_range(exp))}</div>')
+            parts.append(f'<div class="entry-title">{escape_html(title_text)}</div>')
+            parts.append(f'<div class="entry-dates">{escape_html(_date_range(exp))}</div>')
             if exp.get("description"):
-                parts.append(f'<div class="entry-desc">{_esc(exp["description"])}</div>')
+                parts.append(f'<div class="entry-desc">{escape_html(exp["description"])}</div>')
             if exp.get("bullets"):
                 parts.append('<ul class="bullets">')
                 for b in exp["bullets"]:
-                    parts.append(f"<li>{_esc(b)}</li>")
+                    parts.append(f"<li>{escape_html(b)}</li>")
                 parts.append("</ul>")
             # Meta fields
-            skip = {"title", "org", "start", "end", "description", "bullets"}
             for key, val in exp.items():
-                if key in skip:
+                if key in _EXPERIENCE_FIELDS:
                     continue
                 if isinstance(val, list) and val:
                     parts.append(
                         f'<div class="meta-line"><span class="meta-label">'
-                        f"{_esc(key.replace('_', ' ').title())}:</span> "
-                        f'<span class="meta-value">{_esc(", ".join(str(v) for v in val))}</span></div>'
+                        f"{escape_html(key.replace('_', ' ').title())}:</span> "
+                        f'<span class="meta-value">{escape_html(", ".join([str(v) for v in val]))}</span></div>'
                     )
                 elif isinstance(val, str):
                     parts.append(
                         f'<div class="meta-line"><span class="meta-label">'
-                        f"{_esc(key.replace('_', ' ').title())}:</span> "
-                        f'<span class="meta-value">{_esc(val)}</span></div>'
+                        f"{escape_html(key.replace('_', ' ').title())}:</span> "
+                        f'<span class="meta-value">{escape_html(val)}</span></div>'
                     )
 
     # Education
-    if cv.get("education"):
-        parts.append(f'<div class="section-heading">{_esc(L["education"])}</div>')
-        for edu in cv["education"]:
-            parts.append(f'<div class="entry-title">{_esc(edu["degree"])}, {_esc(edu["institution"])}</div>')
-            parts.append(f'<div class="entry-dates">{_esc(_date_range(edu))}</div>')
+    if education:
+        parts.append(f'<div class="section-heading">{LE["education"]}</div>')
+        for edu in education:
+            degree, institution = escape_html(edu["degree"]), escape_html(edu["institution"])
+            parts.append(f'<div class="entry-title">{degree}, {institution}</div>')
+            parts.append(f'<div class="entry-dates">{escape_html(_date_range(edu))}</div>')
             if edu.get("description"):
-                parts.append(f'<div class="body-text">{_esc(edu["description"])}</div>')
+                parts.append(f'<div class="body-text">{escape_html(edu["description"])}</div>')
             if edu.get("details"):
-                parts.append(f'<div class="entry-desc">{_esc(edu["details"])}</div>')
+                parts.append(f'<div class="entry-desc">{escape_html(edu["details"])}</div>')
 
     # Volunteering
-    if cv.get("volunteering"):
-        parts.append(f'<div class="section-heading">{_esc(L["volunteering"])}</div>')
-        for vol in cv["volunteering"]:
-            parts.append(f'<div class="entry-title">{_esc(vol["title"])} — {_esc(vol["org"])}</div>')
-            parts.append(f'<div class="entry-dates">{_esc(_date_range(vol))}</div>')
+    if volunteering:
+        parts.append(f'<div class="section-heading">{LE["volunteering"]}</div>')
+        for vol in volunteering:
+            parts.append(f'<div class="entry-title">{escape_html(vol["title"])} — {escape_html(vol["org"])}</div>')
+            parts.append(f'<div class="entry-dates">{escape_html(_date_range(vol))}</div>')
             if vol.get("description"):
-                parts.append(f'<div class="body-text">{_esc(vol["description"])}</div>')
+                parts.append(f'<div class="body-text">{escape_html(vol["description"])}</div>')
 
     # References
-    if cv.get("references"):
-        parts.append(f'<div class="section-heading">{_esc(L["references"])}</div>')
-        parts.append(f'<div class="body-text">{_esc(cv["references"])}</div>')
+    if references:
+        parts.append(f'<div class="section-heading">{LE["references"]}</div>')
+        parts.append(f'<div class="body-text">{escape_html(references)}</div>')
 
     # Certifications
-    if cv.get("certifications"):
-        parts.append(f'<div class="section-heading">{_esc(L["certifications"])}</div>')
-        for cert in cv["certifications"]:
+    if certifications:
+        parts.append(f'<div class="section-heading">{LE["certifications"]}</div>')
+        for cert in certifications:
             title_text = cert["name"]
             if cert.get("org"):
                 title_text += f", {cert['org']}"
-            parts.append(f'<div class="entry-title">{_esc(title_text)}</div>')
-            parts.append(f'<div class="entry-dates">{_esc(_date_range(cert))}</div>')
+            parts.append(f'<div class="entry-title">{escape_html(title_text)}</div>')
+            parts.append(f'<div class="entry-dates">{escape_html(_date_range(cert))}</div>')
             if cert.get("description"):
-                parts.append(f'<div class="body-text">{_esc(cert["description"])}</div>')
+                parts.append(f'<div class="body-text">{escape_html(cert["description"])}</div>')
 
     # Publications (featured ones are rendered separately at the top)
-    pubs = [pub for pub in cv.get("publications", []) if not pub.get("featured")]
     if pubs:
-        parts.append(f'<div class="section-heading">{_esc(L["publications"])}</div>')
+        parts.append(f'<div class="section-heading">{LE["publications"]}</div>')
         for pub in pubs:
             parts.extend(_render_publication_parts(pub))
 
     # Custom sections
     for section_key, items in get_custom_sections(cv).items():
         heading = section_key.replace("_", " ").title()
-        parts.append(f'<div class="section-heading">{_esc(heading)}</div>')
+        parts.append(f'<div class="section-heading">{escape_html(heading)}</div>')
         for item in items:
             if isinstance(item, str):
-                parts.append(f'<div class="body-text">• {_esc(item)}</div>')
+                parts.append(f'<div class="body-text">• {escape_html(item)}</div>')
             elif isinstance(item, dict):
-                label = item.get("title") or item.get("name") or ""
-                org = item.get("org", "")
+                get = item.get
+                label = get("title") or get("name")
+                org, start, desc = get("org"), get("start"), get("description")
                 if label:
-                    title_text = label
-                    if org:
-                        title_text += f", {org}"
-                    parts.append(f'<div class="entry-title">{_esc(title_text)}</div>')
-                if item.get("start"):
-                    dates = f"{item['start']} — {item.get('end', '')}"
-                    parts.append(f'<div class="entry-dates">{_esc(dates)}</div>')
-                if item.get("description"):
-                    parts.append(f'<div class="body-text">{_esc(item["description"])}</div>')
+                    title_text = f"{label}, {org}" if org else label
+                    parts.append(f'<div class="entry-title">{escape_html(title_text)}</div>')
+                if start:
+                    dates = f"{start} — {get('end', '')}"
+                    parts.append(f'<div class="entry-dates">{escape_html(dates)}</div>')
+                if desc:
+                    parts.append(f'<div class="body-text">{escape_html(desc)}</div>')
 
-    return "\n".join(parts)
+    return parts
 
 
-def _render_single_column_header_html(cv: dict, theme: Theme, lang: str) -> str:
+def _render_single_column_header_html(cv: dict, theme: Theme) -> str:
     """Render an inline header for single-column layouts."""
-    parts = []
-    parts.append('<div style="text-align:center;margin-bottom:0.5cm">')
-    parts.append(
-        f'<div style="font-size:{theme.sizes.name_pt}pt;font-weight:bold;'
-        f'color:#{theme.colors.primary}">{_esc(cv["name"])}</div>'
-    )
-    parts.append(
-        f'<div style="font-size:{theme.sizes.body_pt}pt;color:#{theme.colors.text_muted};'
-        f'font-style:italic">{_esc(cv["title"])}</div>'
-    )
+    c, sz = theme.colors, theme.sizes
+    name_style = f"font-size:{sz.name_pt}pt;font-weight:bold;color:#{c.primary}"
+    title_style = f"font-size:{sz.body_pt}pt;color:#{c.text_muted};font-style:italic"
+    link_style = f"color:#{c.accent}"
+
+    parts = ['<div style="text-align:center;margin-bottom:0.5cm">']
+    parts.append(f'<div style="{name_style}">{escape_html(cv["name"])}</div>')
+    parts.append(f'<div style="{title_style}">{escape_html(cv["title"])}</div>')
 
     contact = cv.get("contact", {})
     contact_parts = [v for v in [contact.get("email"), contact.get("phone"), contact.get("address")] if v]
     if contact_parts:
         parts.append(
-            f'<div style="font-size:{theme.sizes.small_pt}pt;color:#{theme.colors.text_muted};'
-            f'margin-top:0.2cm">{_esc(" | ".join(contact_parts))}</div>'
+            f'<div style="font-size:{sz.small_pt}pt;color:#{c.text_muted};'
+            f'margin-top:0.2cm">{escape_html(" | ".join(contact_parts))}</div>'
         )
 
     links = cv.get("links", [])
     if links:
         link_strs = [
-            f'<a href="{_esc(lk["url"])}" style="color:#{theme.colors.accent}">{_esc(lk["label"])}</a>'
+            f'<a href="{escape_html(lk["url"])}" style="{link_style}">{escape_html(lk["label"])}</a>'
             for lk in links
             if lk.get("url")
         ]
         if link_strs:
-            parts.append(
-                f'<div style="font-size:{theme.sizes.small_pt}pt;margin-top:0.1cm">{" | ".join(link_strs)}</div>'
-            )
+            parts.append(f'<div style="font-size:{sz.small_pt}pt;margin-top:0.1cm">{" | ".join(link_strs)}</div>')
 
     parts.append("</div>")
     return "\n".join(parts)
 
 
-def build_html(cv: dict, lang: str, theme: Theme | None = None) -> str:
-    """Build a print-optimized, themed HTML document from CV data."""
+def _add_lines(frags: list[str], lines: list[str]) -> None:
+    """Append lines to frags with newlines between them, like ``"\n".join`` without building the string."""
+    for i, line in enumerate(lines):
+        if i:
+            frags.append("\n")
+        frags.append(line)
+
+
+def _html_fragments(cv: dict, lang: str, theme: Theme | None) -> list[str]:
+    """Render the whole document as a list of fragments whose concatenation is the HTML.
+
+    Embedded images can make the document several MB; keeping it in pieces lets
+    ``build_html_to`` write it out without ever holding one joined copy.
+    """
     theme = theme or load_theme()
     css = _build_css(theme)
-    layout_type = theme.layout.layout_type
-    name = _esc(cv.get("name", "CV"))
-
-    if layout_type in ("single-column", "academic"):
-        header = _render_single_column_header_html(cv, theme, lang)
-        main = _render_main_html(cv, theme, lang)
-        body = f"""<div style="max-width:18cm;margin:0 auto">
-  {header}
-  {main}
-</div>"""
-    elif layout_type == "compact":
-        sidebar = _render_sidebar_html(cv, theme, lang)
-        main = _render_main_html(cv, theme, lang)
-        body = f"""<div class="cv-container">
-  <div class="sidebar">
-    {sidebar}
-  </div>
-  <div class="main">
-    {main}
-  </div>
-</div>"""
-    else:
-        sidebar = _render_sidebar_html(cv, theme, lang)
-        main = _render_main_html(cv, theme, lang)
-        body = f"""<div class="cv-container">
-  <div class="sidebar">
-    {sidebar}
-  </div>
-  <div class="main">
-    {main}
-  </div>
-</div>"""
-
-    return f"""<!DOCTYPE html>
+    name = escape_html(cv.get("name", "CV"))
+    LE = {k: escape_html(v) for k, v in get_labels(lang).items()}
+
+    frags = [
+        f"""<!DOCTYPE html>
 <html lang="{lang}">
 <head>
 <meta charset="utf-8">
@@ -475,6 +498,29 @@ def build_html(cv: dict, lang: str, theme: Theme | None = None) -> str:
 <style>{css}</style>
 </head>
 <body>
-{body}
-</body>
-</html>"""
+"""
+    ]
+    if theme.layout.layout_type in ("single-column", "academic"):
+        frags.append('<div style="max-width:18cm;margin:0 auto">\n  ')
+        frags.append(_render_single_column_header_html(cv, theme))
+        frags.append("\n  ")
+        _add_lines(frags, _render_main_html(cv, theme, LE))
+        frags.append("\n</div>")
+    else:  # two-column and compact render the same markup
+        frags.append('<div class="cv-container">\n  <div class="sidebar">\n    ')
+        _add_lines(frags, _render_sidebar_html(cv, theme, LE))
+        frags.append('\n  </div>\n  <div class="main">\n    ')
+        _add_lines(frags, _render_main_html(cv, theme, LE))
+        frags.append("\n  </div>\n</div>")
+    frags.append("\n</body>\n</html>")
+    return frags
+
+
+def build_html(cv: dict, lang: str, theme: Theme | None = None) -> str:
+    """Build a print-optimized, themed HTML document from CV data."""
+    return "".join(_html_fragments(cv, lang, theme))
+
+
+def build_html_to(cv: dict, lang: str, out: TextIO, theme: Theme | None = None) -> None:
+    """Like ``build_html``, but write the document to a text stream piece by piece."""
+    out.writelines(_html_fragments(cv, lang, theme))
@@ -8,6 +8,7 @@ import typer
 import yaml
 
 from .console import console, err_console
+from .utils import YamlDumper
 
 
 def import_(
@@ -16,6 +17,12 @@ def import_(
     output: Annotated[
         Optional[Path], typer.Option("--output", "-o", help="Output YAML path. Defaults to cv.yaml.")
     ] = None,
+    cache: Annotated[
+        Optional[bool],
+        typer.Option(
+            "--cache/--no-cache", help="LinkedIn: reuse cached LLM structuring for the same PDF (default: off)."
+        ),
+    ] = None,
 ):
     """Import a CV from an external format into resumake cv.yaml."""
     format = format.lower()
@@ -23,7 +30,7 @@ def import_(
     if format == "jsonresume":
         _import_jsonresume(file, output)
     elif format == "linkedin":
-        _import_linkedin(file, output)
+        _import_linkedin(file, output, use_cache=cache)
     else:
         err_console.print(f"[red]Error:[/] Unknown import format '{format}'. Use: jsonresume or linkedin.")
         raise typer.Exit(1)
@@ -44,11 +51,14 @@ def _import_jsonresume(file: Path, output: Path | None):
 
     cv = json_resume_to_cv(data)
     out_path = output or Path("cv.yaml")
-    out_path.write_text(yaml.dump(cv, allow_unicode=True, default_flow_style=False, sort_keys=False), encoding="utf-8")
+    out_path.write_text(
+        yaml.dump(cv, Dumper=YamlDumper, allow_unicode=True, default_flow_style=False, sort_keys=False),
+        encoding="utf-8",
+    )
     console.print(f"Imported: [cyan]{out_path}[/]")
 
 
-def _import_linkedin(file: Path, output: Path | None):
+def _import_linkedin(file: Path, output: Path | None, use_cache: bool | None = None):
     try:
         from .linkedin import import_linkedin
     except ImportError:
@@ -60,7 +70,10 @@ def _import_linkedin(file: Path, output: Path | None):
         err_console.print(f"[red]Error:[/] File not found: {file}")
         raise typer.Exit(1)
 
-    cv = import_linkedin(file)
+    cv = import_linkedin(file, use_cache=use_cache)
     out_path = output or Path("cv.yaml")
-    out_path.write_text(yaml.dump(cv, allow_unicode=True, default_flow_style=False, sort_keys=False), encoding="utf-8")
+    out_path.write_text(
+        yaml.dump(cv, Dumper=YamlDumper, allow_unicode=True, default_flow_style=False, sort_keys=False),
+        encoding="utf-8",
+    )
     console.print(f"Imported: [cyan]{out_path}[/]")
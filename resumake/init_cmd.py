@@ -28,7 +28,7 @@ def init(
     if cv_dest.exists():
         console.print(f"[yellow]Skipping:[/] {cv_dest} already exists.")
     else:
-        shutil.copy2(str(example_src), str(cv_dest))
+        shutil.copyfile(example_src, cv_dest)
         console.print(f"[green]Created:[/] {cv_dest}")
 
     # Copy built-in icons to assets/
@@ -38,7 +38,7 @@ def init(
         for icon in BUILTIN_ASSETS_DIR.glob("*.png"):
             dest = assets_dest / icon.name
             if not dest.exists():
-                shutil.copy2(str(icon), str(dest))
+                shutil.copyfile(icon, dest)
         console.print(f"[green]Copied icons to:[/] {assets_dest}")
 
     # Create output/ and .gitignore
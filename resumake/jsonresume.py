@@ -1,35 +1,37 @@
 """JSON Resume interoperability — bidirectional mapping with jsonresume.org schema."""
 
 
+def _copy_present(src: dict, dst: dict, fields: tuple[tuple[str, str], ...]) -> None:
+    """Copy each truthy ``src[key]`` to ``dst[new_key]``, reading every key once."""
+    get = src.get
+    for key, new_key in fields:
+        value = get(key)
+        if value:
+            dst[new_key] = value
+
+
 def cv_to_json_resume(cv: dict) -> dict:
     """Convert a resumake CV dict to JSON Resume format."""
-    jr: dict = {"basics": {}, "meta": {"generator": "resumake"}}
+    basics: dict = {"name": cv.get("name", ""), "label": cv.get("title", "")}
+    jr: dict = {"basics": basics, "meta": {"generator": "resumake"}}
 
     # Basics
-    jr["basics"]["name"] = cv.get("name", "")
-    jr["basics"]["label"] = cv.get("title", "")
-    if cv.get("profile"):
-        jr["basics"]["summary"] = cv["profile"].strip()
-    if cv.get("photo"):
-        jr["basics"]["image"] = cv["photo"]
+    profile = cv.get("profile")
+    if profile:
+        basics["summary"] = profile.strip()
+    _copy_present(cv, basics, (("photo", "image"),))
 
     contact = cv.get("contact", {})
-    if contact.get("email"):
-        jr["basics"]["email"] = contact["email"]
-    if contact.get("phone"):
-        jr["basics"]["phone"] = contact["phone"]
-    location = {}
-    if contact.get("address"):
-        location["address"] = contact["address"]
-    if contact.get("nationality"):
-        location["countryCode"] = contact["nationality"]
+    _copy_present(contact, basics, (("email", "email"), ("phone", "phone")))
+    location: dict = {}
+    _copy_present(contact, location, (("address", "address"), ("nationality", "countryCode")))
     if location:
-        jr["basics"]["location"] = location
+        basics["location"] = location
 
     # Links → profiles
     links = cv.get("links", [])
     if links:
-        jr["basics"]["profiles"] = [{"network": lk["label"], "url": lk["url"]} for lk in links]
+        basics["profiles"] = [{"network": lk["label"], "url": lk["url"]} for lk in links]
 
     # Experience → work
     experience = cv.get("experience", [])
@@ -124,22 +126,12 @@ def json_resume_to_cv(data: dict) -> dict:
     basics = data.get("basics", {})
     cv["name"] = basics.get("name", "")
     cv["title"] = basics.get("label", "")
-    if basics.get("image"):
-        cv["photo"] = basics["image"]
-    if basics.get("summary"):
-        cv["profile"] = basics["summary"]
+    _copy_present(basics, cv, (("image", "photo"), ("summary", "profile")))
 
     # Contact
-    contact = {}
-    if basics.get("email"):
-        contact["email"] = basics["email"]
-    if basics.get("phone"):
-        contact["phone"] = basics["phone"]
-    location = basics.get("location", {})
-    if location.get("address"):
-        contact["address"] = location["address"]
-    if location.get("countryCode"):
-        contact["nationality"] = location["countryCode"]
+    contact: dict = {}
+    _copy_present(basics, contact, (("email", "email"), ("phone", "phone")))
+    _copy_present(basics.get("location", {}), contact, (("address", "address"), ("countryCode", "nationality")))
     cv["contact"] = contact
 
     # Profiles → links
@@ -183,15 +175,19 @@ def json_resume_to_cv(data: dict) -> dict:
     skills_data = data.get("skills", [])
     if skills_data:
         skills: dict = {}
+        technical: list | None = None  # built locally so extending it never mutates the input's keyword lists
         for s in skills_data:
             name = s.get("name", "").lower()
             keywords = s.get("keywords", [])
             if "leadership" in name:
                 skills["leadership"] = keywords
-            elif "technical" in name or "programming" in name:
-                skills["technical"] = keywords
+                continue
+            if technical is None:
+                technical = skills["technical"] = []
+            if "technical" in name or "programming" in name:
+                technical[:] = keywords
             else:
-                skills.setdefault("technical", []).extend(keywords)
+                technical.extend(keywords)
         cv["skills"] = skills
 
     # Languages
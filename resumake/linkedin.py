@@ -1,25 +1,114 @@
 """LinkedIn PDF import — parse a LinkedIn profile PDF export into cv.yaml."""
 
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+# pdfplumber is pure Python; from this many pages on, extraction is split across processes
+PARALLEL_MIN_PAGES = 8
+MAX_EXTRACT_WORKERS = 8
+# Structuring runs one LLM call per profile section, this many at a time, each with this output budget
+MAX_STRUCTURE_WORKERS = 4
+SECTION_MAX_TOKENS = 2048
+EXPERIENCE_MAX_TOKENS = 4096
+
+# Section headings of LinkedIn's PDF export, each on a line of its own
+_SECTION_RE = re.compile(
+    r"^(Contact|Summary|Top Skills|Skills|Languages|Experience|Education|Licenses & Certifications|Certifications"
+    r"|Volunteer Experience|Volunteering)[ \t]*$",
+    re.MULTILINE,
+)
+# Sections structured by their own LLM call; everything else goes with the name and title into "profile"
+_SECTION_PARTS = {
+    "Experience": "experience",
+    "Education": "education",
+    "Licenses & Certifications": "certifications",
+    "Certifications": "certifications",
+    "Volunteer Experience": "volunteering",
+    "Volunteering": "volunteering",
+}
+# CV keys each part asks for
+_PART_FIELDS = {
+    "profile": (
+        "name, title, contact (with address, email, phone, nationality), "
+        "links (list of label+url), skills (with leadership, technical, languages lists), "
+        "profile (summary text)"
+    ),
+    "experience": "experience (list with title, org, start, end, description, bullets)",
+    "education": "education (list with degree, institution, start, end)",
+    "certifications": "certifications (list with name, org, start, end)",
+    "volunteering": "volunteering (list with title, org, start, end, description)",
+}
+_STAR_INSTRUCTIONS = (
+    "When writing experience bullets, apply the STAR method where the source text provides enough detail: "
+    "lead with context (situation/task), describe the action taken, and end with a measurable result. "
+    "Do NOT fabricate details — only apply STAR when the source text supports it.\n"
+)
+
+
+def _page_texts(pages) -> list[str | None]:
+    """Extract each pdfplumber page's text, releasing its parsed objects as we go."""
+    texts = []
+    for page in pages:
+        texts.append(page.extract_text())
+        # pdfplumber keeps every parsed char/line object per page until closed
+        page.flush_cache()
+    return texts
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> list[str | None]:
+    """Worker: open the PDF and extract pages [start, stop)."""
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        return _page_texts(pdf.pages[start:stop])
+
+
+def _extract_parallel(pdf_path: str, n_pages: int) -> list[str | None]:
+    """Extract pages in contiguous chunks, one chunk (and one PDF open) per worker process."""
+    workers = min(os.cpu_count() or 1, MAX_EXTRACT_WORKERS)
+    if workers < 2:
+        return _extract_page_range(pdf_path, 0, n_pages)
+    step = -(-n_pages // workers)
+    starts = range(0, n_pages, step)
+    stops = [min(start + step, n_pages) for start in starts]
+    with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+        chunks = executor.map(_extract_page_range, [pdf_path] * len(starts), starts, stops)
+        return [text for chunk in chunks for text in chunk]
 
-def extract_linkedin_text(pdf_path: Path) -> str:
-    """Extract text from a LinkedIn profile PDF using pdfplumber."""
-    try:
-        import pdfplumber
-    except ImportError:
-        from .console import err_console
 
-        err_console.print("[red]Error:[/] 'pdfplumber' package required for LinkedIn import.")
-        err_console.print("Install with: [bold]uv tool install resumakeai --with pdfplumber[/]")
-        raise SystemExit(1)
+def extract_linkedin_text(pdf_path: Path) -> str:
+    """Extract text from a LinkedIn profile PDF.
 
-    text_parts = []
-    with pdfplumber.open(str(pdf_path)) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text()
-            if text:
-                text_parts.append(text)
+    Uses PyMuPDF when it is installed (an order of magnitude faster), otherwise pdfplumber.
+    """
+    try:
+        import pymupdf
+    except ImportError:  # AGPL-licensed, so never pulled in by an extra — only used if the user installs it
+        pymupdf = None
+
+    if pymupdf is not None:
+        with pymupdf.open(pdf_path) as doc:
+            pages = [page.get_text().strip() for page in doc]
+    else:
+        try:
+            import pdfplumber
+        except ImportError:
+            from .console import err_console
+
+            err_console.print("[red]Error:[/] 'pdfplumber' package required for LinkedIn import.")
+            err_console.print("Install with: [bold]uv tool install resumakeai --with pdfplumber[/]")
+            raise SystemExit(1)
+
+        with pdfplumber.open(str(pdf_path)) as pdf:
+            n_pages = len(pdf.pages)
+            if n_pages < PARALLEL_MIN_PAGES:
+                pages = _page_texts(pdf.pages)
+        if n_pages >= PARALLEL_MIN_PAGES:
+            pages = _extract_parallel(str(pdf_path), n_pages)
+
+    text_parts = [text for text in pages if text]
 
     if not text_parts:
         from .console import err_console
@@ -30,54 +119,117 @@ def extract_linkedin_text(pdf_path: Path) -> str:
     return "\n\n".join(text_parts)
 
 
-def linkedin_to_cv(text: str) -> dict:
-    """Structure LinkedIn PDF text into a CV dict using an LLM."""
-    from .llm import get_provider
+def _split_sections(text: str) -> dict[str, str]:
+    """Split LinkedIn PDF text into the parts structured separately, keyed by part name.
+
+    Each part keeps its heading lines. "profile" gets everything before the main column's first
+    section (Summary or Experience), then Summary itself. The export puts the sidebar (contact,
+    skills, certifications, ...) ahead of the name, headline and location, so the name and title
+    follow whichever sidebar section comes last. Sidebar list sections still get their own part.
+    """
+    matches = list(_SECTION_RE.finditer(text))
+    main = next((m for m in matches if m.group(1) in ("Summary", "Experience")), None)
+    head_end = main.start() if main else len(text)
+
+    chunks: dict[str, list[str]] = {"profile": [text[:head_end]]}
+    for match, following in zip(matches, matches[1:] + [None]):
+        part = _SECTION_PARTS.get(match.group(1), "profile")
+        if part == "profile" and match.start() < head_end:
+            continue  # already in the head
+        chunks.setdefault(part, []).append(text[match.start() : following.start() if following else len(text)])
+    sections = {name: "".join(pieces).strip() for name, pieces in chunks.items()}
+    return {name: body for name, body in sections.items() if body}
+
+
+def _structure_prompt(fields: str, text: str, star: bool) -> str:
+    return (
+        "Convert the following LinkedIn profile text into a structured YAML CV. "
+        f"Return ONLY valid YAML with these top-level keys (omit any that don't apply): {fields}. "
+        f"{_STAR_INSTRUCTIONS if star else ''}"
+        "Use professional English. Do NOT add any explanation.\n\n"
+        f"LinkedIn profile text:\n\n{text}"
+    )
+
+
+def _structure(provider, prompt: str, max_tokens: int, use_cache: bool = False):
+    """Run one structuring prompt (through the LLM cache if use_cache) and parse the YAML reply."""
+    import yaml
+
+    from . import llm_cache
+    from .llm import strip_yaml_fences
+    from .utils import YamlLoader
+
+    cache_key = llm_cache.request_key(provider, prompt, max_tokens)
+    response = llm_cache.get(cache_key) if use_cache else None
+    cached = response is not None
+    if not cached:
+        response = provider.complete(prompt, max_tokens=max_tokens)
 
     try:
-        provider = get_provider()
-    except RuntimeError:
+        data = yaml.load(strip_yaml_fences(response), Loader=YamlLoader)
+    except yaml.YAMLError:
         from .console import err_console
 
-        err_console.print("[red]Error:[/] LinkedIn import requires an LLM provider to structure the data.")
-        err_console.print("Set ANTHROPIC_API_KEY or OPENAI_API_KEY.")
+        err_console.print("[red]Error:[/] Could not parse LLM response as YAML.")
         raise SystemExit(1)
+    if use_cache and not cached and isinstance(data, dict):
+        llm_cache.put(cache_key, response)
+    return data
 
-    import yaml
 
-    from .console import console
-
-    with console.status("Structuring LinkedIn profile via LLM..."):
-        response = provider.complete(
-            "Convert the following LinkedIn profile text into a structured YAML CV. "
-            "Return ONLY valid YAML with these top-level keys (omit any that don't apply): "
-            "name, title, contact (with address, email, phone, nationality), "
-            "links (list of label+url), skills (with leadership, technical, languages lists), "
-            "profile (summary text), experience (list with title, org, start, end, description, bullets), "
-            "education (list with degree, institution, start, end), "
-            "certifications (list with name, org, start, end), "
-            "volunteering (list with title, org, start, end, description). "
-            "When writing experience bullets, apply the STAR method where the source text provides enough detail: "
-            "lead with context (situation/task), describe the action taken, and end with a measurable result. "
-            "Do NOT fabricate details — only apply STAR when the source text supports it.\n"
-            "Use professional English. Do NOT add any explanation.\n\n"
-            f"LinkedIn profile text:\n\n{text}",
-            max_tokens=8192,
-        )
+def linkedin_to_cv(text: str, use_cache: bool | None = None) -> dict:
+    """Structure LinkedIn PDF text into a CV dict using an LLM.
 
-    from .llm import strip_yaml_fences
+    When the export's section headings are found, each list section (experience, education, ...)
+    is structured by its own smaller prompt, concurrently, and the results are merged. Otherwise
+    the whole text goes out in one prompt. Responses are only cached when use_cache is True, or it
+    is None and RESUMAKE_LLM_CACHE=1.
+    """
+    from . import llm_cache
+    from .llm import get_provider
 
-    yaml_text = strip_yaml_fences(response)
     try:
-        return yaml.safe_load(yaml_text)
-    except yaml.YAMLError:
+        provider = get_provider()
+    except RuntimeError:
         from .console import err_console
 
-        err_console.print("[red]Error:[/] Could not parse LLM response as YAML.")
+        err_console.print("[red]Error:[/] LinkedIn import requires an LLM provider to structure the data.")
+        err_console.print("Set ANTHROPIC_API_KEY or OPENAI_API_KEY.")
         raise SystemExit(1)
 
-
-def import_linkedin(pdf_path: Path) -> dict:
+    from .console import status
+
+    use_cache = llm_cache.opted_in(use_cache)
+    sections = _split_sections(text)
+    if len(sections) < 2:
+        prompt = _structure_prompt(", ".join(_PART_FIELDS.values()), text, star=True)
+        with status("Structuring LinkedIn profile via LLM..."):
+            return _structure(provider, prompt, 8192, use_cache)
+
+    parts = [name for name in _PART_FIELDS if name in sections]
+    prompts = [_structure_prompt(_PART_FIELDS[name], sections[name], star=name == "experience") for name in parts]
+    max_tokens = [EXPERIENCE_MAX_TOKENS if name == "experience" else SECTION_MAX_TOKENS for name in parts]
+    with status(f"Structuring {len(parts)} LinkedIn profile sections via LLM..."):
+        with ThreadPoolExecutor(max_workers=min(len(parts), MAX_STRUCTURE_WORKERS)) as executor:
+            results = list(
+                executor.map(_structure, [provider] * len(parts), prompts, max_tokens, [use_cache] * len(parts))
+            )
+
+    cv: dict = {}
+    for name, data in zip(parts, results):
+        if not isinstance(data, dict):
+            from .console import err_console
+
+            err_console.print("[red]Error:[/] Could not parse LLM response as YAML.")
+            raise SystemExit(1)
+        if name == "profile":
+            cv.update(data)
+        elif data.get(name) is not None:
+            cv[name] = data[name]
+    return cv
+
+
+def import_linkedin(pdf_path: Path, use_cache: bool | None = None) -> dict:
     """Full pipeline: extract text from LinkedIn PDF and structure into CV dict."""
     text = extract_linkedin_text(pdf_path)
-    return linkedin_to_cv(text)
+    return linkedin_to_cv(text, use_cache=use_cache)
@@ -2,16 +2,58 @@
 
 import http.server
 import threading
-import time
 from pathlib import Path
 
 from .console import console, err_console
 from .html_builder import build_html
 from .theme import load_theme
-from .utils import load_cv
+from .utils import load_cv, resolve_asset
 
-# Shared state for SSE reload notifications
-_reload_event = threading.Event()
+# Quiet period after the last file event before open previews are told to reload
+RELOAD_DEBOUNCE_SECONDS = 0.3
+
+# Seconds between SSE keep-alive comments; also bounds how long a closed client's thread lingers
+SSE_KEEPALIVE_SECONDS = 15
+
+# Shared state for SSE reload notifications: every open stream waits for the generation to change
+_reload_cond = threading.Condition()
+_reload_generation = 0
+
+# Last rendered page as (input stamps, image refs, image stamps, html); pages are rebuilt only when the
+# CV, the theme file or an embedded image (photo, publication images) changes
+_page_cache: tuple[tuple, tuple[str, ...], tuple, str] | None = None
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _image_refs(cv: dict) -> tuple[str, ...]:
+    """Asset references the HTML page embeds: the photo and any publication images."""
+    refs = [cv.get("photo")] + [pub.get("image") for pub in cv.get("publications") or []]
+    return tuple(ref for ref in refs if ref)
+
+
+def _image_stamps(refs: tuple[str, ...]) -> tuple:
+    """Resolved path and stamp per reference, so an added override or an edited image misses the cache."""
+    stamps = []
+    for ref in refs:
+        path = resolve_asset(ref)
+        stamps.append((path, _file_stamp(path) if path is not None else None))
+    return tuple(stamps)
+
+
+def notify_reload() -> None:
+    """Drop the cached page and tell every connected preview page to reload."""
+    global _page_cache, _reload_generation
+    _page_cache = None
+    with _reload_cond:
+        _reload_generation += 1
+        _reload_cond.notify_all()
 
 
 class LiveReloadHandler(http.server.BaseHTTPRequestHandler):
@@ -27,8 +69,19 @@ class LiveReloadHandler(http.server.BaseHTTPRequestHandler):
             self._handle_page()
 
     def _handle_page(self):
+        global _page_cache
+        theme_file = Path("theme.yaml") if self.theme_name is None else Path(self.theme_name)
+        stamps = (str(self.source), _file_stamp(self.source), self.theme_name, _file_stamp(theme_file))
+        cached = _page_cache
+        if cached is not None and cached[0] == stamps and _image_stamps(cached[1]) == cached[2]:
+            self._send_html(cached[3])
+            return
+
         try:
             cv = load_cv(self.source)
+            refs = _image_refs(cv)
+            # Stamped before rendering, so an image replaced mid-render is picked up next time
+            image_stamps = _image_stamps(refs)
             theme = load_theme(self.theme_name)
             html = build_html(cv, "en", theme=theme)
             # Inject SSE reload script
@@ -41,9 +94,12 @@ evtSource.onmessage = function(event) {
 </script>
 """
             html = html.replace("</body>", f"{reload_script}</body>")
+            _page_cache = (stamps, refs, image_stamps, html)
         except Exception as e:
             html = f"<html><body><h1>Build Error</h1><pre>{e}</pre></body></html>"
+        self._send_html(html)
 
+    def _send_html(self, html: str):
         self.send_response(200)
         self.send_header("Content-Type", "text/html; charset=utf-8")
         self.end_headers()
@@ -56,12 +112,20 @@ evtSource.onmessage = function(event) {
         self.send_header("Connection", "keep-alive")
         self.end_headers()
 
+        with _reload_cond:
+            seen = _reload_generation
         try:
             while True:
-                if _reload_event.wait(timeout=1):
-                    _reload_event.clear()
+                with _reload_cond:
+                    _reload_cond.wait_for(lambda: _reload_generation != seen, timeout=SSE_KEEPALIVE_SECONDS)
+                    current = _reload_generation
+                if current != seen:
+                    seen = current
                     self.wfile.write(b"data: reload\n\n")
-                    self.wfile.flush()
+                else:
+                    # Comment line: keeps proxies from dropping the stream and surfaces closed clients
+                    self.wfile.write(b": ping\n\n")
+                self.wfile.flush()
         except (BrokenPipeError, ConnectionResetError):
             pass
 
@@ -72,7 +136,7 @@ evtSource.onmessage = function(event) {
 def start_live_server(source: Path, theme_name: str | None = None, port: int = 8642):
     """Start a live-reloading preview server."""
     try:
-        from watchdog.events import FileSystemEventHandler
+        from watchdog.events import PatternMatchingEventHandler
         from watchdog.observers import Observer
     except ImportError:
         err_console.print("[red]Error:[/] 'watchdog' package required for --live preview.")
@@ -83,27 +147,42 @@ def start_live_server(source: Path, theme_name: str | None = None, port: int = 8
     LiveReloadHandler.source = source
     LiveReloadHandler.theme_name = theme_name
 
-    class FileChangeHandler(FileSystemEventHandler):
+    class FileChangeHandler(PatternMatchingEventHandler):
+        """Reload the preview once a burst of save events has gone quiet, not on its first event."""
+
         def __init__(self):
-            self._last_trigger = 0
+            super().__init__(patterns=[source.name], ignore_directories=True)
+            self._timer: threading.Timer | None = None
+            self._timer_lock = threading.Lock()
 
         def on_modified(self, event):
-            if event.is_directory:
-                return
-            if Path(event.src_path).resolve() != source.resolve():
-                return
-            now = time.time()
-            if now - self._last_trigger < 0.5:
-                return
-            self._last_trigger = now
+            self._schedule()
+
+        def on_created(self, event):
+            self._schedule()
+
+        def on_moved(self, event):
+            # Editors like vim save by writing a temp file and renaming it over the original
+            self._schedule()
+
+        def _schedule(self):
+            with self._timer_lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._timer = threading.Timer(RELOAD_DEBOUNCE_SECONDS, self._fire)
+                self._timer.daemon = True
+                self._timer.start()
+
+        def _fire(self):
             console.print(f"[dim]--- {source.name} changed, reloading... ---[/]")
-            _reload_event.set()
+            notify_reload()
 
     observer = Observer()
     observer.schedule(FileChangeHandler(), str(source.parent), recursive=False)
     observer.start()
 
-    server = http.server.HTTPServer(("localhost", port), LiveReloadHandler)
+    # One thread per request, so open event streams don't block page loads
+    server = http.server.ThreadingHTTPServer(("localhost", port), LiveReloadHandler)
     console.print(f"Live preview: [cyan]http://localhost:{port}[/]")
     console.print(f"Watching [cyan]{source}[/] for changes. Press Ctrl+C to stop.")
 
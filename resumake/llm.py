@@ -1,27 +1,50 @@
 """LLM provider abstraction for resumake."""
 
+import functools
 import os
+import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+
+# Optional opening fence line (any info string), body, optional closing fence — one anchored pass
+_FENCE_RE = re.compile(r"\A(?:```[^\n]*(?:\n|\Z))?(.*?)(?:^```[ \t]*)?\Z", re.DOTALL | re.MULTILINE)
 
 
 def strip_yaml_fences(text: str) -> str:
     """Remove markdown code fences from YAML output."""
-    text = text.strip()
-    if text.startswith("```"):
-        text = "\n".join(text.split("\n")[1:])
-    if text.endswith("```"):
-        text = "\n".join(text.split("\n")[:-1])
-    return text.strip()
+    return _FENCE_RE.match(text.strip()).group(1).strip()
+
+
+def cached_block(text: str) -> dict:
+    """A system block marked as a prompt-caching breakpoint (honoured by Anthropic, ignored elsewhere)."""
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+
+def _system_text(system_blocks: list[dict]) -> str:
+    """Flatten system blocks into a single string for providers without block support."""
+    return "\n\n".join(block["text"] for block in system_blocks)
 
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
     @abstractmethod
-    def complete(self, prompt: str, max_tokens: int = 4096) -> str:
-        """Send a prompt and return the text response."""
+    def complete(self, prompt: str, max_tokens: int = 4096, system_blocks: list[dict] | None = None) -> str:
+        """Send a prompt and return the text response.
+
+        system_blocks are Anthropic-style ``{"type": "text", "text": ...}`` dicts sent ahead of
+        the prompt. Put large, stable content (instructions, the CV) there so providers with
+        prompt caching can reuse it across calls.
+        """
         ...
 
+    def stream(self, prompt: str, max_tokens: int = 4096, system_blocks: list[dict] | None = None) -> Iterator[str]:
+        """Yield the response text in chunks as it is generated.
+
+        Providers without a streaming API fall back to yielding the full completion at once.
+        """
+        yield self.complete(prompt, max_tokens=max_tokens, system_blocks=system_blocks)
+
 
 class AnthropicProvider(LLMProvider):
     """Anthropic Claude provider."""
@@ -32,14 +55,26 @@ class AnthropicProvider(LLMProvider):
         self.client = anthropic.Anthropic(api_key=api_key)
         self.model = model
 
-    def complete(self, prompt: str, max_tokens: int = 4096) -> str:
+    def complete(self, prompt: str, max_tokens: int = 4096, system_blocks: list[dict] | None = None) -> str:
+        kwargs = {"system": system_blocks} if system_blocks else {}
         message = self.client.messages.create(
             model=self.model,
             max_tokens=max_tokens,
             messages=[{"role": "user", "content": prompt}],
+            **kwargs,
         )
         return message.content[0].text.strip()
 
+    def stream(self, prompt: str, max_tokens: int = 4096, system_blocks: list[dict] | None = None) -> Iterator[str]:
+        kwargs = {"system": system_blocks} if system_blocks else {}
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+            **kwargs,
+        ) as stream:
+            yield from stream.text_stream
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI provider (works with any OpenAI-compatible API)."""
@@ -53,14 +88,32 @@ class OpenAIProvider(LLMProvider):
         self.client = openai.OpenAI(**kwargs)
         self.model = model
 
-    def complete(self, prompt: str, max_tokens: int = 4096) -> str:
+    @staticmethod
+    def _messages(prompt: str, system_blocks: list[dict] | None) -> list[dict]:
+        messages = [{"role": "user", "content": prompt}]
+        if system_blocks:
+            messages.insert(0, {"role": "system", "content": _system_text(system_blocks)})
+        return messages
+
+    def complete(self, prompt: str, max_tokens: int = 4096, system_blocks: list[dict] | None = None) -> str:
         response = self.client.chat.completions.create(
             model=self.model,
             max_tokens=max_tokens,
-            messages=[{"role": "user", "content": prompt}],
+            messages=self._messages(prompt, system_blocks),
         )
         return response.choices[0].message.content.strip()
 
+    def stream(self, prompt: str, max_tokens: int = 4096, system_blocks: list[dict] | None = None) -> Iterator[str]:
+        response = self.client.chat.completions.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=self._messages(prompt, system_blocks),
+            stream=True,
+        )
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
 
 def get_provider() -> LLMProvider:
     """Auto-detect and return an LLM provider from environment variables.
@@ -68,8 +121,20 @@ def get_provider() -> LLMProvider:
     Checks in order: ANTHROPIC_API_KEY, OPENAI_API_KEY.
     Supports OPENAI_BASE_URL for OpenAI-compatible APIs (e.g. Ollama, LiteLLM).
     Raises RuntimeError if no provider is available.
+
+    The provider is reused for the rest of the process while these variables are unchanged, so
+    every call shares one SDK client and its pool of keep-alive connections.
     """
-    anthropic_key = os.environ.get("ANTHROPIC_API_KEY")
+    return _provider_for(
+        os.environ.get("ANTHROPIC_API_KEY"),
+        os.environ.get("OPENAI_API_KEY"),
+        os.environ.get("OPENAI_BASE_URL"),
+        os.environ.get("OPENAI_MODEL", "gpt-4o"),
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _provider_for(anthropic_key: str | None, openai_key: str | None, base_url: str | None, model: str) -> LLMProvider:
     if anthropic_key:
         try:
             return AnthropicProvider(api_key=anthropic_key)
@@ -79,11 +144,8 @@ def get_provider() -> LLMProvider:
                 "Install with: uv tool install resumakeai --with anthropic"
             )
 
-    openai_key = os.environ.get("OPENAI_API_KEY")
     if openai_key:
         try:
-            base_url = os.environ.get("OPENAI_BASE_URL")
-            model = os.environ.get("OPENAI_MODEL", "gpt-4o")
             return OpenAIProvider(api_key=openai_key, model=model, base_url=base_url)
         except ImportError:
             raise RuntimeError(
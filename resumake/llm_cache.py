@@ -0,0 +1,140 @@
+"""On-disk cache for LLM responses, keyed by a hash of the request.
+
+Entries live under ``~/.cache/resumake/llm/<key[:2]>/<key>.json`` (or
+``$XDG_CACHE_HOME/resumake/llm``). Set ``RESUMAKE_NO_CACHE=1`` to bypass it.
+Commands that people rerun to get a different answer (suggest, tailor, LinkedIn import) only
+use it when asked to, with ``--cache`` or ``RESUMAKE_LLM_CACHE=1``.
+
+Besides exact lookups, callers can register the free-text input behind an entry
+(e.g. a job description) in a namespace and later find near-duplicates of it.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+from .utils import USER_CACHE_DIR, cache_enabled, json_dumps, json_loads
+
+CACHE_DIR = USER_CACHE_DIR / "llm"
+DEFAULT_TTL = 7 * 86400  # one week
+# Word 3-shingle Jaccard similarity at which two inputs count as the same request
+NEAR_DUP_THRESHOLD = 0.95
+NEAR_DUP_MAX_ENTRIES = 50
+# Serializes read-modify-write of the near-duplicate indexes between threads (the cover letter pool)
+_index_lock = threading.Lock()
+
+
+def _enabled() -> bool:
+    return cache_enabled()
+
+
+def opted_in(use_cache: bool | None = None) -> bool:
+    """Whether an opt-in caller should use the cache: an explicit flag wins, else RESUMAKE_LLM_CACHE=1."""
+    if use_cache is not None:
+        return use_cache
+    return os.environ.get("RESUMAKE_LLM_CACHE", "") in ("1", "true", "yes")
+
+
+def make_key(*parts: str) -> str:
+    """Hash the given request parts into a cache key."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\x1e")
+    return h.hexdigest()
+
+
+def request_key(provider, prompt: str, max_tokens: int, system_blocks: list[dict] | None = None) -> str:
+    """Cache key for a provider.complete() call — includes the provider, model, and system blocks."""
+    model = getattr(provider, "model", "")
+    system = json.dumps(system_blocks, sort_keys=True) if system_blocks else ""
+    return make_key(type(provider).__name__, model, str(max_tokens), system, prompt)
+
+
+def _entry_path(key: str) -> Path:
+    return CACHE_DIR / key[:2] / f"{key}.json"
+
+
+def get(key: str) -> str | None:
+    """Return the cached response for a key, or None if missing, expired, or unreadable."""
+    if not _enabled():
+        return None
+    try:
+        entry = json_loads(_entry_path(key).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict):
+        return None
+    if time.time() - entry.get("ts", 0) > entry.get("ttl", DEFAULT_TTL):
+        return None
+    return entry.get("body")
+
+
+def put(key: str, value: str, ttl: int = DEFAULT_TTL) -> None:
+    """Store a response. Write failures are ignored — the cache is best-effort."""
+    if not _enabled():
+        return
+    path = _entry_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json_dumps({"ts": time.time(), "ttl": ttl, "body": value}), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _shingles(text: str, k: int = 3) -> set[str]:
+    words = re.findall(r"\w+", text.lower())
+    if len(words) <= k:
+        return {" ".join(words)}
+    return {" ".join(words[i : i + k]) for i in range(len(words) - k + 1)}
+
+
+def _index_path(namespace: str) -> Path:
+    return CACHE_DIR / "near" / f"{namespace}.json"
+
+
+def _load_index(namespace: str) -> list[dict]:
+    try:
+        index = json_loads(_index_path(namespace).read_bytes())
+    except (OSError, ValueError):
+        return []
+    return index if isinstance(index, list) else []
+
+
+def find_similar(namespace: str, text: str, threshold: float = NEAR_DUP_THRESHOLD) -> tuple[str, str] | None:
+    """Return (registered input, cached response) for the input most similar to text, if similar enough."""
+    if not _enabled():
+        return None
+    target = _shingles(text)
+    best, best_score = None, threshold
+    for entry in _load_index(namespace):
+        other = _shingles(entry.get("text", ""))
+        score = len(target & other) / len(target | other)
+        if score >= best_score:
+            best, best_score = entry, score
+    if best is None:
+        return None
+    body = get(best.get("key", ""))
+    return (best.get("text", ""), body) if body is not None else None
+
+
+def remember_similar(namespace: str, text: str, key: str) -> None:
+    """Register the input text behind a cached entry so near-duplicates can find it."""
+    if not _enabled():
+        return
+    path = _index_path(namespace)
+    with _index_lock:
+        index = [e for e in _load_index(namespace) if e.get("key") != key]
+        index = index[-(NEAR_DUP_MAX_ENTRIES - 1) :] + [{"key": key, "text": text}]
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so a concurrent reader never sees a half-written index
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json_dumps(index), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            pass
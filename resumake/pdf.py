@@ -1,20 +1,52 @@
-"""PDF conversion — WeasyPrint (from HTML) with fallback to docx2pdf (from Word)."""
-
+"""PDF conversion — WeasyPrint (from HTML) with fallback to unoserver or docx2pdf (from Word)."""
+
+import atexit
+import http.client
+import os
+import shutil
+import socket
+import subprocess
+import threading
+import time
+import xmlrpc.client
 from pathlib import Path
 
+# XML-RPC port of the shared unoserver daemon (unoserver's own default; LibreOffice's UNO port is 2002).
+# Override with RESUMAKE_UNOSERVER_PORT when something else already uses it.
+UNOSERVER_PORT = int(os.environ.get("RESUMAKE_UNOSERVER_PORT") or 2003)
+UNOSERVER_STARTUP_TIMEOUT = 30.0
 
-def convert_to_pdf_weasyprint(html_content: str, output_path: Path) -> Path:
-    """Convert HTML string to PDF using WeasyPrint."""
+# Embedded images (mostly the profile photo) are resampled to this resolution at their printed size
+# and JPEGs re-encoded at this quality, so a full-size photo doesn't bloat the PDF.
+PDF_IMAGE_DPI = 300
+PDF_JPEG_QUALITY = 85
+
+_unoserver: subprocess.Popen | None = None
+_unoserver_lock = threading.Lock()
+
+
+def _weasyprint_html():
+    """Return WeasyPrint's HTML class, or None if it can't be imported."""
     try:
         from weasyprint import HTML
-    except ImportError:
+    except (ImportError, OSError):  # OSError: installed, but its Pango/Cairo libraries are missing
+        return None
+    return HTML
+
+
+def convert_to_pdf_weasyprint(html_content: str, output_path: Path) -> Path:
+    """Convert HTML string to PDF using WeasyPrint."""
+    HTML = _weasyprint_html()
+    if HTML is None:
         from .console import err_console
 
         err_console.print("[red]Error:[/] 'weasyprint' package required for HTML-to-PDF generation.")
         err_console.print("Install with: [bold]uv tool install resumakeai --with weasyprint[/]")
         raise SystemExit(1)
 
-    HTML(string=html_content).write_pdf(str(output_path))
+    HTML(string=html_content).write_pdf(
+        output_path, optimize_images=True, dpi=PDF_IMAGE_DPI, jpeg_quality=PDF_JPEG_QUALITY
+    )
     return output_path
 
 
@@ -29,11 +61,116 @@ def convert_to_pdf_docx2pdf(docx_path: Path) -> Path:
         err_console.print("Install with: [bold]uv tool install resumakeai --with docx2pdf[/]")
         raise SystemExit(1)
 
+    try:
+        import pythoncom  # pywin32: docx2pdf drives Word over COM on Windows
+    except ImportError:
+        pythoncom = None
+
     pdf_path = docx_path.with_suffix(".pdf")
-    convert(str(docx_path), str(pdf_path))
+    # COM must be initialised on each thread that uses it, e.g. a --watch rebuild's timer thread
+    if pythoncom is not None:
+        pythoncom.CoInitialize()
+    try:
+        convert(str(docx_path), str(pdf_path))
+    finally:
+        if pythoncom is not None:
+            pythoncom.CoUninitialize()
     return pdf_path
 
 
+def _port_open(port: int) -> bool:
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+def _speaks_xmlrpc(port: int) -> bool:
+    """Whether the listener on port answers XML-RPC, as unoserver does, rather than being some other service."""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+    try:
+        conn.request("POST", "/RPC2", xmlrpc.client.dumps((), "system.listMethods"), {"Content-Type": "text/xml"})
+        # Even a fault for an unknown method comes back as a methodResponse
+        return b"<methodResponse>" in conn.getresponse().read()
+    except (OSError, http.client.HTTPException):
+        return False
+    finally:
+        conn.close()
+
+
+def _stop_unoserver() -> None:
+    if _unoserver is not None and _unoserver.poll() is None:
+        _unoserver.terminate()
+        try:
+            _unoserver.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            _unoserver.kill()
+
+
+def _ensure_unoserver() -> bool:
+    """Start a shared unoserver daemon on first use so LibreOffice boots once per process.
+
+    Returns False if unoserver isn't installed or doesn't come up in time.
+    """
+    global _unoserver
+    if shutil.which("unoserver") is None or shutil.which("unoconvert") is None:
+        return False
+    with _unoserver_lock:
+        if _unoserver is not None and _unoserver.poll() is None:
+            return True
+        if _port_open(UNOSERVER_PORT):
+            # Reuse a daemon someone else started, but not an unrelated service that happens to hold the port
+            return _speaks_xmlrpc(UNOSERVER_PORT)
+        if _unoserver is None:
+            atexit.register(_stop_unoserver)
+        _unoserver = subprocess.Popen(
+            ["unoserver", "--port", str(UNOSERVER_PORT)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + UNOSERVER_STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if _port_open(UNOSERVER_PORT):
+                return True
+            if _unoserver.poll() is not None:
+                break
+            time.sleep(0.2)
+        _stop_unoserver()
+        return False
+
+
+def convert_to_pdf_unoserver(docx_path: Path) -> Path:
+    """Convert a .docx file to PDF through a persistent LibreOffice (unoserver) daemon."""
+    from .console import err_console
+
+    if not _ensure_unoserver():
+        err_console.print("[red]Error:[/] 'unoserver' is required for LibreOffice-based PDF generation.")
+        err_console.print("Install with: [bold]pip install unoserver[/] (requires LibreOffice)")
+        raise SystemExit(1)
+
+    pdf_path = docx_path.with_suffix(".pdf")
+    result = subprocess.run(
+        ["unoconvert", "--port", str(UNOSERVER_PORT), str(docx_path), str(pdf_path)],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        err_console.print(f"[red]Error:[/] unoconvert failed: {result.stderr.strip()}")
+        raise SystemExit(1)
+    return pdf_path
+
+
+def convert_docx_to_pdf(docx_path: Path) -> Path:
+    """Convert a .docx file to PDF, preferring a shared unoserver daemon and falling back to docx2pdf."""
+    if _ensure_unoserver():
+        try:
+            return convert_to_pdf_unoserver(docx_path)
+        except SystemExit:
+            pass  # conversion failed, try docx2pdf
+    return convert_to_pdf_docx2pdf(docx_path)
+
+
 def convert_to_pdf_auto(
     source_path: Path,
     engine: str = "auto",
@@ -44,7 +181,8 @@ def convert_to_pdf_auto(
     Engines:
     - 'weasyprint': HTML → PDF via WeasyPrint (requires html_content)
     - 'docx2pdf': DOCX → PDF via docx2pdf
-    - 'auto': try weasyprint first (if html_content provided), fall back to docx2pdf
+    - 'unoserver': DOCX → PDF via a persistent LibreOffice daemon
+    - 'auto': try weasyprint first (if html_content provided), then unoserver, then docx2pdf
     """
     pdf_path = source_path.with_suffix(".pdf")
 
@@ -59,11 +197,11 @@ def convert_to_pdf_auto(
     if engine == "docx2pdf":
         return convert_to_pdf_docx2pdf(source_path)
 
-    # auto: try weasyprint if html_content available
-    if html_content is not None:
-        try:
-            return convert_to_pdf_weasyprint(html_content, pdf_path)
-        except SystemExit:
-            pass  # weasyprint not installed, fall back
+    if engine == "unoserver":
+        return convert_to_pdf_unoserver(source_path)
+
+    # auto: try weasyprint if html_content available; without it, fall back quietly rather than print an error
+    if html_content is not None and _weasyprint_html() is not None:
+        return convert_to_pdf_weasyprint(html_content, pdf_path)
 
-    return convert_to_pdf_docx2pdf(source_path)
+    return convert_docx_to_pdf(source_path)
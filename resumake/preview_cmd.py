@@ -7,7 +7,7 @@ from typing import Annotated, Optional
 import typer
 
 from .console import console
-from .html_builder import build_html
+from .html_builder import build_html_to
 from .theme import load_theme
 from .utils import DEFAULT_YAML, load_cv, open_file
 
@@ -26,9 +26,8 @@ def preview(
     else:
         cv = load_cv(source)
         resolved_theme = load_theme(theme)
-        html = build_html(cv, "en", theme=resolved_theme)
-
         preview_path = Path(tempfile.mktemp(suffix=".html", prefix="resumake_preview_"))
-        preview_path.write_text(html, encoding="utf-8")
+        with open(preview_path, "w", encoding="utf-8") as f:
+            build_html_to(cv, "en", f, theme=resolved_theme)
         console.print(f"Preview: [cyan]{preview_path}[/]")
         open_file(preview_path)
@@ -4,6 +4,8 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from .utils import KNOWN_KEYS, get_custom_sections  # noqa: F401  (moved to utils; kept importable here)
+
 
 class Contact(BaseModel):
     address: Optional[str] = None
@@ -79,24 +81,6 @@ class Publication(BaseModel):
     featured: Optional[bool] = None
 
 
-KNOWN_KEYS = {
-    "name",
-    "title",
-    "photo",
-    "contact",
-    "links",
-    "skills",
-    "profile",
-    "testimonials",
-    "experience",
-    "education",
-    "volunteering",
-    "references",
-    "certifications",
-    "publications",
-}
-
-
 class CVSchema(BaseModel):
     model_config = {"extra": "allow"}
 
@@ -116,11 +100,6 @@ class CVSchema(BaseModel):
     publications: Optional[list[Publication]] = None
 
 
-def get_custom_sections(cv: dict) -> dict[str, list]:
-    """Return custom sections — any top-level list not in the known schema keys."""
-    return {k: v for k, v in cv.items() if k not in KNOWN_KEYS and isinstance(v, list)}
-
-
 def validate_cv(data: dict) -> CVSchema:
     """Validate CV data against the schema. Raises ValidationError on failure."""
-    return CVSchema(**data)
+    return CVSchema.model_validate(data)
@@ -1,22 +1,23 @@
 """Suggest command — AI-powered CV content improvement suggestions."""
 
-import json
 from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
-import yaml
 
+from . import llm_cache
 from .console import console, err_console
-from .utils import DEFAULT_YAML, load_cv
+from .utils import DEFAULT_YAML, cv_yaml_cached, json_loads, load_cv
 
 
-def suggest_improvements(cv: dict) -> dict:
+def suggest_improvements(cv: dict, use_cache: bool | None = None) -> dict:
     """Analyze CV via LLM and return improvement suggestions.
 
+    Responses are only cached when use_cache is True, or it is None and RESUMAKE_LLM_CACHE=1.
+
     Returns: {suggestions: [{section, original, suggested, reason}], general: [str]}
     """
-    from .llm import get_provider, strip_yaml_fences
+    from .llm import get_provider
 
     try:
         provider = get_provider()
@@ -25,54 +26,74 @@ def suggest_improvements(cv: dict) -> dict:
         err_console.print("Set ANTHROPIC_API_KEY or OPENAI_API_KEY.")
         raise SystemExit(1)
 
-    cv_yaml = yaml.dump(cv, allow_unicode=True, default_flow_style=False, sort_keys=False)
-
-    with console.status("Analyzing CV for improvements..."):
-        response = provider.complete(
-            "Analyze the following CV and suggest improvements.\n\n"
-            "Apply the STAR method (Situation, Task, Action, Result) to rewrite weak bullets:\n"
-            "- Situation: set the scene (team size, scope, industry context)\n"
-            "- Task: what you were responsible for\n"
-            "- Action: what you specifically did\n"
-            "- Result: measurable outcome (numbers, percentages, time saved)\n"
-            "Prefer fewer, more detailed STAR bullets over many shallow ones.\n\n"
-            "Also focus on:\n"
-            "1. Quantifying achievements (add numbers, percentages, metrics)\n"
-            "2. Using stronger action verbs (led, architected, delivered vs worked on, helped)\n"
-            "3. Removing vague language (e.g. 'conducted market research' → specific STAR bullet)\n"
-            "4. ATS readability improvements\n"
-            "5. Any missing or weak sections\n\n"
-            "Return ONLY valid JSON with this structure:\n"
-            '{"suggestions": [{"section": "experience", "original": "original text", '
-            '"suggested": "improved text", "reason": "why this is better"}], '
-            '"general": ["general advice 1", "general advice 2"]}\n\n'
-            f"CV:\n{cv_yaml}",
-            max_tokens=4096,
-        )
-
-    # Parse JSON response
+    cv_yaml = cv_yaml_cached(cv)
+    prompt = (
+        "Analyze the following CV and suggest improvements.\n\n"
+        "Apply the STAR method (Situation, Task, Action, Result) to rewrite weak bullets:\n"
+        "- Situation: set the scene (team size, scope, industry context)\n"
+        "- Task: what you were responsible for\n"
+        "- Action: what you specifically did\n"
+        "- Result: measurable outcome (numbers, percentages, time saved)\n"
+        "Prefer fewer, more detailed STAR bullets over many shallow ones.\n\n"
+        "Also focus on:\n"
+        "1. Quantifying achievements (add numbers, percentages, metrics)\n"
+        "2. Using stronger action verbs (led, architected, delivered vs worked on, helped)\n"
+        "3. Removing vague language (e.g. 'conducted market research' → specific STAR bullet)\n"
+        "4. ATS readability improvements\n"
+        "5. Any missing or weak sections\n\n"
+        "Return ONLY valid JSON with this structure:\n"
+        '{"suggestions": [{"section": "experience", "original": "original text", '
+        '"suggested": "improved text", "reason": "why this is better"}], '
+        '"general": ["general advice 1", "general advice 2"]}\n\n'
+        f"CV:\n{cv_yaml}"
+    )
+
+    use_cache = llm_cache.opted_in(use_cache)
+    cache_key = llm_cache.request_key(provider, prompt, 4096)
+    response = llm_cache.get(cache_key) if use_cache else None
+    cached = response is not None
+    if not cached:
+        with console.status("Analyzing CV for improvements..."):
+            response = provider.complete(prompt, max_tokens=4096)
+
+    result = _parse_suggestions(response)
+    if result is None:
+        return {"suggestions": [], "general": ["Could not parse LLM response. Try again."]}
+    if use_cache and not cached:
+        llm_cache.put(cache_key, response)
+    return result
+
+
+def _parse_suggestions(response: str) -> dict | None:
+    """Parse the JSON suggestions from an LLM response, or None if it isn't valid JSON."""
+    from .llm import strip_yaml_fences
+
     clean = strip_yaml_fences(response).strip()
     try:
-        return json.loads(clean)
-    except json.JSONDecodeError:
+        return json_loads(clean)
+    except ValueError:
         # Try to extract JSON from response
         start = clean.find("{")
         end = clean.rfind("}") + 1
         if start >= 0 and end > start:
             try:
-                return json.loads(clean[start:end])
-            except json.JSONDecodeError:
+                return json_loads(clean[start:end])
+            except ValueError:
                 pass
-        return {"suggestions": [], "general": ["Could not parse LLM response. Try again."]}
+        return None
 
 
 def suggest(
     source: Annotated[Optional[Path], typer.Option(help="Path to source YAML.")] = None,
+    cache: Annotated[
+        Optional[bool],
+        typer.Option("--cache/--no-cache", help="Reuse the cached suggestions for an unchanged CV (default: off)."),
+    ] = None,
 ):
     """Analyze your CV and suggest improvements using AI."""
     source = source or DEFAULT_YAML
     cv = load_cv(source)
-    result = suggest_improvements(cv)
+    result = suggest_improvements(cv, use_cache=cache)
 
     suggestions = result.get("suggestions", [])
     general = result.get("general", [])
@@ -1,58 +1,74 @@
 """Tailor command — produce a CV variant emphasizing relevant experience for a project/job."""
 
-import re
 from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
 import yaml
 
+from . import llm_cache
 from .config import load_config, resolve
 from .console import console, err_console
-from .docx_builder import build_docx
-from .llm import get_provider, strip_yaml_fences
-from .theme import load_theme
-from .translate import translate_cv
-from .utils import DEFAULT_YAML, OUTPUT_DIR, convert_to_pdf, load_cv, open_file, slugify_name
-
-
-def tailor_cv(cv: dict, description_text: str) -> dict:
-    """Use an LLM to tailor the CV for a specific project/job description."""
+from .llm import cached_block, get_provider, strip_yaml_fences
+from .utils import (
+    DEFAULT_YAML,
+    OUTPUT_DIR,
+    YamlLoader,
+    convert_to_pdf,
+    cv_yaml_cached,
+    load_cv,
+    open_file,
+    slugify,
+    slugify_name,
+)
+
+_TAILOR_INSTRUCTIONS = (
+    "You are a professional CV consultant. Given a CV in YAML format and a project/job description, "
+    "produce a tailored version of the CV that highlights the most relevant experience and skills.\n\n"
+    "Rules:\n"
+    "- Return ONLY the tailored YAML — no explanation, no code fences.\n"
+    "- Keep the exact same YAML structure and keys.\n"
+    "- Do NOT invent, fabricate, or add any new content that isn't in the original CV.\n"
+    "- Rewrite the profile summary to emphasize relevance to the description.\n"
+    "- Reorder the experience entries so the most relevant ones come first.\n"
+    "- For each experience entry, you may reorder bullets to foreground relevant ones.\n"
+    "- You may slightly rephrase bullets to better highlight relevance, but do not change facts.\n"
+    "- When rephrasing, apply the STAR method: lead with context (situation/task), "
+    "then action, then measurable result.\n"
+    "- Keep all experience entries — do not remove any.\n"
+    "- Reorder skills to foreground the most relevant ones.\n"
+    "- Keep education, certifications, publications, volunteering, and references unchanged."
+)
+
+
+def tailor_cv(cv: dict, description_text: str, use_cache: bool | None = None) -> dict:
+    """Use an LLM to tailor the CV for a specific project/job description.
+
+    Responses are only cached when use_cache is True, or it is None and RESUMAKE_LLM_CACHE=1.
+    """
     provider = get_provider()
 
-    cv_yaml = yaml.dump(cv, allow_unicode=True, default_flow_style=False, sort_keys=False)
+    # Instructions + CV form a stable prefix that providers can cache across jobs (e.g. in --batch);
+    # only the description, sent last, varies between calls
+    system_blocks = [
+        {"type": "text", "text": _TAILOR_INSTRUCTIONS},
+        cached_block(f"CV YAML:\n{cv_yaml_cached(cv)}"),
+    ]
+
+    prompt = f"PROJECT/JOB DESCRIPTION:\n{description_text}"
+    use_cache = llm_cache.opted_in(use_cache)
+    cache_key = llm_cache.request_key(provider, prompt, 8192, system_blocks)
+    response = llm_cache.get(cache_key) if use_cache else None
+    if response is not None:
+        return yaml.load(strip_yaml_fences(response), Loader=YamlLoader)
 
     with console.status("Tailoring CV via LLM..."):
-        response = provider.complete(
-            "You are a professional CV consultant. Given a CV in YAML format and a project/job description, "
-            "produce a tailored version of the CV that highlights the most relevant experience and skills.\n\n"
-            "Rules:\n"
-            "- Return ONLY the tailored YAML — no explanation, no code fences.\n"
-            "- Keep the exact same YAML structure and keys.\n"
-            "- Do NOT invent, fabricate, or add any new content that isn't in the original CV.\n"
-            "- Rewrite the profile summary to emphasize relevance to the description.\n"
-            "- Reorder the experience entries so the most relevant ones come first.\n"
-            "- For each experience entry, you may reorder bullets to foreground relevant ones.\n"
-            "- You may slightly rephrase bullets to better highlight relevance, but do not change facts.\n"
-            "- When rephrasing, apply the STAR method: lead with context (situation/task), "
-            "then action, then measurable result.\n"
-            "- Keep all experience entries — do not remove any.\n"
-            "- Reorder skills to foreground the most relevant ones.\n"
-            "- Keep education, certifications, publications, volunteering, and references unchanged.\n\n"
-            f"PROJECT/JOB DESCRIPTION:\n{description_text}\n\n"
-            f"CV YAML:\n{cv_yaml}",
-            max_tokens=8192,
-        )
-
-    tailored_yaml = strip_yaml_fences(response)
-    return yaml.safe_load(tailored_yaml)
-
-
-def _slugify(text: str, max_len: int = 30) -> str:
-    """Create a filesystem-safe slug from text."""
-    slug = re.sub(r"[^\w\s-]", "", text.lower())
-    slug = re.sub(r"[\s_]+", "_", slug).strip("_")
-    return slug[:max_len]
+        response = provider.complete(prompt, max_tokens=8192, system_blocks=system_blocks)
+
+    tailored = yaml.load(strip_yaml_fences(response), Loader=YamlLoader)
+    if use_cache and isinstance(tailored, dict):
+        llm_cache.put(cache_key, response)
+    return tailored
 
 
 def tailor(
@@ -71,8 +87,16 @@ def tailor(
     batch: Annotated[
         bool, typer.Option("--batch", help="Treat path as a directory and tailor for each .txt/.md file.")
     ] = False,
+    cache: Annotated[
+        Optional[bool],
+        typer.Option("--cache/--no-cache", help="Reuse a cached tailoring for the same CV and job (default: off)."),
+    ] = None,
 ):
     """Produce a tailored CV variant for a specific project or job description."""
+    from .docx_builder import build_docx
+    from .theme import load_theme
+    from .translate import translate_cv
+
     cfg = load_config()
     lang = resolve(lang, cfg.lang, "en")
     source = Path(resolve(source, cfg.source, str(DEFAULT_YAML)))
@@ -81,7 +105,7 @@ def tailor(
     theme = resolve(theme, cfg.theme, None)
 
     if batch:
-        _tailor_batch(description_file, lang, source, pdf, open, theme)
+        _tailor_batch(description_file, lang, source, pdf, open, theme, use_cache=cache)
         return
 
     if not description_file.exists():
@@ -95,7 +119,7 @@ def tailor(
 
     # Load and tailor the EN CV
     cv_en = load_cv(source)
-    tailored_cv = tailor_cv(cv_en, description_text)
+    tailored_cv = tailor_cv(cv_en, description_text, use_cache=cache)
 
     # Translate if needed
     if lang != "en":
@@ -103,7 +127,7 @@ def tailor(
 
     # Build the docx — use a custom output filename
     resolved_theme = load_theme(theme)
-    slug = _slugify(description_file.stem)
+    slug = slugify(description_file.stem)
     output_path = build_docx(tailored_cv, lang, theme=resolved_theme)
 
     # Rename to tailored filename
@@ -126,10 +150,22 @@ def tailor(
             open_file(p)
 
 
-def _tailor_batch(directory: Path, lang: str, source: Path, pdf: bool, open_files: bool, theme_name: str | None):
+def _tailor_batch(
+    directory: Path,
+    lang: str,
+    source: Path,
+    pdf: bool,
+    open_files: bool,
+    theme_name: str | None,
+    use_cache: bool | None = None,
+):
     """Process all .txt/.md files in a directory as job descriptions."""
     from rich.table import Table
 
+    from .docx_builder import build_docx
+    from .theme import load_theme
+    from .translate import translate_cv
+
     if not directory.is_dir():
         err_console.print(f"[red]Error:[/] '{directory}' is not a directory. Use --batch with a directory path.")
         raise typer.Exit(1)
@@ -153,12 +189,12 @@ def _tailor_batch(directory: Path, lang: str, source: Path, pdf: bool, open_file
 
         try:
             console.print(f"[dim]Processing: {desc_file.name}...[/]")
-            tailored_cv = tailor_cv(cv_en, desc_text)
+            tailored_cv = tailor_cv(cv_en, desc_text, use_cache=use_cache)
             if lang != "en":
                 tailored_cv = translate_cv(tailored_cv, lang=lang, retranslate=True)
 
             output_path = build_docx(tailored_cv, lang, theme=resolved_theme)
-            slug = _slugify(desc_file.stem)
+            slug = slugify(desc_file.stem)
             OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
             tailored_filename = f"{name_slug}_CV_{lang.upper()}_tailored_{slug}.docx"
             tailored_path = OUTPUT_DIR / tailored_filename
@@ -1,16 +1,20 @@
 """Theme system for resumake — colors, fonts, layout, sizes."""
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import yaml
 from docx.shared import RGBColor
 
+from .utils import YamlLoader
+
 PACKAGE_DIR = Path(__file__).resolve().parent
 BUILTIN_THEMES_DIR = PACKAGE_DIR / "themes"
 
 
+@lru_cache(maxsize=64)
 def _hex_to_rgb(hex_str: str) -> RGBColor:
     """Convert a hex string like '0F141F' to an RGBColor."""
     h = hex_str.lstrip("#")
@@ -116,19 +120,19 @@ def load_theme(name_or_path: Optional[str] = None) -> Theme:
         cwd_theme = Path.cwd() / "theme.yaml"
         if cwd_theme.exists():
             with open(cwd_theme, "r", encoding="utf-8") as f:
-                return _theme_from_dict(yaml.safe_load(f))
+                return _theme_from_dict(yaml.load(f, Loader=YamlLoader))
         return Theme()  # classic defaults
 
     path = Path(name_or_path)
     if path.suffix in (".yaml", ".yml") and path.exists():
         with open(path, "r", encoding="utf-8") as f:
-            return _theme_from_dict(yaml.safe_load(f))
+            return _theme_from_dict(yaml.load(f, Loader=YamlLoader))
 
     # Look up built-in theme by name
     builtin = BUILTIN_THEMES_DIR / f"{name_or_path}.yaml"
     if builtin.exists():
         with open(builtin, "r", encoding="utf-8") as f:
-            return _theme_from_dict(yaml.safe_load(f))
+            return _theme_from_dict(yaml.load(f, Loader=YamlLoader))
 
     raise ValueError(f"Theme not found: '{name_or_path}'. Available built-in themes: {list_themes()}")
 
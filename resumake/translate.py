@@ -8,18 +8,19 @@ Architecture: extract-translate-merge
 
 import copy
 import hashlib
+import json
+from pathlib import Path
 
 import yaml
 
-from .console import console, err_console
+from .console import console, err_console, status
 from .llm import get_provider, strip_yaml_fences
-from .schema import get_custom_sections
-from .utils import LABELS, OUTPUT_DIR, cache_file_for, load_cv
+from .utils import LABELS, YamlDumper, cache_file_for, get_custom_sections, json_dumps, json_loads, load_cv
 
 
 def _source_hash(cv: dict) -> str:
     """Compute a hash of the source CV to detect changes."""
-    cv_yaml = yaml.dump(cv, allow_unicode=True, default_flow_style=False, sort_keys=True)
+    cv_yaml = yaml.dump(cv, Dumper=YamlDumper, allow_unicode=True, default_flow_style=False, sort_keys=True)
     return hashlib.sha256(cv_yaml.encode()).hexdigest()[:16]
 
 
@@ -204,35 +205,100 @@ def _cache_is_valid(cv: dict, lang: str) -> bool:
     return True
 
 
-def _labels_yaml() -> str:
-    """Build the English labels YAML block for the LLM to translate."""
-    return yaml.dump(LABELS["en"], allow_unicode=True, default_flow_style=False, sort_keys=False)
+# Strings sent to the LLM per request when filling the per-string cache
+TRANSLATE_BATCH_SIZE = 50
 
 
-def _parse_yaml_response(response: str, provider, lang: str) -> dict:
-    """Parse YAML from LLM response, retrying once if malformed."""
-    translated_yaml = strip_yaml_fences(response)
+def _collect_strings(node, out: list[str]) -> None:
+    """Append every string leaf of a nested dict/list structure to out, depth-first."""
+    if isinstance(node, str):
+        out.append(node)
+    elif isinstance(node, dict):
+        for value in node.values():
+            _collect_strings(value, out)
+    elif isinstance(node, list):
+        for value in node:
+            _collect_strings(value, out)
+
+
+def _replace_strings(node, table: dict[str, str]):
+    """Rebuild a nested structure with each string leaf swapped for its entry in table (if any)."""
+    if isinstance(node, str):
+        return table.get(node, node)
+    if isinstance(node, dict):
+        return {k: _replace_strings(v, table) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_replace_strings(v, table) for v in node]
+    return node
+
+
+def _string_key(lang: str, text: str) -> str:
+    return hashlib.sha256(f"{lang}:{text}".encode()).hexdigest()[:16]
+
+
+def _string_cache_file(lang: str) -> Path:
+    """Per-string translation cache, next to the whole-CV cache file."""
+    return cache_file_for(lang).parent / ".translate_cache" / f"{lang}.json"
+
+
+def _load_string_cache(lang: str) -> dict[str, str]:
+    try:
+        data = json_loads(_string_cache_file(lang).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_string_cache(lang: str, entries: dict[str, str]) -> None:
+    path = _string_cache_file(lang)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json_dumps(entries), encoding="utf-8")
+
+
+def _parse_string_batch(response: str, expected: int) -> list[str] | None:
+    """Parse a JSON array of translated strings, or None if it's malformed or the wrong length."""
+    clean = strip_yaml_fences(response)
     try:
-        return yaml.safe_load(translated_yaml)
-    except yaml.YAMLError as e:
-        console.print("[yellow]LLM returned malformed YAML, retrying...[/]")
-        with console.status(f"Fixing YAML for {lang.upper()} translation..."):
-            fixed = provider.complete(
-                "The following YAML is malformed and cannot be parsed. "
-                "Fix the YAML syntax errors and return ONLY the corrected YAML. "
-                "Common issues: unquoted strings containing colons or special characters "
-                "need to be wrapped in double quotes. Multi-line text should use the > or | "
-                "YAML block scalar syntax. Do NOT add any explanation.\n\n"
-                f"{translated_yaml}",
-                max_tokens=16384,
-            )
-        fixed_yaml = strip_yaml_fences(fixed)
+        result = json_loads(clean)
+    except ValueError:
+        start = clean.find("[")
+        if start < 0:
+            return None
         try:
-            return yaml.safe_load(fixed_yaml)
-        except yaml.YAMLError:
-            err_console.print("[red]Error:[/] Could not parse translated YAML after retry.")
-            err_console.print("[dim]Run [bold]resumake build[/] to try again.[/]")
-            raise SystemExit(1) from e
+            result, _end = json.JSONDecoder().raw_decode(clean, start)
+        except ValueError:
+            return None
+    if not isinstance(result, list) or len(result) != expected or not all(isinstance(r, str) for r in result):
+        return None
+    return result
+
+
+def _translate_batch(provider, batch: list[str], lang: str) -> list[str] | None:
+    """Translate one batch of strings, retrying once if the reply doesn't line up with the input."""
+    prompt = (
+        f"Translate each string in the following JSON array from English to {lang.upper()}. "
+        "The strings are fragments of a senior-level CV (job titles, descriptions, bullets, skills, "
+        "section labels). Use professional wording. Do NOT translate technology names, tool names, "
+        "or framework names. Return ONLY a JSON array of the translated strings, in the same order "
+        "and with exactly the same number of items — no explanation, no code fences.\n\n"
+        f"{json_dumps(batch)}"
+    )
+    for attempt in range(2):
+        if attempt:
+            console.print("[yellow]LLM returned a malformed translation batch, retrying...[/]")
+        with status(f"Translating {len(batch)} strings to {lang.upper()} via LLM..."):
+            response = provider.complete(prompt, max_tokens=16384)
+        translated = _parse_string_batch(response, len(batch))
+        if translated is not None:
+            return translated
+    return None
+
+
+def _load_cached_cv(cache: Path) -> dict:
+    cached = load_cv(cache, validate=False)
+    cached.pop("_source_hash", None)
+    cached.pop("_labels", None)
+    return cached
 
 
 def translate_cv(cv: dict, lang: str = "de", retranslate: bool = False) -> dict:
@@ -243,75 +309,82 @@ def translate_cv(cv: dict, lang: str = "de", retranslate: bool = False) -> dict:
     2. Send that subset to the LLM (photo, URLs, dates, etc. never leave)
     3. Merge translated text back into the original CV skeleton
 
-    Uses cached translation if available, unless retranslate is True.
+    Individual strings are cached by content in ``output/.translate_cache/<lang>.json``, so after
+    an edit only the strings that changed go back to the LLM. With retranslate=True neither that
+    cache nor the whole-CV translation is read and every string is translated afresh; the results
+    still refresh both caches.
     """
+    if lang == "en":
+        return cv
+
     cache = cache_file_for(lang)
 
     if not retranslate and _cache_is_valid(cv, lang):
         console.print(f"[dim]Using cached translation from {cache}[/]")
-        cached = load_cv(cache, validate=False)
-        cached.pop("_source_hash", None)
-        cached.pop("_labels", None)
-        return cached
+        return _load_cached_cv(cache)
 
-    try:
-        provider = get_provider()
-    except RuntimeError:
-        if cache.exists():
-            console.print("[yellow]No LLM provider available — falling back to cached translation.[/]")
-            cached = load_cv(cache, validate=False)
-            cached.pop("_source_hash", None)
-            cached.pop("_labels", None)
-            return cached
-        err_console.print("[red]Error:[/] No LLM provider available and no cached translation found.")
-        err_console.print("Set ANTHROPIC_API_KEY or OPENAI_API_KEY to enable AI features.")
-        raise SystemExit(1)
-
-    # Send ONLY translatable text to the LLM
+    # Send ONLY translatable text to the LLM; labels go through the same string cache
     translatable = _extract_translatable(cv)
-    translatable_yaml = yaml.dump(translatable, allow_unicode=True, default_flow_style=False, sort_keys=False)
-    labels_yaml = _labels_yaml()
-
-    with console.status(f"Translating CV to {lang.upper()} via LLM..."):
-        response = provider.complete(
-            f"Translate the following CV content from English to {lang.upper()}. "
-            "Return ONLY the translated YAML — no explanation, no code fences. "
-            "Keep the YAML structure and ALL keys exactly the same (keys stay in English). "
-            "You MUST include every section and every list item from the original. "
-            "Preserve the exact same YAML formatting as the input. "
-            "Use quoted strings where the input uses them. Use > or | block scalars for "
-            "multi-line text. Strings containing colons MUST be quoted. "
-            "Translate all text values to professional {lang} suitable for a senior-level CV. "
-            "Do NOT translate technology names, tool names, or framework names.\n\n"
-            "IMPORTANT: At the end of the YAML, add a top-level key `_labels` "
-            "with translated UI labels. "
-            f"Here are the English labels to translate:\n\n_labels:\n{labels_yaml}\n"
-            f"Here is the CV content to translate:\n\n{translatable_yaml}",
-            max_tokens=16384,
-        )
-
-    translated_text = _parse_yaml_response(response, provider, lang)
-
-    # Extract labels before merging
-    translated_labels = translated_text.pop("_labels", None)
-
-    # Validate the translated text covers all sections
-    problems = _validate_translation(translatable, translated_text)
-    if problems:
-        console.print(f"[yellow]Warning:[/] Translation incomplete — missing: {', '.join(problems)}")
-        console.print("[dim]Run [bold]resumake build[/] to try again.[/]")
+    strings: list[str] = []
+    _collect_strings(translatable, strings)
+    _collect_strings(LABELS["en"], strings)
+
+    string_cache = {} if retranslate else _load_string_cache(lang)
+    table: dict[str, str] = {}
+    pending: list[str] = []
+    for text in dict.fromkeys(strings):
+        hit = string_cache.get(_string_key(lang, text))
+        if hit is not None:
+            table[text] = hit
+        else:
+            pending.append(text)
+
+    failed = 0
+    if pending:
+        try:
+            provider = get_provider()
+        except RuntimeError:
+            if cache.exists():
+                console.print("[yellow]No LLM provider available — falling back to cached translation.[/]")
+                return _load_cached_cv(cache)
+            err_console.print("[red]Error:[/] No LLM provider available and no cached translation found.")
+            err_console.print("Set ANTHROPIC_API_KEY or OPENAI_API_KEY to enable AI features.")
+            raise SystemExit(1)
+
+        if table:
+            console.print(f"[dim]Reusing {len(table)} cached strings, translating {len(pending)} new ones.[/]")
+        for i in range(0, len(pending), TRANSLATE_BATCH_SIZE):
+            batch = pending[i : i + TRANSLATE_BATCH_SIZE]
+            translated = _translate_batch(provider, batch, lang)
+            if translated is None:
+                failed += len(batch)
+                continue
+            for src, dst in zip(batch, translated):
+                table[src] = dst
+                string_cache[_string_key(lang, src)] = dst
+        if retranslate:
+            string_cache = {**_load_string_cache(lang), **string_cache}
+        _save_string_cache(lang, string_cache)
+        if failed:
+            console.print(f"[yellow]Warning:[/] Translation incomplete — {failed} strings left in English.")
+            console.print("[dim]Run [bold]resumake build[/] to try again.[/]")
+
+    translated_text = _replace_strings(translatable, table)
+    translated_labels = _replace_strings(LABELS["en"], table)
 
     # Merge translated text back into the full CV (preserves photo, URLs, dates, etc.)
     translated_cv = _merge_translation(cv, translated_text)
+    if failed:
+        # Not cached as a whole, so the next run retries the strings that are still in English
+        return translated_cv
 
     # Save full translated CV with source hash and labels for cache
     cache_data = dict(translated_cv)
     cache_data["_source_hash"] = _source_hash(cv)
-    if translated_labels:
-        cache_data["_labels"] = translated_labels
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    cache_data["_labels"] = translated_labels
+    cache.parent.mkdir(parents=True, exist_ok=True)
     with open(cache, "w", encoding="utf-8") as f:
-        yaml.dump(cache_data, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+        yaml.dump(cache_data, f, Dumper=YamlDumper, allow_unicode=True, default_flow_style=False, sort_keys=False)
     console.print(f"[dim]Cached translation to {cache}[/]")
 
     return translated_cv
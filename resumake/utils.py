@@ -1,13 +1,42 @@
 """Shared constants, paths, colors, labels, and helpers."""
 
+import hashlib
+import json
 import os
+import pickle
 import platform
 import re
 import subprocess
+import threading
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
+# libyaml-backed loader/dumper when PyYAML was built with it; pure-Python fallback otherwise
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+try:
+    import orjson
+except ImportError:  # optional "fast" extra
+    orjson = None
+
+
+def json_loads(data: str | bytes):
+    """Parse JSON with orjson when installed, else the stdlib. Raises ValueError on bad input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    """Serialize to compact UTF-8 JSON with orjson when installed, else the stdlib."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
 # ── Paths ──
 PACKAGE_DIR = Path(__file__).resolve().parent
 BUILTIN_ASSETS_DIR = PACKAGE_DIR / "assets"
@@ -17,12 +46,47 @@ DEFAULT_YAML = BASE_DIR / "cv.yaml"
 OUTPUT_DIR = BASE_DIR / "output"
 ASSETS_DIR = BASE_DIR / "assets"
 
+# Per-user cache root for derived data (LLM responses, parsed YAML)
+USER_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "resumake"
+YAML_CACHE_DIR = USER_CACHE_DIR / "yaml"
+
+
+def cache_enabled() -> bool:
+    """False when RESUMAKE_NO_CACHE is set, which bypasses every on-disk cache."""
+    return os.environ.get("RESUMAKE_NO_CACHE", "") not in ("1", "true", "yes")
+
 
 def cache_file_for(lang: str) -> Path:
     """Return the cache file path for a given language."""
     return OUTPUT_DIR / f".cv_{lang}_cache.yaml"
 
 
+# ── Custom sections ──
+KNOWN_KEYS = frozenset(
+    {
+        "name",
+        "title",
+        "photo",
+        "contact",
+        "links",
+        "skills",
+        "profile",
+        "testimonials",
+        "experience",
+        "education",
+        "volunteering",
+        "references",
+        "certifications",
+        "publications",
+    }
+)
+
+
+def get_custom_sections(cv: dict) -> dict[str, list]:
+    """Return custom sections — any top-level list not in the known schema keys."""
+    return {k: v for k, v in cv.items() if k not in KNOWN_KEYS and isinstance(v, list)}
+
+
 # ── Section icons ──
 SECTION_ICONS = {
     "Profile": "icon_profile.png",
@@ -84,7 +148,7 @@ def get_labels(lang: str) -> dict[str, str]:
     cache = cache_file_for(lang)
     if cache.exists():
         with open(cache, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YamlLoader)
         if data and "_labels" in data:
             return data["_labels"]
     return LABELS["en"]
@@ -117,6 +181,7 @@ MONTH_MAP = {
 }
 
 
+@lru_cache(maxsize=512)
 def parse_start_date(date_str: str) -> tuple:
     """Parse a start date string into (year, month) for sorting. Higher = more recent."""
     parts = date_str.strip().lower().split()
@@ -136,6 +201,44 @@ def parse_start_date(date_str: str) -> tuple:
     return (0, 0)
 
 
+def _yaml_cache_stem(yaml_path: Path) -> str:
+    return hashlib.sha256(str(yaml_path.resolve()).encode()).hexdigest()[:32]
+
+
+def _load_yaml_cached(yaml_path: Path):
+    """Parse a YAML file, reusing a pickled parse while the file's mtime and size are unchanged.
+
+    One pickle per source path lives in YAML_CACHE_DIR and is overwritten when the file changes.
+    The stamp is pickled ahead of the data, so a stale entry is rejected without unpickling the
+    document. Pickle (rather than JSON) keeps the types YAML produces, such as dates, intact.
+    """
+    st = yaml_path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cache_file = YAML_CACHE_DIR / f"{_yaml_cache_stem(yaml_path)}.pkl"
+    if cache_enabled():
+        try:
+            with open(cache_file, "rb") as f:
+                if pickle.load(f) == stamp:
+                    return pickle.load(f)
+        except Exception:
+            pass  # Missing, stale-format or corrupt cache entry — reparse
+
+    with open(yaml_path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=YamlLoader)
+
+    if cache_enabled():
+        try:
+            YAML_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(stamp, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass
+    return data
+
+
 def load_cv(yaml_path: Path, validate: bool = True) -> dict:
     """Load CV data from a YAML file, optionally validating against the schema."""
     if not yaml_path.exists():
@@ -144,15 +247,67 @@ def load_cv(yaml_path: Path, validate: bool = True) -> dict:
         err_console.print(f"[red]Error:[/] CV file not found: [bold]{yaml_path}[/]")
         err_console.print("\nTo get started, run: [bold]resumake init[/]")
         raise SystemExit(1)
-    with open(yaml_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = _load_yaml_cached(yaml_path)
     if validate:
-        from .schema import validate_cv
-
-        validate_cv(data)
+        _validate_once(yaml_path, data)
     return data
 
 
+def _validate_once(yaml_path: Path, data: dict) -> None:
+    """Validate CV data unless this exact file already passed against this exact schema.
+
+    A pass is recorded next to the parsed-YAML cache as the file's and schema.py's stamps, so
+    repeat runs on an unchanged CV skip both validation and the pydantic import.
+    """
+    try:
+        st, schema_st = yaml_path.stat(), (PACKAGE_DIR / "schema.py").stat()
+        token = f"{st.st_mtime_ns}:{st.st_size}:{schema_st.st_mtime_ns}:{schema_st.st_size}"
+    except OSError:
+        token = None
+    marker = YAML_CACHE_DIR / f"{_yaml_cache_stem(yaml_path)}.valid"
+    if token and cache_enabled():
+        try:
+            if marker.read_text() == token:
+                return
+        except OSError:
+            pass
+
+    from .schema import validate_cv
+
+    validate_cv(data)
+    if token and cache_enabled():
+        try:
+            YAML_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            marker.write_text(token)
+        except OSError:
+            pass
+
+
+_CV_YAML_CACHE: dict[str, str] = {}
+_CV_YAML_CACHE_SIZE = 4
+# The web server and the parallel build/cover-letter pools call cv_yaml_cached from several threads
+_CV_YAML_CACHE_LOCK = threading.Lock()
+
+
+def cv_yaml_cached(cv: dict) -> str:
+    """Serialize a CV to YAML for LLM prompts, reusing the result for identical content.
+
+    Keyed by the CV's JSON form (cheap with the C json encoder), so several prompts built from the
+    same CV in one process — the web UI, or translation after tailoring — dump it only once.
+    """
+    key = json.dumps(cv, ensure_ascii=False, default=str)
+    with _CV_YAML_CACHE_LOCK:
+        text = _CV_YAML_CACHE.get(key)
+    if text is None:
+        # Dump outside the lock; two threads racing on the same CV just produce the same text twice
+        text = yaml.dump(cv, Dumper=YamlDumper, allow_unicode=True, default_flow_style=False, sort_keys=False)
+        with _CV_YAML_CACHE_LOCK:
+            if key not in _CV_YAML_CACHE and len(_CV_YAML_CACHE) >= _CV_YAML_CACHE_SIZE:
+                _CV_YAML_CACHE.pop(next(iter(_CV_YAML_CACHE)))
+            text = _CV_YAML_CACHE.setdefault(key, text)
+    return text
+
+
 def open_file(path: Path):
     """Open a file with the system default application."""
     if platform.system() == "Darwin":
@@ -164,20 +319,34 @@ def open_file(path: Path):
 
 
 def convert_to_pdf(docx_path: Path) -> Path:
-    """Convert a .docx file to PDF."""
-    try:
-        from docx2pdf import convert
-    except ImportError:
-        from .console import err_console
+    """Convert a .docx file to PDF (shared unoserver daemon if installed, else docx2pdf)."""
+    from .pdf import convert_docx_to_pdf
 
-        err_console.print("[red]Error:[/] 'docx2pdf' package required for PDF generation.")
-        err_console.print("Install with: [bold]uv tool install resumakeai --with docx2pdf[/]")
-        raise SystemExit(1)
-    pdf_path = docx_path.with_suffix(".pdf")
-    convert(str(docx_path), str(pdf_path))
-    return pdf_path
+    return convert_docx_to_pdf(docx_path)
+
+
+@lru_cache(maxsize=1024)
+def escape_html(text: str) -> str:
+    """HTML-escape a string.
+
+    Memoized: labels and most CV fields are identical from one render to the next
+    (live preview, multi-language builds), and escaping is a large share of a render.
+    """
+    # Most fields contain nothing to escape; the membership tests are cheaper than four replace() passes.
+    # (str.translate is a single pass but several times slower than either for short strings.)
+    if "&" not in text and "<" not in text and ">" not in text and '"' not in text:
+        return text
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+
+
+def slugify(text: str, max_len: int = 30) -> str:
+    """Create a filesystem-safe slug from text."""
+    slug = re.sub(r"[^\w\s-]", "", text.lower())
+    slug = re.sub(r"[\s_]+", "_", slug).strip("_")
+    return slug[:max_len]
 
 
+@lru_cache(maxsize=128)
 def slugify_name(name: str) -> str:
     """Convert a name like 'Jane Doe, PhD' into 'Jane_Doe_PhD'."""
     slug = re.sub(r"[^\w\s]", "", name)
@@ -189,16 +358,10 @@ def resolve_asset(filename: str) -> Path | None:
 
     Handles both bare filenames ("profile.jpeg") and prefixed paths ("assets/profile.jpeg").
     """
-    user_path = ASSETS_DIR / filename
-    if user_path.exists():
-        return user_path
-    # Support paths like "assets/profile.jpeg" — try relative to project root
-    relative_path = BASE_DIR / filename
-    if relative_path.exists():
-        return relative_path
-    builtin_path = BUILTIN_ASSETS_DIR / filename
-    if builtin_path.exists():
-        return builtin_path
+    for path in (ASSETS_DIR / filename, BASE_DIR / filename, BUILTIN_ASSETS_DIR / filename):
+        # The BASE_DIR candidate supports paths like "assets/profile.jpeg"
+        if path.exists():
+            return path
     return None
 
 
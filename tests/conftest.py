@@ -3,6 +3,13 @@
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def _isolated_llm_cache(tmp_path, monkeypatch):
+    """Keep LLM response and parsed-YAML caching out of the user's real cache directory."""
+    monkeypatch.setattr("resumake.llm_cache.CACHE_DIR", tmp_path / "llm_cache")
+    monkeypatch.setattr("resumake.utils.YAML_CACHE_DIR", tmp_path / "yaml_cache")
+
+
 @pytest.fixture
 def sample_cv():
     """Minimal valid CV dict for testing."""
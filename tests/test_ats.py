@@ -30,7 +30,7 @@ def test_ats_return_structure():
     )
 
     class MockProvider:
-        def complete(self, prompt, max_tokens=4096):
+        def complete(self, prompt, max_tokens=4096, system_blocks=None):
             return mock_response
 
     import resumake.llm
@@ -59,3 +59,92 @@ def test_ats_missing_file():
 
     with pytest.raises(Exit):
         ats(description_file=__import__("pathlib").Path("/nonexistent"))
+
+
+def test_ats_streams_response(monkeypatch):
+    """Streaming providers are consumed chunk by chunk and the joined JSON is parsed."""
+    from resumake.ats_cmd import analyze_ats_match
+    from resumake.llm import LLMProvider
+
+    body = json.dumps({"score": 90, "matched_keywords": ["Python"], "missing_keywords": []})
+
+    class StreamingProvider(LLMProvider):
+        def complete(self, prompt, max_tokens=4096, system_blocks=None):
+            raise AssertionError("complete() should not be called when streaming")
+
+        def stream(self, prompt, max_tokens=4096, system_blocks=None):
+            for i in range(0, len(body), 7):
+                yield body[i : i + 7]
+
+    monkeypatch.setattr("resumake.llm.get_provider", lambda: StreamingProvider())
+    result = analyze_ats_match({"name": "Jane"}, "Python developer")
+    assert result["score"] == 90
+    assert result["matched_keywords"] == ["Python"]
+
+
+def test_stream_finds_score_split_across_chunks(monkeypatch):
+    """The live status picks up a score whose key and value arrive in separate chunks."""
+    from rich.spinner import Spinner
+
+    from resumake.ats_cmd import _stream_ats_response
+
+    body = "x" * 500 + '{"score" :  87, "summary": "ok"}'
+    texts = []
+    monkeypatch.setattr(Spinner, "update", lambda self, text="", **kw: texts.append(str(text)))
+
+    class StreamingProvider:
+        def stream(self, prompt, max_tokens=4096, system_blocks=None):
+            yield from body
+
+    assert _stream_ats_response(StreamingProvider(), "p", []) == body
+    assert texts[-1].endswith("score 87/100")
+    assert not any("score 8/100" in text for text in texts)
+
+
+def test_parse_ats_json_ignores_surrounding_prose():
+    """Only the first JSON object is parsed, even with braces in trailing text."""
+    from resumake.ats_cmd import _parse_ats_json
+
+    response = 'Here you go:\n{"score": 60, "summary": "ok"}\nNote: {not json}'
+    assert _parse_ats_json(response) == {"score": 60, "summary": "ok"}
+    assert _parse_ats_json("no json here") is None
+    assert _parse_ats_json('{"score": ') is None
+
+
+def test_ats_report_output(tmp_path, monkeypatch, capsys, sample_cv):
+    """The ATS report prints score, keywords, suggestions and summary."""
+    import yaml
+
+    from resumake import ats_cmd
+
+    result = {
+        "score": 85,
+        "matched_keywords": ["Python"],
+        "missing_keywords": ["Go"],
+        "suggestions": [{"keyword": "Go", "where_to_add": "skills", "phrasing": "Add Go"}],
+        "summary": "Strong match.",
+    }
+    monkeypatch.setattr(ats_cmd, "analyze_ats_match", lambda cv, text: result)
+    source = tmp_path / "cv.yaml"
+    source.write_text(yaml.dump(sample_cv), encoding="utf-8")
+    job = tmp_path / "job.txt"
+    job.write_text("Python and Go", encoding="utf-8")
+
+    ats_cmd.ats(job, source=source)
+    out = capsys.readouterr().out
+    assert "ATS Match Score: 85/100" in out
+    assert "Matched Keywords (1):" in out
+    assert "Missing Keywords (1):" in out
+    assert "Go → skills" in out
+    assert "Strong match." in out
+
+
+def test_ats_request_puts_only_job_in_user_prompt():
+    """Instructions and CV go in cacheable system blocks; the prompt holds just the job description."""
+    from resumake.ats_cmd import _ATS_INSTRUCTIONS, _ats_request
+
+    system_blocks, prompt = _ats_request({"name": "Jane"}, "Python developer")
+    assert system_blocks[0]["text"] == _ATS_INSTRUCTIONS
+    assert system_blocks[1]["text"].startswith("CV:\nname: Jane")
+    assert system_blocks[1]["cache_control"] == {"type": "ephemeral"}
+    assert prompt == "Job Description:\nPython developer"
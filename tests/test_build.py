@@ -3,13 +3,15 @@
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from resumake.docx_builder import build_docx
 from resumake.theme import Theme
 
 
 def test_build_docx_produces_file(sample_cv, monkeypatch):
     with tempfile.TemporaryDirectory() as tmpdir:
-        monkeypatch.setattr("resumake.utils.OUTPUT_DIR", Path(tmpdir))
+        monkeypatch.setattr("resumake.docx_builder.OUTPUT_DIR", Path(tmpdir))
         output = build_docx(sample_cv, "en", theme=Theme())
         assert output.exists()
         assert output.suffix == ".docx"
@@ -18,7 +20,7 @@ def test_build_docx_produces_file(sample_cv, monkeypatch):
 
 def test_build_docx_filename_from_name(sample_cv, monkeypatch):
     with tempfile.TemporaryDirectory() as tmpdir:
-        monkeypatch.setattr("resumake.utils.OUTPUT_DIR", Path(tmpdir))
+        monkeypatch.setattr("resumake.docx_builder.OUTPUT_DIR", Path(tmpdir))
         output = build_docx(sample_cv, "en", theme=Theme())
         assert "Jane_Doe" in output.name
         assert "CV_EN" in output.name
@@ -28,7 +30,7 @@ def test_build_docx_with_minimal_theme(sample_cv, monkeypatch):
     from resumake.theme import load_theme
 
     with tempfile.TemporaryDirectory() as tmpdir:
-        monkeypatch.setattr("resumake.utils.OUTPUT_DIR", Path(tmpdir))
+        monkeypatch.setattr("resumake.docx_builder.OUTPUT_DIR", Path(tmpdir))
         theme = load_theme("minimal")
         output = build_docx(sample_cv, "en", theme=theme)
         assert output.exists()
@@ -47,7 +49,7 @@ def test_build_docx_with_custom_sections(sample_cv, monkeypatch):
     ]
     sample_cv["projects"] = ["Open Source CLI tool", "Internal dashboard"]
     with tempfile.TemporaryDirectory() as tmpdir:
-        monkeypatch.setattr("resumake.utils.OUTPUT_DIR", Path(tmpdir))
+        monkeypatch.setattr("resumake.docx_builder.OUTPUT_DIR", Path(tmpdir))
         output = build_docx(sample_cv, "en", theme=Theme())
         assert output.exists()
         assert output.stat().st_size > 0
@@ -57,7 +59,7 @@ def test_build_single_column(sample_cv, monkeypatch):
     from resumake.theme import load_theme
 
     with tempfile.TemporaryDirectory() as tmpdir:
-        monkeypatch.setattr("resumake.utils.OUTPUT_DIR", Path(tmpdir))
+        monkeypatch.setattr("resumake.docx_builder.OUTPUT_DIR", Path(tmpdir))
         theme = load_theme("single-column")
         output = build_docx(sample_cv, "en", theme=theme)
         assert output.exists()
@@ -68,7 +70,7 @@ def test_build_academic(sample_cv, monkeypatch):
     from resumake.theme import load_theme
 
     with tempfile.TemporaryDirectory() as tmpdir:
-        monkeypatch.setattr("resumake.utils.OUTPUT_DIR", Path(tmpdir))
+        monkeypatch.setattr("resumake.docx_builder.OUTPUT_DIR", Path(tmpdir))
         theme = load_theme("academic")
         output = build_docx(sample_cv, "en", theme=theme)
         assert output.exists()
@@ -78,7 +80,7 @@ def test_build_compact(sample_cv, monkeypatch):
     from resumake.theme import load_theme
 
     with tempfile.TemporaryDirectory() as tmpdir:
-        monkeypatch.setattr("resumake.utils.OUTPUT_DIR", Path(tmpdir))
+        monkeypatch.setattr("resumake.docx_builder.OUTPUT_DIR", Path(tmpdir))
         theme = load_theme("compact")
         output = build_docx(sample_cv, "en", theme=theme)
         assert output.exists()
@@ -86,8 +88,208 @@ def test_build_compact(sample_cv, monkeypatch):
 
 def test_build_default_two_column(sample_cv, monkeypatch):
     with tempfile.TemporaryDirectory() as tmpdir:
-        monkeypatch.setattr("resumake.utils.OUTPUT_DIR", Path(tmpdir))
+        monkeypatch.setattr("resumake.docx_builder.OUTPUT_DIR", Path(tmpdir))
         theme = Theme()
         assert theme.layout.layout_type == "two-column"
         output = build_docx(sample_cv, "en", theme=theme)
         assert output.exists()
+
+
+def test_build_multi_lang_keeps_lang_order(sample_cv, monkeypatch, tmp_path):
+    import time
+
+    import yaml
+
+    from resumake import build as build_mod
+
+    monkeypatch.setattr("resumake.utils.OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr("resumake.docx_builder.OUTPUT_DIR", tmp_path)
+    from resumake.config import ResumakeConfig
+
+    monkeypatch.setattr(build_mod, "load_config", ResumakeConfig)
+    delays = {"de": 0.1, "fr": 0.0}
+
+    def fake_translate(cv, lang, retranslate=False):
+        time.sleep(delays[lang])
+        return {**cv, "title": f"{cv['title']} ({lang})"}
+
+    monkeypatch.setattr(build_mod, "translate_cv", fake_translate)
+    source = tmp_path / "cv.yaml"
+    source.write_text(yaml.dump(sample_cv), encoding="utf-8")
+
+    outputs = []
+    monkeypatch.setattr(build_mod, "_print_summary", outputs.extend)
+    build_mod.build(lang="en,de,fr", source=source, pdf=False, watch=False, open=False)
+    assert [p.stem.rsplit("_", 1)[-1] for p in outputs] == ["EN", "DE", "FR"]
+    assert all(p.exists() for p in outputs)
+
+
+def test_build_converts_pdfs_on_calling_thread(sample_cv, monkeypatch, tmp_path):
+    """Languages render in a pool, but DOCX-to-PDF (Word over COM) runs on the building thread, in --lang order."""
+    import threading
+
+    import yaml
+
+    from resumake import build as build_mod
+    from resumake.config import ResumakeConfig
+
+    monkeypatch.setattr("resumake.utils.OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr("resumake.docx_builder.OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr(build_mod, "load_config", ResumakeConfig)
+    monkeypatch.setattr(build_mod, "translate_cv", lambda cv, lang, retranslate=False: cv)
+    conversions = []
+
+    def fake_pdf(docx_path, engine="auto", html_content=None):
+        conversions.append((docx_path.stem, threading.current_thread()))
+        return docx_path.with_suffix(".pdf")
+
+    monkeypatch.setattr(build_mod, "convert_to_pdf_auto", fake_pdf)
+    source = tmp_path / "cv.yaml"
+    source.write_text(yaml.dump(sample_cv), encoding="utf-8")
+
+    outputs = []
+    monkeypatch.setattr(build_mod, "_print_summary", outputs.extend)
+    build_mod.build(lang="en,de", source=source, pdf=True, watch=False, open=False)
+    assert [stem for stem, _ in conversions] == ["Jane_Doe_CV_EN", "Jane_Doe_CV_DE"]
+    assert all(thread is threading.current_thread() for _, thread in conversions)
+    assert [p.suffix for p in outputs] == [".docx", ".pdf", ".docx", ".pdf"]
+
+
+def test_humanize_sizes():
+    from resumake.build import _humanize
+
+    assert _humanize(512) == "512 B"
+    assert _humanize(1024) == "1024 B"
+    assert _humanize(2048) == "2.0 KB"
+    assert _humanize(3 * 1024 * 1024) == "3.0 MB"
+    assert _humanize(5 * (1 << 30)) == "5.0 GB"
+
+
+def test_sidebar_lists_render_as_single_paragraphs(sample_cv, monkeypatch, tmp_path):
+    """Each sidebar skill group and the language list is one paragraph with a line per item."""
+    from docx import Document
+
+    monkeypatch.setattr("resumake.docx_builder.OUTPUT_DIR", tmp_path)
+    doc = Document(build_docx(sample_cv, "en", theme=Theme()))
+    sidebar = doc.tables[0].rows[0].cells[0]
+    texts = [p.text for p in sidebar.paragraphs]
+    assert "Python\nTypeScript" in texts
+    assert "English (Fluent)\nGerman (Native)" in texts
+
+
+def test_add_para_matches_python_docx_runs():
+    """The lxml-built paragraphs serialize exactly like python-docx's own add_run output."""
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Pt, RGBColor
+
+    from resumake import docx_builder
+
+    docx_builder._theme = Theme()
+    docx_builder._sz = docx_builder._theme_sizes(docx_builder._theme)
+    cell = Document().add_table(rows=1, cols=1).cell(0, 0)
+    color = RGBColor(0x12, 0x34, 0x56)
+    text = " lead\ta\nb "
+    built = docx_builder.add_para(
+        cell, text, bold=True, size=Pt(9), color=color, font_name="Arial", align=WD_ALIGN_PARAGRAPH.CENTER
+    )
+    docx_builder.add_run_to_para(built, "tail", italic=True, size=Pt(8), color=color, font_name="Arial")
+
+    expected = cell.add_paragraph()
+    expected.paragraph_format.space_before = Pt(0)
+    expected.paragraph_format.space_after = Pt(0)
+    expected.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    for chunk, bold, italic, size in ((text, True, False, Pt(9)), ("tail", False, True, Pt(8))):
+        run = expected.add_run(chunk)
+        run.bold, run.italic = bold, italic
+        run.font.size = size
+        run.font.color.rgb = color
+        run.font.name = "Arial"
+
+    assert built._p.xml == expected._p.xml
+    assert built.text == text + "tail"
+
+
+def test_absent_main_sections_are_skipped(sample_cv, monkeypatch, tmp_path):
+    """Sections missing from the CV get no heading at all, in every layout."""
+    from docx import Document
+
+    monkeypatch.setattr("resumake.docx_builder.OUTPUT_DIR", tmp_path)
+    cv = {k: v for k, v in sample_cv.items() if k not in ("education", "profile")}
+    for layout_type in ("two-column", "single-column", "academic", "compact"):
+        theme = Theme()
+        theme.layout.layout_type = layout_type
+        doc = Document(build_docx(cv, "en", theme=theme))
+        texts = [p.text for p in doc.paragraphs]
+        texts += [p.text for t in doc.tables for cell in t._cells for p in cell.paragraphs]
+        assert "EDUCATION" not in {t.strip().upper() for t in texts}
+        assert "PROFILE" not in {t.strip().upper() for t in texts}
+
+
+def test_hyperlink_label_is_escaped(sample_cv, monkeypatch, tmp_path):
+    from docx import Document
+
+    monkeypatch.setattr("resumake.docx_builder.OUTPUT_DIR", tmp_path)
+    sample_cv["links"] = [{"label": "R&D <blog>", "url": "https://example.com/?a=1&b=2"}]
+    doc = Document(build_docx(sample_cv, "en", theme=Theme()))
+    assert "R&D <blog>" in doc.tables[0].rows[0].cells[0]._tc.xpath("string(.)")
+
+
+def test_layout_table_template():
+    """The layout table is borderless with one tcW per cell, and floats only when asked."""
+    from docx import Document
+    from docx.oxml.ns import qn
+
+    from resumake.docx_builder import _add_layout_table
+
+    doc = Document()
+    table = _add_layout_table(doc, [(5.5, "0F141F", (0.3, 0.3, 0.2, 0.2)), (13.0, None, (0.2, 0.3, 0.4, 0.2))])
+    assert len(table.rows[0].cells) == 2
+    assert table._tbl.tblPr.find(qn("w:tblpPr")) is None
+    for cell in table.rows[0].cells:
+        assert len(cell._tc.tcPr.findall(qn("w:tcW"))) == 1
+    assert table.cell(0, 0)._tc.tcPr.find(qn("w:shd")).get(qn("w:fill")) == "0F141F"
+    assert table.cell(0, 1)._tc.tcPr.find(qn("w:shd")) is None
+
+    floating = _add_layout_table(doc, [(5.5, None, (0, 0, 0, 0))], float_at=(1.4, 1.0))
+    assert floating._tbl.tblPr.find(qn("w:tblpPr")).get(qn("w:tblpX")) == "793"
+    assert doc.element.body[-1].tag == qn("w:sectPr")
+
+
+def test_save_docx_writes_once(tmp_path):
+    """A document that fails to serialize leaves the previous file untouched."""
+    from docx import Document
+
+    from resumake.docx_builder import save_docx
+
+    target = tmp_path / "cv.docx"
+    save_docx(Document(), target)
+    assert target.read_bytes()[:2] == b"PK"
+
+    target.write_bytes(b"previous")
+    broken = Document()
+    broken.save = lambda stream: (stream.write(b"partial"), 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        save_docx(broken, target)
+    assert target.read_bytes() == b"previous"
+
+
+def test_section_icon_prefers_user_override(monkeypatch, tmp_path):
+    from resumake import docx_builder
+
+    monkeypatch.setattr("resumake.utils.ASSETS_DIR", tmp_path)
+    assert docx_builder._section_icon("Unknown section") is None
+    assert docx_builder._section_icon("Profile").parent.name == "assets"
+    (tmp_path / "icon_profile.png").write_bytes(b"png")
+    assert docx_builder._section_icon("Profile") == tmp_path / "icon_profile.png"
+
+
+def test_bullets_use_list_bullet_style(sample_cv, monkeypatch, tmp_path):
+    from docx import Document
+
+    monkeypatch.setattr("resumake.docx_builder.OUTPUT_DIR", tmp_path)
+    doc = Document(build_docx(sample_cv, "en", theme=Theme()))
+    bullets = [p for p in doc.paragraphs if p.style.name == "List Bullet"]
+    assert [p.text for p in bullets] == sample_cv["experience"][0]["bullets"]
+    assert all(len(p.runs) == 1 for p in bullets)
+    assert bullets[0].paragraph_format.space_after.pt == 1
@@ -0,0 +1,40 @@
+"""Tests for top-level CLI command registration."""
+
+import subprocess
+import sys
+
+import typer
+
+from resumake import _LAZY_COMMANDS, app
+
+
+def test_all_lazy_commands_resolve():
+    """Every registered subcommand imports and converts to a click command."""
+    group = typer.main.get_command(app)
+    for name in _LAZY_COMMANDS:
+        cmd = group.get_command(None, name)
+        assert cmd is not None
+        assert cmd.name == name
+
+
+def test_command_modules_not_imported_eagerly():
+    """Importing the package must not import the heavy command modules."""
+    code = "import sys, resumake; print('resumake.build' in sys.modules, 'docx' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.split() == ["False", "False"]
+
+
+def test_bio_module_defers_docx_import():
+    """Selecting bio content (as the web server does) must not load python-docx."""
+    code = "import sys, resumake.bio; print('docx' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "False"
+
+
+def test_command_surface_registered_once():
+    """The CLI exposes each subcommand exactly once and defines no eager Typer commands."""
+    group = typer.main.get_command(app)
+    names = group.list_commands(None)
+    assert len(names) == len(set(names))
+    assert "build" in names
+    assert app.registered_commands == []
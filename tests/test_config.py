@@ -82,3 +82,28 @@ def test_resumake_config_defaults():
     assert cfg.open is None
     assert cfg.source is None
     assert cfg.watch is None
+
+
+def test_load_config_memoized_until_file_changes(monkeypatch, tmp_path):
+    import os
+
+    from resumake import config
+
+    monkeypatch.setattr(Path, "home", staticmethod(lambda: tmp_path / "nohome"))
+    monkeypatch.chdir(tmp_path)
+    rc = tmp_path / ".resumakerc.yaml"
+    rc.write_text("lang: de\n")
+
+    parses = []
+    real = config._load_yaml_config
+    monkeypatch.setattr(config, "_load_yaml_config", lambda p: parses.append(p) or real(p))
+    config._load_config_cached.cache_clear()
+
+    assert config.load_config().lang == "de"
+    assert config.load_config().lang == "de"
+    assert len(parses) == 2  # home + project, parsed once
+
+    rc.write_text("lang: fr\n")
+    st = rc.stat()
+    os.utime(rc, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert config.load_config().lang == "fr"
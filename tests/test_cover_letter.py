@@ -43,3 +43,251 @@ def test_cover_letter_filename_includes_lang(sample_cv, monkeypatch):
         monkeypatch.setattr(cover_module, "OUTPUT_DIR", Path(tmpdir))
         output = _build_cover_letter_docx(sample_cv, letter, "de", Theme())
         assert "DE" in output.name
+
+
+def test_cover_letter_batch_writes_one_letter_per_description(sample_cv, monkeypatch, tmp_path):
+    """--batch generates a separately named letter for every job description in a directory."""
+    import yaml
+
+    cover_module = sys.modules["resumake.cover_letter"]
+    out_dir = tmp_path / "out"
+    monkeypatch.setattr("resumake.utils.OUTPUT_DIR", out_dir)
+    monkeypatch.setattr(cover_module, "OUTPUT_DIR", out_dir)
+    monkeypatch.setattr(
+        cover_module,
+        "_generate_cover_letter",
+        lambda cv, text, lang="en", use_cache=True: {"recipient": "Acme", "body": text},
+    )
+
+    jobs = tmp_path / "jobs"
+    jobs.mkdir()
+    (jobs / "Acme Backend.txt").write_text("Backend role", encoding="utf-8")
+    (jobs / "beta.md").write_text("Frontend role", encoding="utf-8")
+    (jobs / "empty.txt").write_text("", encoding="utf-8")
+    source = tmp_path / "cv.yaml"
+    source.write_text(yaml.dump(sample_cv), encoding="utf-8")
+
+    cover_module._cover_letter_batch(jobs, "en", source, False, None, True)
+    names = sorted(p.name for p in out_dir.glob("*.docx"))
+    assert names == ["Jane_Doe_Cover_Letter_EN_acme_backend.docx", "Jane_Doe_Cover_Letter_EN_beta.docx"]
+
+
+def test_cover_letter_batch_converts_pdfs_on_calling_thread(sample_cv, monkeypatch, tmp_path):
+    """DOCX-to-PDF engines (Word over COM) only work on the thread that set them up, so PDFs aren't made in the pool."""
+    import threading
+
+    import yaml
+
+    cover_module = sys.modules["resumake.cover_letter"]
+    out_dir = tmp_path / "out"
+    monkeypatch.setattr(cover_module, "OUTPUT_DIR", out_dir)
+    monkeypatch.setattr(
+        cover_module,
+        "_generate_cover_letter",
+        lambda cv, text, lang="en", use_cache=True: {"recipient": "Acme", "body": text},
+    )
+    pdf_threads = []
+
+    def fake_pdf(cv, letter, theme, docx_path):
+        pdf_threads.append(threading.current_thread())
+        return docx_path.with_suffix(".pdf")
+
+    monkeypatch.setattr(cover_module, "_build_cover_letter_pdf", fake_pdf)
+    jobs = tmp_path / "jobs"
+    jobs.mkdir()
+    for name in ("a", "b", "c"):
+        (jobs / f"{name}.txt").write_text(f"Role {name}", encoding="utf-8")
+    source = tmp_path / "cv.yaml"
+    source.write_text(yaml.dump(sample_cv), encoding="utf-8")
+
+    cover_module._cover_letter_batch(jobs, "en", source, True, None, True)
+    assert pdf_threads == [threading.current_thread()] * 3
+
+
+def test_batch_slugs_do_not_collide():
+    from resumake.cover_letter import _batch_slugs
+
+    files = [Path("acme.md"), Path("acme.txt"), Path("Acme.txt"), Path("beta.txt")]
+    assert _batch_slugs(files) == {
+        Path("acme.md"): "acme",
+        Path("acme.txt"): "acme_txt",
+        Path("Acme.txt"): "acme_txt_2",
+        Path("beta.txt"): "beta",
+    }
+
+
+def test_prune_cv_for_prompt_drops_unused_fields(sample_cv):
+    from resumake.cover_letter import _prune_cv_for_prompt
+
+    pruned = _prune_cv_for_prompt(sample_cv)
+    assert pruned["name"] == sample_cv["name"]
+    assert "photo" not in pruned
+    assert "contact" not in pruned
+    assert "links" not in pruned
+    assert set(pruned["education"][0]) <= {"degree", "institution"}
+
+
+def test_parse_cover_letter_validates_structure():
+    import pytest
+
+    from resumake.cover_letter import _parse_cover_letter
+
+    fenced = '```json\n{"recipient": "Acme", "opening": "Hi", "body": "B", "closing": "C"}\n```'
+    letter = _parse_cover_letter(fenced)
+    assert letter["recipient"] == "Acme"
+    assert letter["subject"] == ""
+    with pytest.raises(ValueError):
+        _parse_cover_letter('{"recipient": "Acme"}')
+    with pytest.raises(ValueError):
+        _parse_cover_letter("Sorry, I cannot help with that.")
+
+
+def test_cover_letter_template_is_reused_per_font(sample_cv, monkeypatch, tmp_path):
+    """Letters start from a cached, pre-styled template; each build gets its own copy."""
+    from docx import Document
+
+    from resumake.cover_letter import _cover_letter_template
+
+    monkeypatch.setattr(sys.modules["resumake.cover_letter"], "OUTPUT_DIR", tmp_path)
+    theme = Theme()
+    letter = {"opening": "Hello.", "body": "Body.", "closing": "Bye."}
+    first = Document(_build_cover_letter_docx(sample_cv, letter, "en", theme))
+    second = Document(_build_cover_letter_docx(sample_cv, letter, "de", theme))
+
+    assert _cover_letter_template(theme.fonts.body) is _cover_letter_template(theme.fonts.body)
+    assert first.styles["Normal"].font.name == theme.fonts.body
+    assert round(first.sections[0].left_margin.cm, 2) == 2.5
+    assert len(second.paragraphs) == len(first.paragraphs)
+
+
+def test_cover_letter_escapes_text_and_keeps_line_breaks(sample_cv, monkeypatch, tmp_path):
+    """Letter text is XML-escaped and newlines become line breaks within the paragraph."""
+    from docx import Document
+
+    monkeypatch.setattr(sys.modules["resumake.cover_letter"], "OUTPUT_DIR", tmp_path)
+    letter = {"recipient": "R&D <Team>", "opening": "First line\nSecond line", "body": "B", "closing": "C"}
+    doc = Document(_build_cover_letter_docx(sample_cv, letter, "en", Theme()))
+    texts = [p.text for p in doc.paragraphs]
+    assert "Dear R&D <Team>," in texts
+    assert "First line\nSecond line" in texts
+    assert doc.paragraphs[-1].runs[0].bold
+
+
+def test_cover_letter_html_mirrors_letter(sample_cv):
+    """The HTML used for in-process PDF output carries the letter text, escaped, and theme styling."""
+    from resumake.cover_letter import _cover_letter_html
+
+    theme = Theme()
+    letter = {"recipient": "R&D", "subject": "Role", "opening": "One\nTwo", "body": "B", "closing": "C"}
+    html = _cover_letter_html(sample_cv, letter, theme)
+    assert "Dear R&amp;D," in html
+    assert "Re: Role" in html
+    assert "One<br>Two" in html
+    assert f"#{theme.colors.primary}" in html
+
+
+def test_cover_letter_pdf_renders_from_html(sample_cv, monkeypatch, tmp_path):
+    """PDF output goes through WeasyPrint with the letter HTML instead of converting the .docx."""
+    from resumake.config import ResumakeConfig
+
+    cover_module = sys.modules["resumake.cover_letter"]
+    calls = []
+    monkeypatch.setattr(cover_module, "load_config", lambda: ResumakeConfig())
+    monkeypatch.setattr(
+        cover_module,
+        "convert_to_pdf_auto",
+        lambda path, engine, html_content: calls.append((engine, html_content)) or path.with_suffix(".pdf"),
+    )
+    letter = {"opening": "Hello.", "body": "Body.", "closing": "Bye."}
+    pdf_path = cover_module._build_cover_letter_pdf(sample_cv, letter, Theme(), tmp_path / "letter.docx")
+    assert pdf_path == tmp_path / "letter.pdf"
+    assert calls[0][0] == "auto"
+    assert "Hello." in calls[0][1]
+
+
+def test_distill_description_keeps_salient_sections():
+    """Long job descriptions are cut down to the intro and requirement-style sections."""
+    from resumake.cover_letter import _distill_description
+
+    text = "\n".join(
+        [
+            "Acme is hiring a Senior Engineer.",
+            "",
+            "About us:",
+            "We were founded in 1999. " * 40,
+            "## Responsibilities",
+            "- Build services",
+            "Requirements:",
+            "- 5 years of Python",
+            "Benefits:",
+            "- Free snacks " * 40,
+        ]
+    )
+    distilled = _distill_description(text, max_chars=500)
+    assert distilled.splitlines() == [
+        "Acme is hiring a Senior Engineer.",
+        "## Responsibilities",
+        "- Build services",
+        "Requirements:",
+        "- 5 years of Python",
+    ]
+    assert _distill_description("Short job ad.") == "Short job ad."
+
+
+def test_distill_description_caps_unstructured_text():
+    from resumake.cover_letter import _distill_description
+
+    text = "\n".join(f"Line {i} of a long posting without headings." for i in range(200))
+    distilled = _distill_description(text, max_chars=300)
+    assert len(distilled) <= 300
+    assert distilled.startswith("Line 0 ")
+
+
+def test_cover_letter_opens_docx_while_pdf_renders(sample_cv, monkeypatch, tmp_path):
+    """With --pdf, the .docx is opened while the PDF is still being rendered in the background."""
+    import threading
+
+    import yaml
+
+    cover_module = sys.modules["resumake.cover_letter"]
+    monkeypatch.setattr(cover_module, "OUTPUT_DIR", tmp_path / "out")
+    monkeypatch.setattr(
+        cover_module,
+        "_generate_cover_letter",
+        lambda cv, text, lang="en", use_cache=True: {"opening": "Hi.", "body": text, "closing": "Bye."},
+    )
+    docx_opened = threading.Event()
+    opened = []
+
+    def fake_open(path):
+        opened.append(path.suffix)
+        docx_opened.set()
+
+    def fake_pdf(cv, letter, theme, docx_path):
+        assert docx_opened.wait(timeout=5), "PDF rendering blocked opening the .docx"
+        return docx_path.with_suffix(".pdf")
+
+    monkeypatch.setattr(cover_module, "open_file", fake_open)
+    monkeypatch.setattr(cover_module, "_build_cover_letter_pdf", fake_pdf)
+    job = tmp_path / "job.txt"
+    job.write_text("Backend role", encoding="utf-8")
+    source = tmp_path / "cv.yaml"
+    source.write_text(yaml.dump(sample_cv), encoding="utf-8")
+
+    cover_module.cover_letter(job, lang="en", source=source, pdf=True, open=True, theme=None)
+    assert opened == [".docx", ".pdf"]
+
+
+def test_run_xml_breaks_match_python_docx():
+    """Carriage returns become breaks exactly as python-docx's add_run() renders them."""
+    from docx import Document
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+
+    from resumake.cover_letter import _run_xml
+
+    text = "Dear team,\r\nline two\rline three\n\tindented"
+    ours = parse_xml(f"<w:p {nsdecls('w')}>{_run_xml(text, '')}</w:p>")[0]
+    theirs = Document().add_paragraph().add_run(text)._r
+    assert [child.tag for child in ours] == [child.tag for child in theirs]
+    assert [child.text for child in ours] == [child.text for child in theirs]
@@ -38,3 +38,92 @@ def test_flatten_deeply_nested():
     data = {"a": {"b": {"c": "value"}}}
     result = _flatten(data)
     assert result["a.b.c"] == "value"
+
+
+def test_flatten_keeps_document_order_and_handles_deep_nesting():
+    data = {"b": {"y": 1, "x": 2}, "a": [{"name": "N", "k": "v"}, "s"]}
+    assert list(_flatten(data)) == ["b.y", "b.x", "a[N].name", "a[N].k", "a[1]"]
+
+    deep = node = {}
+    for _ in range(5000):  # deeper than the default recursion limit
+        node["n"] = {}
+        node = node["n"]
+    node["leaf"] = "x"
+    assert list(_flatten(deep).values()) == ["x"]
+
+
+def test_diff_entries_single_pass_in_key_order():
+    from resumake.diff_cmd import _diff_entries
+
+    a = {"name": "Jane", "skills[1]": "b", "title": "Dev"}
+    b = {"name": "Jane", "profile": "Hi", "title": "Senior Dev"}
+    assert list(_diff_entries(a, b)) == [
+        ("added", "profile", None, "Hi"),
+        ("removed", "skills[1]", "b", None),
+        ("changed", "title", "Dev", "Senior Dev"),
+    ]
+    assert list(_diff_entries(a, a)) == []
+
+
+def test_flatten_changed_skips_equal_subtrees():
+    from resumake.diff_cmd import _diff_entries, _flatten_changed
+
+    a = {
+        "name": "Jane",
+        "contact": {"email": "a@x.io", "phone": "1"},
+        "experience": [{"title": "Dev", "org": "A"}],
+        "skills": {"tech": ["Python"], "soft": ["Talking"]},
+    }
+    b = {
+        "name": "Jane",
+        "contact": {"email": "b@x.io", "phone": "1"},
+        "experience": [{"title": "Dev", "org": "A"}],
+        "skills": {"tech": ["Python", "Rust"], "soft": ["Talking"]},
+        "profile": "Hi",
+    }
+    flat_a, flat_b = _flatten_changed(a, b)
+    assert flat_a == {"contact.email": "a@x.io", "skills.tech[0]": "Python"}
+    assert flat_b == {
+        "contact.email": "b@x.io",
+        "skills.tech[0]": "Python",
+        "skills.tech[1]": "Rust",
+        "profile": "Hi",
+    }
+    assert list(_diff_entries(flat_a, flat_b)) == list(_diff_entries(_flatten(a), _flatten(b)))
+
+
+def test_flatten_changed_reports_type_only_changes():
+    from resumake.diff_cmd import _diff_entries, _flatten_changed
+
+    a = {"remote": True, "years": 1, "meta": {"tags": [1, "x"]}, "same": {"n": 2}}
+    b = {"remote": 1, "years": 1.0, "meta": {"tags": [True, "x"]}, "same": {"n": 2}}
+    flat_a, flat_b = _flatten_changed(a, b)
+    assert list(_diff_entries(flat_a, flat_b)) == [
+        ("changed", "meta.tags[0]", "1", "True"),
+        ("changed", "remote", "True", "1"),
+        ("changed", "years", "1", "1.0"),
+    ]
+    assert "same.n" not in flat_a
+
+
+def test_diff_reuses_parsed_yaml(tmp_path, monkeypatch, capsys):
+    """A repeated diff reads both files from the parse cache, with YAML dates kept as dates."""
+    import yaml
+
+    from resumake.diff_cmd import diff
+
+    a = tmp_path / "a.yaml"
+    b = tmp_path / "b.yaml"
+    a.write_text("name: Jane\nupdated: 2024-01-02\n", encoding="utf-8")
+    b.write_text("name: Jane\nupdated: 2024-03-04\n", encoding="utf-8")
+    diff(a, b)
+    first = capsys.readouterr().out
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("YAML should not be reparsed")
+
+    with monkeypatch.context() as m:
+        m.setattr(yaml, "load", no_parse)
+        diff(a, b)
+    assert capsys.readouterr().out == first
+    assert "2024-01-02" in first and "2024-03-04" in first
@@ -109,3 +109,52 @@ def test_cv_to_plaintext_custom_sections(sample_cv):
     txt = _cv_to_plaintext(sample_cv)
     assert "AWARDS" in txt
     assert "Best Paper" in txt
+
+
+def test_cv_to_html_elements():
+    """Headings, date lines and bullet lists are emitted directly, with CV values escaped."""
+    cv = {
+        "name": "Jane <Dev>",
+        "title": "R&D",
+        "links": [{"label": '"Site"', "url": "https://example.com/?a=1&b=2"}],
+        "experience": [
+            {"title": "Eng", "org": "Acme", "start": "2020", "end": "2024", "bullets": ["Built <things>", "Shipped"]}
+        ],
+    }
+    html = _cv_to_html(cv)
+    assert "<h1>Jane &lt;Dev&gt;</h1>" in html
+    assert "<title>Jane &lt;Dev&gt; — CV</title>" in html
+    assert "<p><strong>R&amp;D</strong></p>" in html
+    assert '<a href="https://example.com/?a=1&amp;b=2">&quot;Site&quot;</a>' in html
+    assert "<h3>Eng — Acme</h3>\n<p><em>2020 — 2024</em></p>" in html
+    assert "<ul>\n<li>Built &lt;things&gt;</li>\n<li>Shipped</li>\n</ul>" in html
+
+
+def test_cv_to_html_renders_inline_markdown():
+    """Emphasis and links written as markdown in free-text fields become HTML, after escaping."""
+    cv = {
+        "name": "Jane",
+        "title": "Dev",
+        "profile": "I build *reliable* systems with **Python** & <care>.",
+        "experience": [
+            {"title": "Eng", "start": "2020", "end": "2024", "bullets": ["Wrote [docs](https://docs.example.com)"]}
+        ],
+    }
+    html = _cv_to_html(cv)
+    assert "<p>I build <em>reliable</em> systems with <strong>Python</strong> &amp; &lt;care&gt;.</p>" in html
+    assert '<li>Wrote <a href="https://docs.example.com">docs</a></li>' in html
+
+
+def test_export_writes_utf8_with_lf_endings(sample_cv, tmp_path):
+    import yaml
+
+    from resumake.export_cmd import export
+
+    sample_cv["title"] = "Développeuse"
+    source = tmp_path / "cv.yaml"
+    source.write_text(yaml.dump(sample_cv, allow_unicode=True), encoding="utf-8")
+    out = tmp_path / "cv.md"
+    export("md", source=source, output=out, open=False)
+    data = out.read_bytes()
+    assert "Développeuse".encode() in data
+    assert b"\r\n" not in data
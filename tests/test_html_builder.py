@@ -100,3 +100,101 @@ def test_build_html_featured_publication_not_duplicated(sample_cv):
     html = build_html(sample_cv, "en", theme=Theme())
     # Rendered once in the featured block, not again in a regular Publications section
     assert html.count("Featured Book") == 1
+
+
+def test_build_css_cached_per_theme_values():
+    from resumake.html_builder import _build_css, _cached_css
+
+    theme = Theme()
+    first = _build_css(theme)
+    hits = _cached_css.cache_info().hits
+    assert _build_css(Theme()) is first
+    assert _cached_css.cache_info().hits == hits + 1
+
+    # Themes are mutable; an edited theme must not reuse the stale CSS
+    theme.colors.primary = "123456"
+    assert "#123456" in _build_css(theme)
+
+
+def test_rerender_reuses_escaped_strings(sample_cv):
+    from resumake.utils import escape_html
+
+    first = build_html(sample_cv, "en", theme=Theme())
+    misses = escape_html.cache_info().misses
+    assert build_html(sample_cv, "en", theme=Theme()) == first
+    assert escape_html.cache_info().misses == misses
+
+
+def test_encode_photo_base64_roundtrip(monkeypatch):
+    import base64
+
+    from resumake import html_builder
+    from resumake.utils import resolve_asset
+
+    expected = resolve_asset("icon_publications.png").read_bytes()
+    url = html_builder._encode_photo_base64("icon_publications.png")
+    assert base64.b64decode(url.split(",", 1)[1]) == expected
+
+    monkeypatch.setattr(html_builder, "pybase64", None)
+    assert html_builder._encode_photo_base64("icon_publications.png") == url
+
+
+def test_encode_large_photo_from_mmap(tmp_path, monkeypatch):
+    import base64
+
+    from resumake import html_builder
+
+    photo = tmp_path / "big.jpg"
+    photo.write_bytes(bytes(range(256)) * 1024)  # 256 KB, above the mmap threshold
+    monkeypatch.setattr("resumake.utils.ASSETS_DIR", tmp_path)
+    url = html_builder._encode_photo_base64("big.jpg")
+    assert url.startswith("data:image/jpeg;base64,")
+    assert base64.b64decode(url.split(",", 1)[1]) == photo.read_bytes()
+
+
+def test_photo_encoding_cached_until_file_changes(tmp_path, monkeypatch):
+    import os
+
+    from resumake import html_builder
+
+    photo = tmp_path / "me.png"
+    photo.write_bytes(b"first")
+    monkeypatch.setattr("resumake.utils.ASSETS_DIR", tmp_path)
+    html_builder._encode_file_cached.cache_clear()
+    first = html_builder._encode_photo_base64("me.png")
+    assert html_builder._encode_photo_base64("me.png") == first
+    assert html_builder._encode_file_cached.cache_info().hits == 1
+
+    photo.write_bytes(b"second")
+    st = photo.stat()
+    os.utime(photo, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert html_builder._encode_photo_base64("me.png") != first
+
+
+def test_labels_loaded_and_escaped_once_per_build(sample_cv, monkeypatch):
+    from resumake import html_builder
+    from resumake.utils import LABELS
+
+    calls = []
+
+    def fake_labels(lang):
+        calls.append(lang)
+        return {**LABELS["en"], "experience": "R&D"}
+
+    monkeypatch.setattr(html_builder, "get_labels", fake_labels)
+    html = build_html(sample_cv, lang="xx")
+    assert calls == ["xx"]
+    assert "R&amp;D" in html
+
+
+def test_build_html_to_stream_matches_build_html(sample_cv):
+    import io
+
+    from resumake.html_builder import build_html_to
+
+    for layout in ("two-column", "single-column"):
+        theme = Theme()
+        theme.layout.layout_type = layout
+        out = io.StringIO()
+        build_html_to(sample_cv, "en", out, theme=theme)
+        assert out.getvalue() == build_html(sample_cv, "en", theme=theme)
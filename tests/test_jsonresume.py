@@ -88,3 +88,19 @@ def test_validation_missing_name():
 def test_validation_valid():
     issues = validate_json_resume({"basics": {"name": "Jane"}})
     assert issues == []
+
+
+def test_reverse_mapping_merges_uncategorized_skills():
+    technical = ["Python"]
+    jr = {
+        "basics": {"name": "Jane Doe"},
+        "skills": [
+            {"name": "Technical", "keywords": technical},
+            {"name": "Cloud", "keywords": ["AWS"]},
+            {"name": "Leadership", "keywords": ["Mentoring"]},
+        ],
+    }
+    cv = json_resume_to_cv(jr)
+    assert cv["skills"]["technical"] == ["Python", "AWS"]
+    assert cv["skills"]["leadership"] == ["Mentoring"]
+    assert technical == ["Python"]
@@ -1,15 +1,18 @@
 """Tests for LinkedIn PDF import."""
 
+import sys
+import types
+
 import pytest
 
 
 def test_extract_linkedin_text_import_error(tmp_path, monkeypatch):
-    """Should raise SystemExit if pdfplumber is not installed."""
+    """Should raise SystemExit if neither PyMuPDF nor pdfplumber is installed."""
     original_import = __builtins__.__import__ if hasattr(__builtins__, "__import__") else __import__
 
     def mock_import(name, *args, **kwargs):
-        if name == "pdfplumber":
-            raise ImportError("No module named 'pdfplumber'")
+        if name in ("pymupdf", "pdfplumber"):
+            raise ImportError(f"No module named '{name}'")
         return original_import(name, *args, **kwargs)
 
     monkeypatch.setattr("builtins.__import__", mock_import)
@@ -19,6 +22,63 @@ def test_extract_linkedin_text_import_error(tmp_path, monkeypatch):
         extract_linkedin_text(tmp_path / "profile.pdf")
 
 
+class _FakePage:
+    def __init__(self, n, flushed):
+        self.n = n
+        self.flushed = flushed
+
+    def extract_text(self):
+        return f"page {self.n}" if self.n != 1 else None
+
+    def flush_cache(self):
+        self.flushed.append(self.n)
+
+
+def _fake_pdfplumber(n_pages, flushed, opened):
+    class FakePDF:
+        def __init__(self, path):
+            opened.append(path)
+            self.pages = [_FakePage(i, flushed) for i in range(n_pages)]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    return types.SimpleNamespace(open=FakePDF)
+
+
+def test_extract_linkedin_text_releases_pages(tmp_path, monkeypatch):
+    """With pdfplumber, each page's parsed objects are flushed once its text is extracted."""
+    flushed, opened = [], []
+    monkeypatch.setitem(sys.modules, "pymupdf", None)
+    monkeypatch.setitem(sys.modules, "pdfplumber", _fake_pdfplumber(3, flushed, opened))
+    from resumake.linkedin import extract_linkedin_text
+
+    assert extract_linkedin_text(tmp_path / "profile.pdf") == "page 0\n\npage 2"
+    assert flushed == [0, 1, 2]
+    assert len(opened) == 1
+
+
+def test_extract_linkedin_text_splits_long_pdfs(tmp_path, monkeypatch):
+    """Long PDFs are extracted in contiguous page ranges by a worker pool, keeping page order."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from resumake import linkedin
+
+    flushed, opened = [], []
+    monkeypatch.setitem(sys.modules, "pymupdf", None)
+    monkeypatch.setitem(sys.modules, "pdfplumber", _fake_pdfplumber(20, flushed, opened))
+    monkeypatch.setattr(linkedin, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(linkedin.os, "cpu_count", lambda: 4)
+
+    text = linkedin.extract_linkedin_text(tmp_path / "profile.pdf")
+    assert text.split("\n\n") == [f"page {i}" for i in range(20) if i != 1]
+    assert sorted(flushed) == list(range(20))
+    assert len(opened) == 1 + 4  # page count, then one open per worker chunk
+
+
 def test_linkedin_to_cv_no_provider(monkeypatch):
     """Should raise SystemExit if no LLM provider is available."""
     monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
@@ -27,3 +87,125 @@ def test_linkedin_to_cv_no_provider(monkeypatch):
 
     with pytest.raises(SystemExit):
         linkedin_to_cv("Jane Doe\nSoftware Engineer\nBerlin")
+
+
+_LINKEDIN_TEXT = """Contact
+jane@example.com
+Top Skills
+Python
+Jane Doe
+Software Engineer
+Berlin
+Summary
+Builds things.
+Experience
+Acme
+Engineer
+2020 - Present
+Education
+TU Berlin
+BSc Computer Science
+"""
+
+
+def test_split_sections():
+    from resumake.linkedin import _split_sections
+
+    sections = _split_sections(_LINKEDIN_TEXT)
+    assert list(sections) == ["profile", "experience", "education"]
+    assert "jane@example.com" in sections["profile"] and "Builds things." in sections["profile"]
+    assert sections["experience"].startswith("Experience\nAcme")
+    assert "TU Berlin" in sections["education"] and "Acme" not in sections["education"]
+
+
+# Standard "Save to PDF" order: the sidebar ends with Certifications, then the main column opens with the name
+_SIDEBAR_FIRST_TEXT = """Contact
+jane@example.com
+Top Skills
+Python
+Certifications
+AWS Solutions Architect
+Jane Doe
+Senior Engineer at Acme
+Berlin
+Summary
+Builds things.
+Experience
+Acme
+Engineer
+2020 - Present
+"""
+
+
+def test_split_sections_keeps_name_after_sidebar_in_profile():
+    from resumake.linkedin import _split_sections
+
+    sections = _split_sections(_SIDEBAR_FIRST_TEXT)
+    assert list(sections) == ["profile", "certifications", "experience"]
+    assert "Jane Doe\nSenior Engineer at Acme\nBerlin" in sections["profile"]
+    assert "Builds things." in sections["profile"]
+    assert "AWS Solutions Architect" in sections["certifications"]
+    assert "Builds things." not in sections["certifications"]
+
+
+def test_linkedin_to_cv_sidebar_first_export_keeps_name(monkeypatch):
+    from resumake import linkedin
+
+    class MockProvider:
+        def complete(self, prompt, max_tokens=4096):
+            if "keys (omit any that don't apply): certifications" in prompt:
+                return "certifications:\n  - name: AWS Solutions Architect"
+            if "keys (omit any that don't apply): experience" in prompt:
+                return "experience:\n  - title: Engineer\n    org: Acme"
+            name = "Jane Doe" if "Jane Doe" in prompt else None
+            return f"name: {name}\ntitle: Senior Engineer"
+
+    monkeypatch.setattr("resumake.llm.get_provider", lambda: MockProvider())
+    cv = linkedin.linkedin_to_cv(_SIDEBAR_FIRST_TEXT)
+    assert cv["name"] == "Jane Doe"
+    assert cv["certifications"] == [{"name": "AWS Solutions Architect"}]
+    assert cv["experience"] == [{"title": "Engineer", "org": "Acme"}]
+
+
+def test_linkedin_to_cv_structures_sections_separately(monkeypatch):
+    """Each section gets its own scoped prompt and the replies are merged into one CV."""
+    from resumake import linkedin
+
+    prompts = []
+
+    class MockProvider:
+        def complete(self, prompt, max_tokens=4096):
+            prompts.append((prompt, max_tokens))
+            if "TU Berlin" in prompt:
+                return "education:\n  - degree: BSc\n    institution: TU Berlin"
+            if "Acme" in prompt:
+                return "experience:\n  - title: Engineer\n    org: Acme\n    start: '2020'"
+            return "name: Jane Doe\ntitle: Software Engineer"
+
+    monkeypatch.setattr("resumake.llm.get_provider", lambda: MockProvider())
+    cv = linkedin.linkedin_to_cv(_LINKEDIN_TEXT)
+
+    assert cv == {
+        "name": "Jane Doe",
+        "title": "Software Engineer",
+        "experience": [{"title": "Engineer", "org": "Acme", "start": "2020"}],
+        "education": [{"degree": "BSc", "institution": "TU Berlin"}],
+    }
+    assert len(prompts) == 3
+    assert sorted(tokens for _, tokens in prompts) == [2048, 2048, 4096]
+    assert sum("STAR" in prompt for prompt, _ in prompts) == 1
+
+
+def test_linkedin_to_cv_without_headings_uses_one_prompt(monkeypatch):
+    from resumake import linkedin
+
+    prompts = []
+
+    class MockProvider:
+        def complete(self, prompt, max_tokens=4096):
+            prompts.append(max_tokens)
+            return "name: Jane Doe"
+
+    monkeypatch.setattr("resumake.llm.get_provider", lambda: MockProvider())
+    assert linkedin.linkedin_to_cv("Jane Doe\nSoftware Engineer\nBerlin") == {"name": "Jane Doe"}
+    assert prompts == [8192]
@@ -2,6 +2,7 @@
 
 import io
 import threading
+import time
 
 from resumake.live_server import LiveReloadHandler
 
@@ -86,9 +87,9 @@ def test_sse_content_type(sample_cv, tmp_path):
     handler = _make_handler(cv_file, "/events")
 
     # Start SSE in a thread and cancel quickly
-    from resumake.live_server import _reload_event
+    from resumake.live_server import notify_reload
 
-    _reload_event.set()
+    notify_reload()
 
     def run_sse():
         try:
@@ -101,3 +102,97 @@ def test_sse_content_type(sample_cv, tmp_path):
     t.join(timeout=0.5)
 
     assert handler._headers.get("Content-Type") == "text/event-stream"
+
+
+def test_reload_reaches_every_sse_client(tmp_path):
+    """A single reload notification is delivered to all open event streams."""
+    from resumake.live_server import notify_reload
+
+    handlers = [_make_handler(tmp_path / "cv.yaml", "/events") for _ in range(2)]
+    for handler in handlers:
+        threading.Thread(target=handler._handle_sse, daemon=True).start()
+
+    def all_reloaded():
+        return all(b"data: reload" in h.wfile.getvalue() for h in handlers)
+
+    deadline = time.time() + 2
+    while not all_reloaded() and time.time() < deadline:
+        notify_reload()
+        time.sleep(0.01)
+    assert all_reloaded()
+
+
+def test_sse_sends_keepalive_when_idle(tmp_path, monkeypatch):
+    """Idle streams get periodic comment lines instead of silence."""
+    monkeypatch.setattr("resumake.live_server.SSE_KEEPALIVE_SECONDS", 0.01)
+    handler = _make_handler(tmp_path / "cv.yaml", "/events")
+    threading.Thread(target=handler._handle_sse, daemon=True).start()
+
+    deadline = time.time() + 2
+    while b": ping" not in handler.wfile.getvalue() and time.time() < deadline:
+        time.sleep(0.01)
+    assert b": ping" in handler.wfile.getvalue()
+
+
+def test_page_cached_until_cv_changes(sample_cv, tmp_path, monkeypatch):
+    """Repeat page loads reuse the rendered HTML; editing the CV rebuilds it."""
+    import os
+
+    import yaml
+
+    from resumake import live_server
+
+    builds = []
+    real_build_html = live_server.build_html
+    monkeypatch.setattr(live_server, "build_html", lambda *a, **kw: builds.append(1) or real_build_html(*a, **kw))
+    cv_file = tmp_path / "cv.yaml"
+    cv_file.write_text(yaml.dump(sample_cv))
+
+    for _ in range(2):
+        _make_handler(cv_file, "/")._handle_page()
+    assert len(builds) == 1
+
+    sample_cv["name"] = "Janet Doe"
+    cv_file.write_text(yaml.dump(sample_cv))
+    st = cv_file.stat()
+    os.utime(cv_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    handler = _make_handler(cv_file, "/")
+    handler._handle_page()
+    assert len(builds) == 2
+    assert "Janet Doe" in handler.wfile.getvalue().decode()
+
+
+def test_page_rebuilt_when_photo_changes(sample_cv, tmp_path, monkeypatch):
+    """Replacing the photo, or adding a user override for it, rebuilds the cached page."""
+    import os
+
+    import yaml
+
+    from resumake import live_server
+
+    monkeypatch.setattr("resumake.utils.ASSETS_DIR", tmp_path / "assets")
+    monkeypatch.setattr("resumake.utils.BASE_DIR", tmp_path)
+    monkeypatch.setattr("resumake.utils.BUILTIN_ASSETS_DIR", tmp_path / "builtin")
+    (tmp_path / "builtin").mkdir()
+    (tmp_path / "builtin" / "me.png").write_bytes(b"builtin")
+    builds = []
+    real_build_html = live_server.build_html
+    monkeypatch.setattr(live_server, "build_html", lambda *a, **kw: builds.append(1) or real_build_html(*a, **kw))
+    sample_cv["photo"] = "me.png"
+    cv_file = tmp_path / "cv.yaml"
+    cv_file.write_text(yaml.dump(sample_cv))
+
+    for _ in range(2):
+        _make_handler(cv_file, "/")._handle_page()
+    assert len(builds) == 1
+
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "me.png").write_bytes(b"override")
+    _make_handler(cv_file, "/")._handle_page()
+    assert len(builds) == 2
+
+    (tmp_path / "assets" / "me.png").write_bytes(b"edited override")
+    st = (tmp_path / "assets" / "me.png").stat()
+    os.utime(tmp_path / "assets" / "me.png", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    _make_handler(cv_file, "/")._handle_page()
+    assert len(builds) == 3
@@ -22,6 +22,12 @@ def test_strip_yaml_fences_strips_whitespace():
     assert strip_yaml_fences(text) == "name: Jane"
 
 
+def test_strip_yaml_fences_json_and_unclosed():
+    assert strip_yaml_fences('```json\n{"a": 1}\n```') == '{"a": 1}'
+    # A truncated response may open a fence without closing it
+    assert strip_yaml_fences("```yaml\nname: Jane") == "name: Jane"
+
+
 def test_get_provider_no_keys(monkeypatch):
     """get_provider raises RuntimeError when no API keys are set."""
     import pytest
@@ -32,3 +38,103 @@ def test_get_provider_no_keys(monkeypatch):
 
     with pytest.raises(RuntimeError, match="No LLM provider configured"):
         get_provider()
+
+
+def test_get_provider_reused_until_env_changes(monkeypatch):
+    """Repeated get_provider() calls share one provider (and SDK client) while the keys stay the same."""
+    from resumake import llm
+
+    class FakeProvider:
+        def __init__(self, api_key, **kwargs):
+            self.api_key = api_key
+
+    monkeypatch.setattr(llm, "AnthropicProvider", FakeProvider)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    llm._provider_for.cache_clear()
+    try:
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "key-1")
+        first = llm.get_provider()
+        assert llm.get_provider() is first
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "key-2")
+        assert llm.get_provider().api_key == "key-2"
+    finally:
+        llm._provider_for.cache_clear()
+
+
+def _fake_client(captured, reply):
+    """Build a stand-in SDK client that records create() kwargs and returns a canned reply."""
+
+    class _Endpoint:
+        def create(self, **kwargs):
+            captured.update(kwargs)
+            return reply
+
+    client = type("Client", (), {})()
+    client.messages = _Endpoint()
+    client.chat = type("Chat", (), {"completions": _Endpoint()})()
+    return client
+
+
+def test_anthropic_forwards_system_blocks():
+    """System blocks (with cache_control) are passed through as the system parameter."""
+    from types import SimpleNamespace
+
+    from resumake.llm import AnthropicProvider, cached_block
+
+    captured = {}
+    reply = SimpleNamespace(content=[SimpleNamespace(text=" ok ")], usage=None)
+    provider = AnthropicProvider.__new__(AnthropicProvider)
+    provider.client = _fake_client(captured, reply)
+    provider.model = "claude-test"
+
+    blocks = [{"type": "text", "text": "Instructions"}, cached_block("CV: ...")]
+    assert provider.complete("Job", system_blocks=blocks) == "ok"
+    assert captured["system"] == blocks
+    assert captured["system"][1]["cache_control"] == {"type": "ephemeral"}
+    assert captured["messages"] == [{"role": "user", "content": "Job"}]
+
+
+def test_openai_flattens_system_blocks():
+    """OpenAI gets system blocks as a single leading system message."""
+    from types import SimpleNamespace
+
+    from resumake.llm import OpenAIProvider, cached_block
+
+    captured = {}
+    reply = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))])
+    provider = OpenAIProvider.__new__(OpenAIProvider)
+    provider.client = _fake_client(captured, reply)
+    provider.model = "gpt-test"
+
+    provider.complete("Job", system_blocks=[{"type": "text", "text": "A"}, cached_block("B")])
+    assert captured["messages"][0] == {"role": "system", "content": "A\n\nB"}
+    assert captured["messages"][1] == {"role": "user", "content": "Job"}
+
+
+def test_openai_stream_yields_deltas():
+    """Streaming requests stream=True and yields only non-empty content deltas."""
+    from types import SimpleNamespace
+
+    from resumake.llm import OpenAIProvider
+
+    def chunk(text):
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+    captured = {}
+    provider = OpenAIProvider.__new__(OpenAIProvider)
+    provider.client = _fake_client(captured, [chunk("Hel"), chunk(None), chunk("lo")])
+    provider.model = "gpt-test"
+
+    assert "".join(provider.stream("Hi")) == "Hello"
+    assert captured["stream"] is True
+
+
+def test_default_stream_falls_back_to_complete():
+    """Providers without a streaming API yield the full completion as one chunk."""
+    from resumake.llm import LLMProvider
+
+    class Plain(LLMProvider):
+        def complete(self, prompt, max_tokens=4096, system_blocks=None):
+            return f"echo: {prompt}"
+
+    assert list(Plain().stream("hi")) == ["echo: hi"]
@@ -0,0 +1,202 @@
+"""Tests for the on-disk LLM response cache."""
+
+import json
+import time
+
+from resumake import llm_cache
+
+
+class _Provider:
+    model = "test-model"
+
+
+def test_put_then_get_roundtrip():
+    key = llm_cache.make_key("prompt")
+    assert llm_cache.get(key) is None
+    llm_cache.put(key, "response")
+    assert llm_cache.get(key) == "response"
+
+
+def test_request_key_depends_on_model_and_tokens():
+    provider = _Provider()
+    base = llm_cache.request_key(provider, "prompt", 4096)
+    assert llm_cache.request_key(provider, "prompt", 2048) != base
+    provider.model = "other-model"
+    assert llm_cache.request_key(provider, "prompt", 4096) != base
+
+
+def test_expired_entry_is_ignored():
+    key = llm_cache.make_key("old")
+    llm_cache.put(key, "stale", ttl=10)
+    path = llm_cache.CACHE_DIR / key[:2] / f"{key}.json"
+    entry = json.loads(path.read_text())
+    entry["ts"] = time.time() - 60
+    path.write_text(json.dumps(entry))
+    assert llm_cache.get(key) is None
+
+
+def test_non_object_entry_is_a_miss():
+    key = llm_cache.make_key("corrupt")
+    llm_cache.put(key, "response")
+    path = llm_cache.CACHE_DIR / key[:2] / f"{key}.json"
+    for body in ("[]", '"x"', "null"):
+        path.write_text(body)
+        assert llm_cache.get(key) is None
+
+
+def test_no_cache_env_disables(monkeypatch):
+    monkeypatch.setenv("RESUMAKE_NO_CACHE", "1")
+    key = llm_cache.make_key("prompt")
+    llm_cache.put(key, "response")
+    assert llm_cache.get(key) is None
+    assert not llm_cache.CACHE_DIR.exists()
+
+
+def test_ats_uses_cached_response(monkeypatch):
+    """A second identical ATS analysis is served from the cache without calling the provider."""
+    from resumake.ats_cmd import analyze_ats_match
+
+    calls = []
+
+    class MockProvider:
+        model = "mock"
+
+        def complete(self, prompt, max_tokens=4096, system_blocks=None):
+            calls.append(prompt)
+            return json.dumps({"score": 50, "matched_keywords": [], "missing_keywords": []})
+
+    monkeypatch.setattr("resumake.llm.get_provider", lambda: MockProvider())
+    first = analyze_ats_match({"name": "Jane"}, "Python developer")
+    second = analyze_ats_match({"name": "Jane"}, "Python developer")
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_find_similar_matches_near_duplicate_only():
+    text = "We are hiring a senior Python developer to build data pipelines on AWS with a small team."
+    key = llm_cache.make_key("job")
+    llm_cache.put(key, "letter")
+    llm_cache.remember_similar("ns", text, key)
+
+    assert llm_cache.find_similar("ns", text.upper() + "  ") == (text, "letter")
+    assert llm_cache.find_similar("ns", "Frontend engineer wanted for React and TypeScript work.") is None
+    assert llm_cache.find_similar("other-ns", text) is None
+
+
+def test_remember_similar_keeps_every_concurrent_entry():
+    from concurrent.futures import ThreadPoolExecutor
+
+    def remember(i):
+        llm_cache.remember_similar("ns", f"job description number {i}", f"key{i}")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(remember, range(20)))
+    assert sorted(e["key"] for e in llm_cache._load_index("ns")) == sorted(f"key{i}" for i in range(20))
+    assert not list(llm_cache._index_path("ns").parent.glob("*.tmp"))
+
+
+def test_cover_letter_cached_and_no_cache_bypasses(monkeypatch, sample_cv):
+    """Same job description hits the cache; use_cache=False always calls the provider."""
+    from resumake import cover_letter
+
+    calls = []
+
+    class MockProvider:
+        model = "mock"
+
+        def complete(self, prompt, max_tokens=4096, system_blocks=None):
+            calls.append(prompt)
+            return json.dumps(
+                {"recipient": "Acme", "subject": "Role", "opening": "Hi", "body": "Text", "closing": "Bye"}
+            )
+
+    monkeypatch.setattr(cover_letter, "get_provider", lambda: MockProvider())
+    job = "Acme is looking for a backend engineer with Python and Postgres experience."
+    first = cover_letter._generate_cover_letter(sample_cv, job)
+    second = cover_letter._generate_cover_letter(sample_cv, job + "\n")
+    assert first == second
+    assert len(calls) == 1
+
+    cover_letter._generate_cover_letter(sample_cv, job, use_cache=False)
+    assert len(calls) == 2
+
+
+def test_cover_letter_near_duplicate_for_other_company_is_regenerated(monkeypatch, sample_cv):
+    """A near-identical ad from a different employer must not get the other employer's letter."""
+    from resumake import cover_letter
+
+    calls = []
+
+    class MockProvider:
+        model = "mock"
+
+        def complete(self, prompt, max_tokens=4096, system_blocks=None):
+            company = "Acme" if "Acme" in prompt else "Globex"
+            calls.append(company)
+            return json.dumps(
+                {"recipient": company, "subject": "Role", "opening": f"Dear {company}", "body": "B", "closing": "C"}
+            )
+
+    monkeypatch.setattr(cover_letter, "get_provider", lambda: MockProvider())
+    duties = " ".join(f"You will own service number {i} and keep its pipelines healthy." for i in range(25))
+    acme_job = f"Acme is hiring a backend engineer. {duties}"
+    # Differ only in the employer: ~0.98 shingle similarity, above NEAR_DUP_THRESHOLD
+    globex_job = f"Globex is hiring a backend engineer. {duties}"
+
+    assert cover_letter._generate_cover_letter(sample_cv, acme_job)["recipient"] == "Acme"
+    assert cover_letter._generate_cover_letter(sample_cv, globex_job)["recipient"] == "Globex"
+    assert cover_letter._generate_cover_letter(sample_cv, acme_job + "\n")["recipient"] == "Acme"
+    assert calls == ["Acme", "Globex"]
+
+
+def test_suggest_caches_only_parseable_responses(monkeypatch):
+    """Suggestions are served from the cache on repeat; an unparseable response is not cached."""
+    from resumake.suggest_cmd import suggest_improvements
+
+    responses = ["not json", json.dumps({"suggestions": [], "general": ["Add metrics"]})]
+    calls = []
+
+    class MockProvider:
+        model = "mock"
+
+        def complete(self, prompt, max_tokens=4096, system_blocks=None):
+            calls.append(prompt)
+            return responses[len(calls) - 1]
+
+    monkeypatch.setattr("resumake.llm.get_provider", lambda: MockProvider())
+    monkeypatch.setenv("RESUMAKE_LLM_CACHE", "1")
+    cv = {"name": "Jane", "title": "Dev"}
+    assert suggest_improvements(cv)["general"] == ["Could not parse LLM response. Try again."]
+    assert suggest_improvements(cv)["general"] == ["Add metrics"]
+    assert suggest_improvements(cv)["general"] == ["Add metrics"]
+    assert len(calls) == 2
+
+
+def test_suggest_and_tailor_cache_is_opt_in(monkeypatch):
+    """Without --cache or RESUMAKE_LLM_CACHE=1, every run asks the LLM again."""
+    from resumake import tailor
+    from resumake.suggest_cmd import suggest_improvements
+
+    calls = []
+
+    class MockProvider:
+        model = "mock"
+
+        def complete(self, prompt, max_tokens=4096, system_blocks=None):
+            calls.append(prompt)
+            return json.dumps({"suggestions": [], "general": []}) if "Analyze" in prompt else "name: Jane"
+
+    monkeypatch.delenv("RESUMAKE_LLM_CACHE", raising=False)
+    monkeypatch.setattr("resumake.llm.get_provider", lambda: MockProvider())
+    monkeypatch.setattr(tailor, "get_provider", lambda: MockProvider())
+    cv = {"name": "Jane", "title": "Dev"}
+    for _ in range(2):
+        suggest_improvements(cv)
+        tailor.tailor_cv(cv, "Backend role")
+    assert len(calls) == 4
+
+    calls.clear()
+    for _ in range(2):
+        suggest_improvements(cv, use_cache=True)
+        tailor.tailor_cv(cv, "Backend role", use_cache=True)
+    assert len(calls) == 2
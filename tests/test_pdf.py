@@ -90,6 +90,30 @@ def test_weasyprint_import_error(tmp_path, monkeypatch):
         convert_to_pdf_weasyprint("<html></html>", tmp_path / "out.pdf")
 
 
+def test_weasyprint_downsizes_images(tmp_path, monkeypatch):
+    """PDFs are written with image optimisation so a large photo is resampled to its printed size."""
+    import sys
+    import types
+
+    from resumake import pdf
+
+    calls = []
+
+    class FakeHTML:
+        def __init__(self, string):
+            self.string = string
+
+        def write_pdf(self, target, **options):
+            calls.append((target, options))
+
+    monkeypatch.setitem(sys.modules, "weasyprint", types.SimpleNamespace(HTML=FakeHTML))
+    out = tmp_path / "out.pdf"
+    assert convert_to_pdf_weasyprint("<html></html>", out) == out
+    assert calls == [
+        (out, {"optimize_images": True, "dpi": pdf.PDF_IMAGE_DPI, "jpeg_quality": pdf.PDF_JPEG_QUALITY}),
+    ]
+
+
 def test_docx2pdf_import_error(tmp_path, monkeypatch):
     """docx2pdf raises SystemExit with install instructions when not available."""
     original_import = __builtins__.__import__ if hasattr(__builtins__, "__import__") else __import__
@@ -122,3 +146,74 @@ def test_auto_engine_fallback(tmp_path, monkeypatch):
         convert_to_pdf_auto(tmp_path / "input.docx", engine="auto", html_content="<html></html>")
     # Should have attempted docx2pdf as fallback
     assert "docx2pdf" in calls
+
+
+def test_auto_engine_fallback_is_quiet_without_weasyprint(tmp_path, monkeypatch, capsys):
+    """A missing WeasyPrint is expected in auto mode, so it isn't reported as an error."""
+    from resumake import pdf
+
+    monkeypatch.setattr(pdf, "_weasyprint_html", lambda: None)
+    monkeypatch.setattr(pdf, "convert_docx_to_pdf", lambda path: path.with_suffix(".pdf"))
+    result = convert_to_pdf_auto(tmp_path / "cv.docx", engine="auto", html_content="<html></html>")
+    assert result == tmp_path / "cv.pdf"
+    assert "Error" not in capsys.readouterr().err
+
+
+def test_unoserver_not_reused_on_foreign_port(monkeypatch):
+    """A port held by something that doesn't answer XML-RPC isn't mistaken for a running unoserver."""
+    import http.server
+    import threading
+
+    from resumake import pdf
+
+    class NotRpc(http.server.BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.send_response(404)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(("127.0.0.1", 0), NotRpc)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        port = server.server_address[1]
+        monkeypatch.setattr(pdf, "UNOSERVER_PORT", port)
+        monkeypatch.setattr(pdf.shutil, "which", lambda name: f"/usr/bin/{name}")
+        assert pdf._ensure_unoserver() is False
+        assert pdf._unoserver is None
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_unoserver_skipped_when_not_installed(tmp_path, monkeypatch):
+    """Without unoserver on PATH, DOCX conversion goes straight to docx2pdf."""
+    from resumake import pdf
+
+    monkeypatch.setattr(pdf.shutil, "which", lambda name: None)
+    called = []
+    monkeypatch.setattr(pdf, "convert_to_pdf_docx2pdf", lambda path: called.append(path) or path.with_suffix(".pdf"))
+
+    result = pdf.convert_docx_to_pdf(tmp_path / "cv.docx")
+    assert result == tmp_path / "cv.pdf"
+    assert called == [tmp_path / "cv.docx"]
+    assert pdf._unoserver is None
+
+
+def test_unoserver_engine_uses_unoconvert(tmp_path, monkeypatch):
+    """The unoserver engine sends each file to the shared daemon via unoconvert."""
+    from resumake import pdf
+
+    monkeypatch.setattr(pdf, "_ensure_unoserver", lambda: True)
+    commands = []
+
+    def fake_run(cmd, **kwargs):
+        commands.append(cmd)
+        return type("Result", (), {"returncode": 0, "stderr": ""})()
+
+    monkeypatch.setattr(pdf.subprocess, "run", fake_run)
+    for name in ("a", "b"):
+        pdf.convert_to_pdf_auto(tmp_path / f"{name}.docx", engine="unoserver")
+    assert [c[0] for c in commands] == ["unoconvert", "unoconvert"]
+    assert all(c[1:3] == ["--port", str(pdf.UNOSERVER_PORT)] for c in commands)
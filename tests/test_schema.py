@@ -3,7 +3,8 @@
 import pytest
 from pydantic import ValidationError
 
-from resumake.schema import get_custom_sections, validate_cv
+from resumake.schema import validate_cv
+from resumake.utils import get_custom_sections
 
 
 def test_valid_cv(sample_cv):
@@ -98,3 +99,8 @@ def test_custom_non_list_ignored(sample_cv):
     custom = get_custom_sections(sample_cv)
     assert "awards" in custom
     assert "motto" not in custom
+
+
+def test_non_mapping_cv_is_a_validation_error():
+    with pytest.raises(ValidationError):
+        validate_cv(["not", "a", "mapping"])
@@ -49,3 +49,11 @@ def test_suggest_return_structure():
         assert "general" in result
     finally:
         resumake.llm.get_provider = orig
+
+
+def test_parse_suggestions_handles_surrounding_prose():
+    from resumake.suggest_cmd import _parse_suggestions
+
+    assert _parse_suggestions('{"general": ["ok"]}') == {"general": ["ok"]}
+    assert _parse_suggestions('Here you go:\n{"general": ["ok"]}\nHope it helps.') == {"general": ["ok"]}
+    assert _parse_suggestions("no json here") is None
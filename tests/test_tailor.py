@@ -0,0 +1,24 @@
+"""Tests for tailor command."""
+
+
+def test_tailor_cv_sends_cv_as_cacheable_prefix(sample_cv, monkeypatch):
+    """Instructions and CV go in the system blocks (CV marked cacheable); only the job is in the prompt."""
+    import yaml
+
+    calls = []
+
+    class MockProvider:
+        def complete(self, prompt, max_tokens=4096, system_blocks=None):
+            calls.append((prompt, system_blocks))
+            return yaml.safe_dump(sample_cv)
+
+    import resumake.tailor as tailor_module
+
+    monkeypatch.setattr(tailor_module, "get_provider", lambda: MockProvider())
+
+    assert tailor_module.tailor_cv(sample_cv, "Rust developer wanted") == sample_cv
+    prompt, system_blocks = calls[0]
+    assert prompt == "PROJECT/JOB DESCRIPTION:\nRust developer wanted"
+    assert system_blocks[0]["text"] == tailor_module._TAILOR_INSTRUCTIONS
+    assert system_blocks[1]["cache_control"] == {"type": "ephemeral"}
+    assert system_blocks[1]["text"].startswith("CV YAML:\n")
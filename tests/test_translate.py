@@ -236,3 +236,89 @@ def test_roundtrip_custom_sections(sample_cv):
     result = _merge_translation(sample_cv, t)
     assert result["awards"] == sample_cv["awards"]
     assert result["hobbies"] == sample_cv["hobbies"]
+
+
+def _upper_provider(requests):
+    """Mock provider that 'translates' a JSON array of strings by upper-casing them."""
+    import json
+
+    class MockProvider:
+        def complete(self, prompt, max_tokens=4096, system_blocks=None):
+            batch = json.loads(prompt[prompt.index("[") :])
+            requests.append(batch)
+            return json.dumps([s.upper() for s in batch])
+
+    return MockProvider()
+
+
+def test_translate_reuses_string_cache(sample_cv, monkeypatch, tmp_path):
+    """After an edit, only the changed strings are sent back to the LLM."""
+    import copy
+
+    from resumake.translate import translate_cv
+
+    monkeypatch.setattr("resumake.utils.OUTPUT_DIR", tmp_path)
+    requests = []
+    monkeypatch.setattr("resumake.translate.get_provider", lambda: _upper_provider(requests))
+
+    first = translate_cv(sample_cv, lang="de", retranslate=True)
+    assert first["title"] == sample_cv["title"].upper()
+    assert first["name"] == sample_cv["name"]
+    assert len(requests) >= 1
+
+    edited = copy.deepcopy(sample_cv)
+    edited["profile"] = "A freshly rewritten profile."
+    requests.clear()
+    second = translate_cv(edited, lang="de")
+    assert requests == [["A freshly rewritten profile."]]
+    assert second["profile"] == "A FRESHLY REWRITTEN PROFILE."
+    assert second["title"] == first["title"]
+
+    # retranslate ignores both caches and sends every string again
+    requests.clear()
+    translate_cv(edited, lang="de", retranslate=True)
+    assert "A freshly rewritten profile." in requests[0]
+    assert sum(len(batch) for batch in requests) > 1
+
+
+def test_translate_failed_batch_is_not_cached(sample_cv, monkeypatch, tmp_path):
+    """Strings left in English by a failed batch are retried on the next run instead of being cached."""
+    import json
+
+    from resumake.translate import translate_cv
+
+    monkeypatch.setattr("resumake.utils.OUTPUT_DIR", tmp_path)
+    requests = []
+    healthy = _upper_provider(requests)
+
+    class BrokenProvider:
+        def complete(self, prompt, max_tokens=4096, system_blocks=None):
+            requests.append(json.loads(prompt[prompt.index("[") :]))
+            return "not json"
+
+    monkeypatch.setattr("resumake.translate.get_provider", lambda: BrokenProvider())
+    first = translate_cv(sample_cv, lang="de")
+    assert first["title"] == sample_cv["title"]
+    assert not (tmp_path / ".cv_de_cache.yaml").exists()
+
+    requests.clear()
+    monkeypatch.setattr("resumake.translate.get_provider", lambda: healthy)
+    second = translate_cv(sample_cv, lang="de")
+    assert requests
+    assert second["title"] == sample_cv["title"].upper()
+
+
+def test_translate_en_is_identity(sample_cv):
+    from resumake.translate import translate_cv
+
+    assert translate_cv(sample_cv, lang="en") is sample_cv
+
+
+def test_source_hash_matches_pure_python_dump(sample_cv):
+    """The C-emitter hash is identical to the pure-Python one, so existing translation caches stay valid."""
+    import hashlib
+
+    import yaml
+
+    legacy = yaml.dump(sample_cv, allow_unicode=True, default_flow_style=False, sort_keys=True)
+    assert _source_hash(sample_cv) == hashlib.sha256(legacy.encode()).hexdigest()[:16]
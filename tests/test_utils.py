@@ -1,6 +1,19 @@
 """Tests for utils module."""
 
-from resumake.utils import parse_start_date, slugify_name, validate_photo
+import pytest
+
+from resumake.utils import cv_yaml_cached, escape_html, parse_start_date, slugify, slugify_name, validate_photo
+
+
+def test_escape_html_escapes_only_when_needed():
+    plain = "Senior Engineer"
+    assert escape_html(plain) is plain
+    assert escape_html('a & b <c> "d"') == "a &amp; b &lt;c&gt; &quot;d&quot;"
+
+
+def test_slugify_lowercases_and_truncates():
+    assert slugify("Senior Dev @ ACME, Inc.") == "senior_dev_acme_inc"
+    assert slugify("a" * 50) == "a" * 30
 
 
 def test_slugify_name_simple():
@@ -70,3 +83,126 @@ def test_validate_photo_valid(tmp_path, monkeypatch):
     (tmp_path / "photo.png").write_bytes(b"fake png data")
     warnings = validate_photo("photo.png")
     assert warnings == []
+
+
+def test_cv_yaml_cached_reuses_dump(sample_cv):
+    first = cv_yaml_cached(sample_cv)
+    assert "name: Jane Doe" in first
+    assert cv_yaml_cached(dict(sample_cv)) is first
+
+
+def test_cv_yaml_cached_tracks_content(sample_cv):
+    before = cv_yaml_cached(sample_cv)
+    sample_cv["title"] = "Staff Engineer"
+    after = cv_yaml_cached(sample_cv)
+    assert after != before
+    assert "Staff Engineer" in after
+
+
+def test_cv_yaml_cached_is_thread_safe(sample_cv):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from resumake import utils
+
+    cvs = [{**sample_cv, "title": f"Engineer {i % 10}"} for i in range(200)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        dumps = list(executor.map(cv_yaml_cached, cvs))
+    assert all(f"Engineer {i % 10}" in text for i, text in enumerate(dumps))
+    assert len(utils._CV_YAML_CACHE) <= utils._CV_YAML_CACHE_SIZE
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_helpers_roundtrip(monkeypatch, use_orjson):
+    from resumake import utils
+
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+    elif utils.orjson is None:
+        pytest.skip("orjson not installed")
+    data = {"name": "Jürgen", "items": [1, 2.5, None, True]}
+    text = utils.json_dumps(data)
+    assert "Jürgen" in text
+    assert utils.json_loads(text) == data
+    assert utils.json_loads(text.encode("utf-8")) == data
+    with pytest.raises(ValueError):
+        utils.json_loads("{not json")
+
+
+def test_load_cv_reuses_parsed_yaml_until_file_changes(tmp_path, monkeypatch):
+    import os
+
+    import yaml
+
+    from resumake import utils
+
+    path = tmp_path / "cv.yaml"
+    path.write_text("name: Jane\n", encoding="utf-8")
+    assert utils.load_cv(path, validate=False) == {"name": "Jane"}
+    assert list(utils.YAML_CACHE_DIR.glob("*.pkl"))
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("YAML should not be reparsed")
+
+    with monkeypatch.context() as m:
+        m.setattr(yaml, "load", no_parse)
+        assert utils.load_cv(path, validate=False) == {"name": "Jane"}
+
+    path.write_text("name: Jo\n", encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert utils.load_cv(path, validate=False) == {"name": "Jo"}
+
+
+def test_parse_start_date_is_memoized():
+    parse_start_date.cache_clear()
+    assert parse_start_date("Mar 2021") == parse_start_date("Mar 2021")
+    assert parse_start_date.cache_info().hits == 1
+
+
+def test_resolve_asset_follows_added_and_deleted_files(tmp_path, monkeypatch):
+    from resumake import utils
+
+    monkeypatch.setattr("resumake.utils.ASSETS_DIR", tmp_path)
+    monkeypatch.setattr("resumake.utils.BASE_DIR", tmp_path)
+    monkeypatch.setattr("resumake.utils.BUILTIN_ASSETS_DIR", tmp_path / "builtin")
+    assert utils.resolve_asset("icon.png") is None
+
+    (tmp_path / "icon.png").write_bytes(b"png")
+    assert utils.resolve_asset("icon.png") == tmp_path / "icon.png"
+
+    # A user override added later wins over the built-in copy, and a deleted file is never returned
+    (tmp_path / "builtin").mkdir()
+    (tmp_path / "builtin" / "logo.png").write_bytes(b"png")
+    assert utils.resolve_asset("logo.png") == tmp_path / "builtin" / "logo.png"
+    (tmp_path / "logo.png").write_bytes(b"png")
+    assert utils.resolve_asset("logo.png") == tmp_path / "logo.png"
+    (tmp_path / "icon.png").unlink()
+    assert utils.resolve_asset("icon.png") is None
+
+
+def test_load_cv_validates_unchanged_file_once(sample_cv, tmp_path, monkeypatch):
+    import os
+
+    import yaml
+    from pydantic import ValidationError
+
+    from resumake import schema, utils
+
+    calls = []
+    real_validate = schema.validate_cv
+    monkeypatch.setattr(schema, "validate_cv", lambda data: calls.append(1) or real_validate(data))
+
+    path = tmp_path / "cv.yaml"
+    path.write_text(yaml.dump(sample_cv), encoding="utf-8")
+    utils.load_cv(path)
+    utils.load_cv(path)
+    assert len(calls) == 1
+
+    path.write_text("title: No name\n", encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    with pytest.raises(ValidationError):
+        utils.load_cv(path)
+    with pytest.raises(ValidationError):
+        utils.load_cv(path)
+    assert len(calls) == 3
@@ -213,6 +213,8 @@ class JobDescriptionRequest(BaseModel):
     job_description: str
     lang: str = "en"
     theme: Optional[str] = None
+    # Reuse a cached LLM answer; None keeps each command's CLI default
+    cache: Optional[bool] = None
 
 
 class ImportRequest(BaseModel):
@@ -614,7 +616,7 @@ def tailor_cv_endpoint(request: JobDescriptionRequest):
         tailor_cv = _load_tailor()
 
         cv = load_cv(DEFAULT_YAML, validate=False)
-        tailored = tailor_cv(cv, request.job_description)
+        tailored = tailor_cv(cv, request.job_description, use_cache=request.cache)
         return JSONResponse(content=tailored)
     except SystemExit:
         raise HTTPException(status_code=404, detail="cv.yaml not found.")
@@ -632,7 +634,7 @@ def tailor_build_endpoint(request: JobDescriptionRequest):
         _, _, load_theme = _load_theme_module()
 
         cv = load_cv(DEFAULT_YAML, validate=False)
-        tailored = tailor_cv(cv, request.job_description)
+        tailored = tailor_cv(cv, request.job_description, use_cache=request.cache)
         theme_obj = load_theme(request.theme) if request.theme else load_theme()
         output_path = build_docx(tailored, request.lang, theme=theme_obj)
 
@@ -651,7 +653,9 @@ def cover_letter_endpoint(request: JobDescriptionRequest):
         generate_cover_letter, _ = _load_cover_letter()
 
         cv = load_cv(DEFAULT_YAML, validate=False)
-        letter = generate_cover_letter(cv, request.job_description, lang=request.lang)
+        letter = generate_cover_letter(
+            cv, request.job_description, lang=request.lang, use_cache=request.cache is not False
+        )
         return JSONResponse(content=letter)
     except SystemExit:
         raise HTTPException(status_code=404, detail="cv.yaml not found.")
@@ -668,7 +672,9 @@ def cover_letter_build_endpoint(request: JobDescriptionRequest):
         _, _, load_theme = _load_theme_module()
 
         cv = load_cv(DEFAULT_YAML, validate=False)
-        letter = generate_cover_letter(cv, request.job_description, lang=request.lang)
+        letter = generate_cover_letter(
+            cv, request.job_description, lang=request.lang, use_cache=request.cache is not False
+        )
         theme_obj = load_theme(request.theme) if request.theme else load_theme()
         output_path = build_cover_docx(cv, letter, request.lang, theme_obj)
 
@@ -696,14 +702,14 @@ def ats_endpoint(request: JobDescriptionRequest):
 
 
 @app.post("/api/suggest")
-def suggest_endpoint():
+def suggest_endpoint(cache: Optional[bool] = None):
     """Get AI-powered improvement suggestions for the current CV."""
     try:
         DEFAULT_YAML, load_cv = _load_cv_module()
         suggest_improvements = _load_suggest()
 
         cv = load_cv(DEFAULT_YAML, validate=False)
-        result = suggest_improvements(cv)
+        result = suggest_improvements(cv, use_cache=cache)
         return JSONResponse(content=result)
     except SystemExit:
         raise HTTPException(status_code=404, detail="cv.yaml not found.")
@@ -748,7 +754,7 @@ def bio_build_endpoint(request: BuildRequest = BuildRequest()):
 
 
 @app.post("/api/import")
-async def import_cv_endpoint(file: UploadFile = File(...), fmt: str = "jsonresume"):
+async def import_cv_endpoint(file: UploadFile = File(...), fmt: str = "jsonresume", cache: Optional[bool] = None):
     """Import a CV from an external format (JSON Resume or LinkedIn PDF)."""
     if fmt not in ("jsonresume", "linkedin"):
         raise HTTPException(status_code=400, detail="Format must be 'jsonresume' or 'linkedin'.")
@@ -772,7 +778,7 @@ async def import_cv_endpoint(file: UploadFile = File(...), fmt: str = "jsonresum
                 tmp.write(content)
                 tmp_path = Path(tmp.name)
             try:
-                cv = import_linkedin(tmp_path)
+                cv = import_linkedin(tmp_path, use_cache=cache)
             finally:
                 tmp_path.unlink(missing_ok=True)
 